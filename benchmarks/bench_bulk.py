@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark loading the full dex with load_pokemon_bulk on 1 to N processes
+
+The payloads are encoded up front, as if read from disk, so decoding,
+hydration and shipping the models back are timed. The first line is a
+plain loop with the garbage collector running, the way a script would do
+it without the bulk loader; the last column pauses the collector of the
+calling process too (pause_gc=True).
+
+Usage: bench_bulk.py [max_processes] (default: the number of CPUs)
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from pokeapi_wrapper.bulk import load_pokemon_bulk
+from pokeapi_wrapper.decoding import get_decoder
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+DEX_SIZE = 1025
+MOVES = 80
+ROUNDS = 3
+
+
+def best_of(function):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    max_processes = int(sys.argv[1]) if len(sys.argv) > 1 else cpus
+    payloads = [
+        json.dumps(make_pokemon_payload(pokemon_id, moves=MOVES)).encode("utf-8")
+        for pokemon_id in range(1, DEX_SIZE + 1)
+    ]
+    megabytes = sum(map(len, payloads)) / 1e6
+    print(
+        f"loading {DEX_SIZE} Pokemon ({megabytes:.0f} MB of JSON) on {cpus} CPUs "
+        f"(best of {ROUNDS})"
+    )
+
+    loads = get_decoder()
+    baseline = best_of(lambda: [Pokemon.from_json(loads(p)) for p in payloads])
+    print(f"{'plain loop':<14} {baseline * 1000:8.0f} ms")
+
+    counts = [1]
+    while counts[-1] * 2 <= max_processes:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_processes:
+        counts.append(max_processes)
+
+    single = None
+    for processes in counts:
+        elapsed = best_of(lambda: load_pokemon_bulk(payloads, processes=processes))
+        paused = best_of(
+            lambda: load_pokemon_bulk(payloads, processes=processes, pause_gc=True)
+        )
+        single = single or elapsed
+        print(
+            f"{processes:>2} processes   {elapsed * 1000:8.0f} ms "
+            f"({single / elapsed:.2f}x vs 1 process, "
+            f"{baseline / elapsed:.2f}x vs plain loop), "
+            f"pause_gc {paused * 1000:.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
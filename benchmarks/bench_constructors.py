@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark hydrating the full dex with the old and the schema-compiled
+Pokemon constructors
+
+The payloads are decoded once up front, so only model construction is
+timed. The old constructors are the frozen copy in legacy_models.py.
+"""
+
+import gc
+import sys
+import time
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+import legacy_models
+
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+DEX_SIZE = 1025
+MOVES = 80
+ROUNDS = 5
+
+
+def best_of(function, payloads):
+    # Like timeit, keep the cyclic garbage collector out of the timings
+    gc.disable()
+    try:
+        best = float("inf")
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            for data in payloads:
+                function(data)
+            best = min(best, time.perf_counter() - start)
+        return best
+    finally:
+        gc.enable()
+
+
+def main():
+    payloads = [
+        make_pokemon_payload(pokemon_id, moves=MOVES)
+        for pokemon_id in range(1, DEX_SIZE + 1)
+    ]
+
+    cases = {
+        "old __init__": lambda data: legacy_models.Pokemon(**data),
+        "new __init__": lambda data: Pokemon(**data),
+        "new from_json": Pokemon.from_json,
+        "old __init__, lazy": lambda data: legacy_models.Pokemon(lazy=True, **data),
+        "new from_json, lazy": lambda data: Pokemon.from_json(data, lazy=True),
+    }
+
+    print(f"hydrating {DEX_SIZE} Pokemon with {MOVES} moves each (best of {ROUNDS})")
+    baseline = None
+    for label, function in cases.items():
+        elapsed = best_of(function, payloads)
+        if label.startswith("old"):
+            baseline = elapsed
+        print(
+            f"{label:<22} {elapsed * 1000:8.1f} ms "
+            f"({elapsed / DEX_SIZE * 1e6:6.1f} us/Pokemon, "
+            f"{baseline / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
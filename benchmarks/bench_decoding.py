@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JSON decoding backends on large Pokemon payloads
+
+Compares decoding alone and decoding plus Pokemon hydration for every
+installed backend on generated payloads with full move lists.
+"""
+
+import json
+import sys
+import timeit
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from pokeapi_wrapper.decoding import available_backends, get_decoder
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+ROUNDS = 20
+
+
+def main():
+    payloads = {
+        "pikachu (100 moves)": make_pokemon_payload(25, moves=100, version_groups=8),
+        "mew (380 moves)": make_pokemon_payload(151, moves=380, version_groups=10),
+    }
+    for label, payload in payloads.items():
+        body = json.dumps(payload).encode("utf-8")
+        print(f"{label}: {len(body) / 1024:.0f} KiB")
+        for backend in available_backends():
+            decode = get_decoder(backend)
+            decode_time = min(
+                timeit.repeat(lambda: decode(body), number=ROUNDS, repeat=5)
+            )
+            hydrate_time = min(
+                timeit.repeat(lambda: Pokemon(**decode(body)), number=ROUNDS, repeat=5)
+            )
+            print(
+                f"  {backend:>8}: decode {decode_time / ROUNDS * 1e3:7.2f} ms, "
+                f"decode + hydrate {hydrate_time / ROUNDS * 1e3:7.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
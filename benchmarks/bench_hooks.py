@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark the overhead of the instrumentation hooks on get_pokemon
+
+Compares a client without hooks, with the no-op Hooks base class and with
+a MetricsCollector, on memory cache hits (the cheapest lookup, where any
+overhead shows most) and on full lookups against a local stub server.
+Without hooks the only cost left is a handful of "is not None" checks,
+which is measured on its own.
+"""
+
+import gc
+import sys
+import time
+import timeit
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.cache import ResourceCache
+from pokeapi_wrapper.instrumentation import Hooks, MetricsCollector
+from pokeapi_wrapper.testing import StubServer, make_pokemon_payload
+
+POKEMON = 50
+CACHED_CALLS = 20000
+FETCHED_CALLS = 500
+ROUNDS = 5
+# "hooks is not None" checks on a lookup that sends a request, decodes the
+# body and hydrates a Pokemon: two in _send_once, two in _decode and one
+# in _hydrate
+GUARDS_PER_FETCH = 5
+
+
+def best_of(function, calls):
+    gc.disable()
+    try:
+        best = float("inf")
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            for index in range(calls):
+                function(index % POKEMON + 1)
+            best = min(best, time.perf_counter() - start)
+        return best / calls
+    finally:
+        gc.enable()
+
+
+def main():
+    cases = {"no hooks": None, "no-op Hooks": Hooks(), "MetricsCollector": None}
+    with StubServer() as server:
+        for pokemon_id in range(1, POKEMON + 1):
+            server.add_pokemon(make_pokemon_payload(pokemon_id))
+
+        print(f"memory cache hits, {CACHED_CALLS} calls (best of {ROUNDS})")
+        baseline = None
+        for label, hooks in cases.items():
+            if label == "MetricsCollector":
+                hooks = MetricsCollector()
+            cache = ResourceCache(store="model")
+            with PokeAPI(base_url=server.base_url, cache=cache, hooks=hooks) as api:
+                best_of(api.get_pokemon, POKEMON)
+                per_call = best_of(api.get_pokemon, CACHED_CALLS)
+            baseline = baseline or per_call
+            print(
+                f"  {label:<18} {per_call * 1e6:7.2f} us/call "
+                f"({(per_call / baseline - 1) * 100:+5.1f}%)"
+            )
+        cached_baseline = baseline
+
+        print(f"requests to the stub server, {FETCHED_CALLS} calls (best of {ROUNDS})")
+        baseline = None
+        for label, hooks in cases.items():
+            if label == "MetricsCollector":
+                hooks = MetricsCollector()
+            with PokeAPI(base_url=server.base_url, hooks=hooks) as api:
+                per_call = best_of(api.get_pokemon, FETCHED_CALLS)
+            baseline = baseline or per_call
+            print(
+                f"  {label:<18} {per_call * 1e3:7.3f} ms/call "
+                f"({(per_call / baseline - 1) * 100:+5.1f}%)"
+            )
+
+    check = min(
+        timeit.repeat("if hooks is not None: pass", "hooks = None", number=10**6)
+    )
+    guards = check * 1e-6 * GUARDS_PER_FETCH
+    print(
+        f"hooks off: {GUARDS_PER_FETCH} checks x {check * 1e3:.1f} ns = "
+        f"{guards * 1e9:.0f} ns per fetched lookup "
+        f"({guards / baseline * 100:.4f}% of a fetch, "
+        f"{check * 1e-6 / cached_baseline * 100:.2f}% of a cache hit)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Benchmark eager vs lazy hydration of a Pokemon with a full move list
+
+Uses a generated payload the size of Mew (every move learnable, each with
+many version group entries) and reports construction time and the peak
+memory allocated while building the model.
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+ROUNDS = 50
+
+
+def peak_memory(build):
+    tracemalloc.start()
+    pokemon = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return pokemon, peak
+
+
+def main():
+    mew = make_pokemon_payload(151, "mew", moves=380, version_groups=10)
+    modes = {
+        "eager": lambda: Pokemon(**mew),
+        "lazy": lambda: Pokemon(lazy=True, **mew),
+        "lazy, then read moves": lambda: Pokemon(lazy=True, **mew).moves,
+    }
+
+    print(f"Mew-sized payload: {len(mew['moves'])} moves")
+    for label, build in modes.items():
+        seconds = min(timeit.repeat(build, number=ROUNDS, repeat=5)) / ROUNDS
+        _, peak = peak_memory(build)
+        print(
+            f"{label:>22}: {seconds * 1e6:9.1f} us/object, peak {peak / 1024:8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
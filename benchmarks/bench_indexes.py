@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark learnset and ability queries: linear scans against PokemonIndex
+
+The scans walk every Pokemon's abilities or moves and version group
+details, as code holding the models would; the index answers from its
+sorted ID arrays. Building, saving, loading and updating the index are
+timed too.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from pokeapi_wrapper.indexes import PokemonIndex
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+DEX_SIZE = 1025
+MOVES = 80
+REPEATS = 100
+
+
+def per_call(function):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        function()
+    return (time.perf_counter() - start) / REPEATS
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def scan_learners(dex, move, group):
+    return [
+        p.id
+        for p in dex
+        if any(
+            m.move.name == move
+            and any(d.version_group.name == group for d in m.version_group_details)
+            for m in p.moves
+        )
+    ]
+
+
+def scan_ability(dex, ability, type_name):
+    return [
+        p.id
+        for p in dex
+        if any(a.ability.name == ability for a in p.abilities)
+        and any(t.type.name == type_name for t in p.types)
+    ]
+
+
+def main():
+    payloads = [
+        make_pokemon_payload(pokemon_id, moves=MOVES)
+        for pokemon_id in range(1, DEX_SIZE + 1)
+    ]
+    dex = [Pokemon.from_json(payload) for payload in payloads]
+    index, build = timed(lambda: PokemonIndex(dex))
+    print(f"{DEX_SIZE} Pokemon with {MOVES} moves: {index!r}")
+    print(f"  build {build * 1000:.0f} ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "dex.idx")
+        _, save = timed(lambda: index.save(path))
+        loaded, load = timed(lambda: PokemonIndex.load(path))
+        print(
+            f"  save {save * 1000:.0f} ms, load {load * 1000:.1f} ms, "
+            f"{os.path.getsize(path) / 1e6:.1f} MB on disk"
+        )
+
+    first = dex[0].moves[0]
+    move = first.move.name
+    group = first.version_group_details[0].version_group.name
+    ability = dex[0].abilities[0].ability.name
+    type_name = dex[0].types[0].type.name
+    queries = [
+        (
+            f"learn {move} in {group}",
+            lambda: scan_learners(dex, move, group),
+            lambda: loaded.learners(move, group),
+        ),
+        (
+            f"{ability} and {type_name}",
+            lambda: scan_ability(dex, ability, type_name),
+            lambda: loaded.query(ability=ability, type=type_name),
+        ),
+    ]
+    for label, scan, query in queries:
+        assert list(query()) == scan()
+        scan_time = per_call(scan)
+        query_time = per_call(query)
+        print(
+            f"  {label:<40} scan {scan_time * 1e6:8.0f} us, "
+            f"index {query_time * 1e6:6.1f} us ({scan_time / query_time:.0f}x)"
+        )
+
+    changed = Pokemon.from_json(make_pokemon_payload(25, "renamed", moves=MOVES))
+    _, update = timed(lambda: loaded.update(changed))
+    print(f"  update one Pokemon of the loaded index: {update * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
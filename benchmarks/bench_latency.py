@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark the get_pokemon latency distribution with and without hedging
+
+Runs against a local stub server that answers most requests quickly but
+stalls a small fraction of them, the long tail seen from a busy upstream.
+"""
+
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.hedging import HedgePolicy
+from pokeapi_wrapper.testing import StubServer, make_pokemon_payload
+
+REQUESTS = 1000
+WORKERS = 8
+FAST_DELAY = 0.005
+SLOW_DELAY = 0.25
+SLOW_FRACTION = 0.03
+
+
+def add_long_tail(server, seed=0):
+    respond = server.respond
+    rng = random.Random(seed)
+
+    def respond_with_tail(path, query, headers):
+        slow = rng.random() < SLOW_FRACTION
+        time.sleep(SLOW_DELAY if slow else FAST_DELAY)
+        return respond(path, query, headers)
+
+    server.respond = respond_with_tail
+
+
+def percentile(samples, percent):
+    return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+
+def run(api, identifiers):
+    def timed(identifier):
+        start = time.perf_counter()
+        api.get_pokemon(identifier)
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        return sorted(executor.map(timed, identifiers))
+
+
+def report(label, latencies, requests_sent):
+    print(
+        f"{label:<12} p50 {percentile(latencies, 50) * 1000:6.1f} ms  "
+        f"p95 {percentile(latencies, 95) * 1000:6.1f} ms  "
+        f"p99 {percentile(latencies, 99) * 1000:6.1f} ms  "
+        f"max {latencies[-1] * 1000:6.1f} ms  "
+        f"({requests_sent} requests)"
+    )
+
+
+def main():
+    with StubServer() as server:
+        for pokemon_id in range(1, 51):
+            server.add_pokemon(make_pokemon_payload(pokemon_id))
+        add_long_tail(server)
+        identifiers = [i % 50 + 1 for i in range(REQUESTS)]
+
+        print(
+            f"{REQUESTS} get_pokemon calls over {WORKERS} threads, "
+            f"{SLOW_FRACTION:.0%} of responses delayed by {SLOW_DELAY * 1000:.0f} ms"
+        )
+
+        with PokeAPI(base_url=server.base_url) as api:
+            server.reset_counters()
+            latencies = run(api, identifiers)
+            report("unhedged", latencies, server.request_count)
+
+        policy = HedgePolicy()
+        with PokeAPI(base_url=server.base_url, hedge_policy=policy) as api:
+            server.reset_counters()
+            latencies = run(api, identifiers)
+            report("hedged p95", latencies, server.request_count)
+        stats = policy.stats()
+        print(
+            f"hedges sent: {stats['hedged_requests']}, "
+            f"won: {stats['hedges_won']}, "
+            f"final hedge delay: {stats['delay'] * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
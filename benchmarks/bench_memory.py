@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory held by a fully loaded national dex
+
+Each Pokemon is generated as a JSON fixture, decoded independently (as it
+would be when read from the API or a cache) and hydrated. The benchmark
+reports the memory retained by the decoded JSON alone and by the hydrated
+models once the JSON has been released.
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+DEX_SIZE = 1025
+
+
+def load_fixtures():
+    return [
+        json.dumps(make_pokemon_payload(pokemon_id, moves=80, version_groups=6))
+        for pokemon_id in range(1, DEX_SIZE + 1)
+    ]
+
+
+def retained(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def main():
+    fixtures = load_fixtures()
+    size = sum(len(fixture) for fixture in fixtures)
+    print(f"{DEX_SIZE} Pokemon, {size / 2**20:.1f} MiB of JSON")
+
+    _, json_bytes, elapsed = retained(lambda: [json.loads(f) for f in fixtures])
+    print(f"decoded JSON:     {json_bytes / 2**20:7.1f} MiB ({elapsed:.2f}s)")
+
+    _, model_bytes, elapsed = retained(
+        lambda: [Pokemon(**json.loads(f)) for f in fixtures]
+    )
+    print(f"hydrated models:  {model_bytes / 2**20:7.1f} MiB ({elapsed:.2f}s)")
+    print(f"ratio:            {json_bytes / model_bytes:7.1f}x smaller than JSON")
+
+
+if __name__ == "__main__":
+    main()
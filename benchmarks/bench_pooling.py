@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark sequential get_pokemon throughput with and without connection pooling
+
+Runs against a local stub server. The unpooled client sends every request
+through the module-level ``requests.get``, like the client used to, so each
+call opens a new TCP connection.
+"""
+
+import sys
+import time
+
+import requests
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.testing import StubServer, make_pokemon_payload
+
+REQUESTS = 500
+
+
+class UnpooledSession:
+    """Session stand-in that opens a fresh connection for every request"""
+
+    def get(self, url, **kwargs):
+        return requests.get(url, **kwargs)
+
+    def close(self):
+        pass
+
+
+def run(api, identifiers):
+    start = time.perf_counter()
+    for identifier in identifiers:
+        api.get_pokemon(identifier)
+    return time.perf_counter() - start
+
+
+def main():
+    with StubServer() as server:
+        for pokemon_id in range(1, 51):
+            server.add_pokemon(make_pokemon_payload(pokemon_id))
+        identifiers = [i % 50 + 1 for i in range(REQUESTS)]
+
+        with PokeAPI(base_url=server.base_url) as api:
+            api.session = UnpooledSession()
+            server.reset_counters()
+            unpooled = run(api, identifiers)
+            unpooled_connections = server.connection_count
+
+        with PokeAPI(base_url=server.base_url) as api:
+            server.reset_counters()
+            pooled = run(api, identifiers)
+            pooled_connections = server.connection_count
+
+    print(f"{REQUESTS} sequential get_pokemon calls")
+    print(
+        f"without pooling: {unpooled:.3f}s ({REQUESTS / unpooled:.0f} req/s, "
+        f"{unpooled_connections} connections)"
+    )
+    print(
+        f"with pooling:    {pooled:.3f}s ({REQUESTS / pooled:.0f} req/s, "
+        f"{pooled_connections} connections)"
+    )
+    print(f"speedup: {unpooled / pooled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark opening the dex from a binary snapshot against loading JSON
+
+Cold start is the time from nothing to the first Pokemon being usable:
+reading, decoding and hydrating a JSON dump of the dex, against opening
+the snapshot and looking one Pokemon up. Each is run in a fresh
+interpreter. Lookups then read a Pokemon's name, stats and types, and
+then its moves as well, which a view decodes into models on each lookup.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from pokeapi_wrapper.decoding import get_decoder
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.snapshot import Snapshot, write_snapshot
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+DEX_SIZE = 1025
+MOVES = 80
+ROUNDS = 5
+LOOKUPS = 20_000
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+JSON_START = """
+import sys, time
+start = time.perf_counter()
+from pokeapi_wrapper.decoding import get_decoder
+from pokeapi_wrapper.models.pokemon import Pokemon
+with open(sys.argv[1], "rb") as f:
+    payloads = get_decoder()(f.read())
+dex = {p["id"]: Pokemon.from_json(p) for p in payloads}
+dex[25].stats
+print(time.perf_counter() - start)
+"""
+
+SNAPSHOT_START = """
+import sys, time
+start = time.perf_counter()
+from pokeapi_wrapper.snapshot import Snapshot
+snapshot = Snapshot(sys.argv[1])
+snapshot.get(25).stats
+print(time.perf_counter() - start)
+"""
+
+
+def cold_start(script, path):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        output = subprocess.run(
+            [sys.executable, "-c", script, path],
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        best = min(best, float(output))
+    return best
+
+
+def summary(pokemon):
+    return pokemon.name, pokemon.stats, pokemon.types
+
+
+def with_moves(pokemon):
+    return pokemon.name, pokemon.stats, pokemon.types, pokemon.moves
+
+
+def lookups(get, identifiers, read):
+    start = time.perf_counter()
+    for identifier in identifiers:
+        read(get(identifier))
+    return (time.perf_counter() - start) / len(identifiers) * 1e6
+
+
+def main():
+    payloads = [
+        make_pokemon_payload(pokemon_id, moves=MOVES)
+        for pokemon_id in range(1, DEX_SIZE + 1)
+    ]
+    dex = [Pokemon.from_json(payload) for payload in payloads]
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "dex.json")
+        snapshot_path = os.path.join(directory, "dex.snap")
+        with open(json_path, "w") as f:
+            json.dump(payloads, f)
+        write_snapshot(dex, snapshot_path)
+        print(
+            f"{DEX_SIZE} Pokemon with {MOVES} moves each: "
+            f"JSON {os.path.getsize(json_path) / 1e6:.1f} MB, "
+            f"snapshot {os.path.getsize(snapshot_path) / 1e6:.1f} MB"
+        )
+
+        print(f"cold start (best of {ROUNDS}, fresh interpreter each)")
+        json_start = cold_start(JSON_START, json_path)
+        snapshot_start = cold_start(SNAPSHOT_START, snapshot_path)
+        print(f"  {'json load':<22} {json_start * 1000:8.1f} ms")
+        print(
+            f"  {'snapshot open':<22} {snapshot_start * 1000:8.1f} ms "
+            f"({json_start / snapshot_start:.0f}x faster)"
+        )
+
+        with open(json_path, "rb") as f:
+            loaded = get_decoder()(f.read())
+        by_id = {p["id"]: Pokemon.from_json(p) for p in loaded}
+        by_name = {pokemon.name: pokemon for pokemon in by_id.values()}
+        ids = [(i * 7919) % DEX_SIZE + 1 for i in range(LOOKUPS)]
+        names = [f"pokemon-{pokemon_id}" for pokemon_id in ids]
+
+        print(f"lookups, us each ({LOOKUPS} each)  name/stats/types  + moves")
+        with Snapshot(snapshot_path) as snapshot:
+            for label, get, keys in (
+                ("dict of models by id", by_id.get, ids),
+                ("dict of models by name", by_name.get, names),
+                ("snapshot by id", snapshot.get, ids),
+                ("snapshot by name", snapshot.get, names),
+            ):
+                print(
+                    f"  {label:<26} {lookups(get, keys, summary):12.2f}"
+                    f"  {lookups(get, keys, with_moves):8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
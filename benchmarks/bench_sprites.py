@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark rendering a 150-Pokemon ASCII sprite gallery
+
+Runs against a local stub server serving generated sprites. The uncached
+run downloads and decodes every sprite on each render, like
+get_ascii_sprite used to; the cached runs go through a SpriteCache, first
+cold with a parallel prefetch and then warm.
+"""
+
+import sys
+import tempfile
+import time
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from ascii_magic import AsciiArt
+
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.sprites import SpriteCache, prefetch_sprites
+from pokeapi_wrapper.testing import StubServer, make_pokemon_payload, make_sprite_png
+
+GALLERY = 150
+WIDTH = 40
+
+
+def render_uncached(team):
+    for pokemon in team:
+        AsciiArt.from_url(pokemon.get_sprite_url())._img_to_art(columns=WIDTH)
+
+
+def render_cached(team, cache):
+    for pokemon in team:
+        pokemon.render_ascii_sprite(width=WIDTH, cache=cache)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    with StubServer() as server, tempfile.TemporaryDirectory() as directory:
+        root = server.root_url + "sprites"
+        team = []
+        for pokemon_id in range(1, GALLERY + 1):
+            server.add_file(f"sprites/{pokemon_id}.png", make_sprite_png(pokemon_id))
+            team.append(Pokemon(**make_pokemon_payload(pokemon_id, sprite_root=root)))
+
+        uncached = timed(render_uncached, team)
+
+        cache = SpriteCache(directory)
+        server.reset_counters()
+        prefetch = timed(prefetch_sprites, team, False, False, 16, cache)
+        cold = timed(render_cached, team, cache)
+        warm = timed(render_cached, team, cache)
+        downloads = server.request_count
+
+        restarted = SpriteCache(directory)
+        from_disk = timed(render_cached, team, restarted)
+
+    print(f"{GALLERY}-Pokemon gallery at {WIDTH} columns")
+    print(f"uncached:                {uncached * 1000:8.1f} ms")
+    print(f"parallel prefetch:       {prefetch * 1000:8.1f} ms ({downloads} downloads)")
+    print(f"cached, first render:    {cold * 1000:8.1f} ms")
+    print(f"cached, repeat render:   {warm * 1000:8.1f} ms")
+    print(f"new process, disk cache: {from_disk * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark stat queries over the full dex: Python loops against PokemonTable
+
+Each query is written the way an analytics script would loop over Pokemon
+models, then as the equivalent PokemonTable call. Building the table is
+timed too, since it is paid once per dex load.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.table import PokemonTable
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+DEX_SIZE = 1025
+REPEATS = 200
+
+
+def per_call(function):
+    function()
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        function()
+    return (time.perf_counter() - start) / REPEATS
+
+
+def stat(pokemon, name):
+    for s in pokemon.stats:
+        if s.stat.name == name:
+            return s.base_stat
+    return 0
+
+
+def bst(pokemon):
+    return sum(s.base_stat for s in pokemon.stats)
+
+
+def fast_fire_loop(dex):
+    found = [
+        p
+        for p in dex
+        if any(t.type.name == "fire" for t in p.types) and stat(p, "speed") > 100
+    ]
+    return sorted(found, key=bst, reverse=True)[:10]
+
+
+def main():
+    dex = [
+        Pokemon.from_json(make_pokemon_payload(pokemon_id, moves=0))
+        for pokemon_id in range(1, DEX_SIZE + 1)
+    ]
+    start = time.perf_counter()
+    table = PokemonTable(dex)
+    print(
+        f"building a table of {DEX_SIZE} Pokemon: "
+        f"{(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+
+    queries = [
+        (
+            "fire, speed > 100, top 10 bst",
+            lambda: fast_fire_loop(dex),
+            lambda: table.where(type="fire", speed__gt=100).top_k("bst", 10),
+        ),
+        (
+            "top 10 bst",
+            lambda: sorted(dex, key=bst, reverse=True)[:10],
+            lambda: table.top_k("bst", 10),
+        ),
+        (
+            "sort by weight",
+            lambda: sorted(dex, key=lambda p: p.weight),
+            lambda: table.sort("weight"),
+        ),
+        (
+            "speed percentiles",
+            lambda: np.percentile([stat(p, "speed") for p in dex], [25, 50, 75]),
+            lambda: table.percentile("speed", [25, 50, 75]),
+        ),
+    ]
+    print(f"{'query':<32} {'loop':>10} {'table':>10}")
+    for label, loop, vectorized in queries:
+        loop_time = per_call(loop)
+        table_time = per_call(vectorized)
+        print(
+            f"{label:<32} {loop_time * 1e6:8.0f} us {table_time * 1e6:8.0f} us "
+            f"({loop_time / table_time:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
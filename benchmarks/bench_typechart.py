@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark type matchups over the full dex: nested loops against TypeChart
+
+The loops compare damage relations the way code holding only the Type
+models would, name by name; the chart answers the same questions with
+NumPy operations on its multiplier matrix.
+"""
+
+import sys
+import time
+from itertools import combinations
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.models.type import Type
+from pokeapi_wrapper.testing import make_pokemon_payload, make_type_payload
+from pokeapi_wrapper.typechart import TypeChart
+
+DEX_SIZE = 1025
+COVERAGE_SIZE = 4
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def loop_multiplier(attacking, defending):
+    relations = attacking.damage_relations
+    result = 1.0
+    for name in defending:
+        if any(ref.name == name for ref in relations.no_damage_to):
+            result *= 0.0
+        elif any(ref.name == name for ref in relations.half_damage_to):
+            result *= 0.5
+        elif any(ref.name == name for ref in relations.double_damage_to):
+            result *= 2.0
+    return result
+
+
+def loop_against(types, dex):
+    defending = [[t.type.name for t in p.types] for p in dex]
+    return [[loop_multiplier(t, names) for names in defending] for t in types]
+
+
+def loop_best_coverage(types, dex, size):
+    hits = [[m > 1 for m in row] for row in loop_against(types, dex)]
+    best, best_count = None, -1
+    for group in combinations(range(len(types)), size):
+        count = sum(any(hits[a][d] for a in group) for d in range(len(dex)))
+        if count > best_count:
+            best, best_count = group, count
+    return [types[a].name for a in best], best_count
+
+
+def main():
+    types = [Type.from_json(make_type_payload(type_id)) for type_id in range(1, 19)]
+    dex = [
+        Pokemon.from_json(make_pokemon_payload(pokemon_id, moves=0))
+        for pokemon_id in range(1, DEX_SIZE + 1)
+    ]
+    chart, build = timed(lambda: TypeChart(types))
+    print(f"building the 18x18 chart: {build * 1000:.2f} ms")
+
+    _, loops = timed(lambda: loop_against(types, dex))
+    _, vectorized = timed(lambda: chart.against(dex))
+    print(
+        f"18 attacking types x {DEX_SIZE} Pokemon: loops {loops * 1000:.1f} ms, "
+        f"chart {vectorized * 1000:.2f} ms ({loops / vectorized:.0f}x)"
+    )
+
+    team = dex[:6]
+    _, loops = timed(lambda: loop_against(types, team))
+    _, vectorized = timed(lambda: chart.against(team))
+    print(
+        f"18 attacking types x team of 6: loops {loops * 1e6:.0f} us, "
+        f"chart {vectorized * 1e6:.0f} us ({loops / vectorized:.0f}x)"
+    )
+
+    expected, loops = timed(lambda: loop_best_coverage(types, dex, COVERAGE_SIZE))
+    result, vectorized = timed(lambda: chart.best_coverage(dex, COVERAGE_SIZE))
+    assert tuple(result) == tuple(expected)
+    print(
+        f"best {COVERAGE_SIZE}-type coverage of {DEX_SIZE} Pokemon: "
+        f"loops {loops * 1000:.0f} ms, chart {vectorized * 1000:.1f} ms "
+        f"({loops / vectorized:.0f}x) -> {', '.join(result[0])} "
+        f"covers {result[1]}"
+    )
+
+
+if __name__ == "__main__":
+    main()
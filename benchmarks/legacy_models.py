@@ -0,0 +1,384 @@
+"""
+Frozen copy of the hand-written Pokemon constructors
+
+These are the models as they were before they were generated from schemas,
+kept only so bench_constructors.py can compare the two. Do not use them
+elsewhere.
+"""
+
+import sys
+
+sys.path.append("..")  # this is including the parent directory in the path
+
+from pokeapi_wrapper.models.base import VersionGameIndex, intern_resource
+
+
+class PokemonAbility:
+    """Pokemon ability model"""
+
+    __slots__ = ("is_hidden", "slot", "ability")
+
+    def __init__(self, is_hidden=False, slot=None, ability=None, **kwargs):
+        self.is_hidden = is_hidden
+        self.slot = slot
+        self.ability = intern_resource(ability)
+
+
+class PokemonType:
+    """Pokemon type model"""
+
+    __slots__ = ("slot", "type")
+
+    def __init__(self, slot=None, type=None, **kwargs):
+        self.slot = slot
+        self.type = intern_resource(type)
+
+
+class PokemonHeldItemVersion:
+    """Pokemon held item version model"""
+
+    __slots__ = ("version", "rarity")
+
+    def __init__(self, version=None, rarity=None, **kwargs):
+        self.version = intern_resource(version)
+        self.rarity = rarity
+
+
+class PokemonHeldItem:
+    """Pokemon held item model"""
+
+    __slots__ = ("item", "version_details")
+
+    def __init__(self, item=None, version_details=None, **kwargs):
+        self.item = intern_resource(item)
+        self.version_details = version_details or []
+
+
+class PokemonMoveVersion:
+    """Pokemon move version model"""
+
+    __slots__ = ("move_learn_method", "version_group", "level_learned_at")
+
+    def __init__(
+        self,
+        move_learn_method=None,
+        version_group=None,
+        level_learned_at=None,
+        **kwargs,
+    ):
+        self.move_learn_method = intern_resource(move_learn_method)
+        self.version_group = intern_resource(version_group)
+        self.level_learned_at = level_learned_at
+
+
+class PokemonMove:
+    """Pokemon move model"""
+
+    __slots__ = ("move", "version_group_details")
+
+    def __init__(self, move=None, version_group_details=None, **kwargs):
+        self.move = intern_resource(move)
+        self.version_group_details = version_group_details or []
+
+
+class PokemonStat:
+    """Pokemon stat model"""
+
+    __slots__ = ("stat", "effort", "base_stat")
+
+    def __init__(self, stat=None, effort=None, base_stat=None, **kwargs):
+        self.stat = intern_resource(stat)
+        self.effort = effort
+        self.base_stat = base_stat
+
+
+class PokemonSprites:
+    """Pokemon sprites model"""
+
+    __slots__ = (
+        "front_default",
+        "front_shiny",
+        "front_female",
+        "front_shiny_female",
+        "back_default",
+        "back_shiny",
+        "back_female",
+        "back_shiny_female",
+        "other",
+        "versions",
+    )
+
+    def __init__(
+        self,
+        front_default=None,
+        front_shiny=None,
+        front_female=None,
+        front_shiny_female=None,
+        back_default=None,
+        back_shiny=None,
+        back_female=None,
+        back_shiny_female=None,
+        other=None,
+        versions=None,
+        **kwargs,
+    ):
+        self.front_default = front_default
+        self.front_shiny = front_shiny
+        self.front_female = front_female
+        self.front_shiny_female = front_shiny_female
+        self.back_default = back_default
+        self.back_shiny = back_shiny
+        self.back_female = back_female
+        self.back_shiny_female = back_shiny_female
+        self.other = other or {}
+        self.versions = versions or {}
+
+
+class PokemonTypePast:
+    """Pokemon type past model"""
+
+    __slots__ = ("generation", "types")
+
+    def __init__(self, generation=None, types=None, **kwargs):
+        self.generation = intern_resource(generation)
+        self.types = types or []
+
+
+def _build_moves(moves):
+    processed_moves = []
+    for move_data in moves:
+        if isinstance(move_data, dict):
+            move_copy = dict(move_data)
+            if (
+                "version_group_details" in move_copy
+                and move_copy["version_group_details"]
+            ):
+                move_copy["version_group_details"] = [
+                    PokemonMoveVersion(**detail)
+                    for detail in move_copy["version_group_details"]
+                ]
+            processed_moves.append(PokemonMove(**move_copy))
+        else:
+            processed_moves.append(move_data)
+    return processed_moves
+
+
+def _build_held_items(held_items):
+    processed_held_items = []
+    for item_data in held_items:
+        if isinstance(item_data, dict):
+            item_copy = dict(item_data)
+            if "version_details" in item_copy and item_copy["version_details"]:
+                item_copy["version_details"] = [
+                    PokemonHeldItemVersion(**detail)
+                    for detail in item_copy["version_details"]
+                ]
+            processed_held_items.append(PokemonHeldItem(**item_copy))
+        else:
+            processed_held_items.append(item_data)
+    return processed_held_items
+
+
+def _build_game_indices(game_indices):
+    return [
+        VersionGameIndex(**index) if isinstance(index, dict) else index
+        for index in game_indices
+    ]
+
+
+def _build_past_types(past_types):
+    processed_past_types = []
+    for past_type_data in past_types:
+        if isinstance(past_type_data, dict):
+            past_type_copy = dict(past_type_data)
+            if "types" in past_type_copy:
+                past_type_copy["types"] = [
+                    PokemonType(**t) for t in past_type_copy["types"]
+                ]
+            processed_past_types.append(PokemonTypePast(**past_type_copy))
+        else:
+            processed_past_types.append(past_type_data)
+    return processed_past_types
+
+
+class _Unhydrated:
+    """Raw JSON of a lazy field that has not been read yet"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+
+class _LazyField:
+    """
+    Descriptor that hydrates a raw JSON list the first time it is read
+
+    The value lives in a private slot named after the field. Once
+    hydrated, the models replace the raw JSON so later reads are plain
+    attribute lookups. Concurrent first reads may both hydrate; the
+    results are equivalent and the last one wins.
+    """
+
+    def __init__(self, build):
+        self.build = build
+
+    def __set_name__(self, owner, name):
+        self.storage = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self.storage)
+        if type(value) is _Unhydrated:
+            value = self.build(value.data)
+            setattr(instance, self.storage, value)
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.storage, value)
+
+
+class Pokemon:
+    """
+    Pokemon model
+
+    With lazy=True the heavy list fields (moves, held_items, game_indices
+    and past_types) keep their raw JSON and only build their model objects
+    the first time they are accessed.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "base_experience",
+        "height",
+        "is_default",
+        "order",
+        "weight",
+        "abilities",
+        "forms",
+        "location_area_encounters",
+        "sprites",
+        "species",
+        "stats",
+        "types",
+        "_moves",
+        "_held_items",
+        "_game_indices",
+        "_past_types",
+    )
+
+    # Public attributes, as accepted by field projections
+    FIELDS = frozenset(
+        (
+            "id",
+            "name",
+            "base_experience",
+            "height",
+            "is_default",
+            "order",
+            "weight",
+            "abilities",
+            "forms",
+            "game_indices",
+            "held_items",
+            "location_area_encounters",
+            "moves",
+            "past_types",
+            "sprites",
+            "species",
+            "stats",
+            "types",
+        )
+    )
+
+    moves = _LazyField(_build_moves)
+    held_items = _LazyField(_build_held_items)
+    game_indices = _LazyField(_build_game_indices)
+    past_types = _LazyField(_build_past_types)
+
+    def __init__(
+        self,
+        id=None,
+        name=None,
+        base_experience=None,
+        height=None,
+        is_default=False,
+        order=None,
+        weight=None,
+        abilities=None,
+        forms=None,
+        game_indices=None,
+        held_items=None,
+        location_area_encounters=None,
+        moves=None,
+        past_types=None,
+        sprites=None,
+        species=None,
+        stats=None,
+        types=None,
+        lazy=False,
+        **kwargs,
+    ):
+        # Process nested objects before assigning to attributes
+        if abilities is not None:
+            abilities = (
+                [PokemonAbility(**ability) for ability in abilities]
+                if isinstance(abilities[0], dict)
+                else abilities
+            )
+
+        if types is not None:
+            types = (
+                [PokemonType(**type_data) for type_data in types]
+                if isinstance(types[0], dict)
+                else types
+            )
+
+        if stats is not None:
+            stats = (
+                [PokemonStat(**stat) for stat in stats]
+                if isinstance(stats[0], dict)
+                else stats
+            )
+
+        if sprites is not None and isinstance(sprites, dict):
+            sprites = PokemonSprites(**sprites)
+
+        species = intern_resource(species)
+
+        if forms is not None:
+            forms = [intern_resource(form) for form in forms]
+
+        # Heavy list fields are hydrated now, or on first access when lazy
+        if lazy:
+            moves, held_items, game_indices, past_types = (
+                _Unhydrated(value) if value else []
+                for value in (moves, held_items, game_indices, past_types)
+            )
+        else:
+            moves = _build_moves(moves) if moves else []
+            held_items = _build_held_items(held_items) if held_items else []
+            game_indices = _build_game_indices(game_indices) if game_indices else []
+            past_types = _build_past_types(past_types) if past_types else []
+
+        # Assign all attributes
+        self.id = id
+        self.name = name
+        self.base_experience = base_experience
+        self.height = height
+        self.is_default = is_default
+        self.order = order
+        self.weight = weight
+        self.abilities = abilities or []
+        self.forms = forms or []
+        self.game_indices = game_indices
+        self.held_items = held_items
+        self.location_area_encounters = location_area_encounters
+        self.moves = moves
+        self.past_types = past_types
+        self.sprites = sprites
+        self.species = species
+        self.stats = stats or []
+        self.types = types or []
@@ -4,11 +4,181 @@ Main API client for the PokéAPI wrapper
 
 import requests
 import logging
-from urllib.parse import urljoin
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from urllib.parse import urljoin, urlsplit
+from requests.adapters import HTTPAdapter
 
+from .cache import MISSING
+from .deadline import (
+    current_deadline,
+    deadline_after,
+    deadline_scope,
+    remaining,
+    run_with_deadline,
+)
+from .decoding import get_decoder
+from .instrumentation import CompositeHooks
+from .singleflight import SingleFlight
+from .models.ability import Ability
 from .models.pokemon import Pokemon
-from .models.base import PaginatedResponse
-from .exceptions import PokeAPIError, ResourceNotFoundError
+from .models.type import Type
+from .models.base import NamedAPIResource, PaginatedResponse, intern_resource
+from .ratelimit import parse_retry_after
+from .exceptions import (
+    DeadlineExceededError,
+    InvalidParameterError,
+    NetworkError,
+    PokeAPIError,
+    RateLimitError,
+    ResourceNotFoundError,
+)
+
+# Seconds a single request may take unless the client is configured otherwise
+DEFAULT_TIMEOUT = 30.0
+
+# Models built for the resources fetched by PokeAPI.resolve; other resource
+# types are attached as their decoded JSON
+RESOURCE_MODELS = {"ability": Ability, "pokemon": Pokemon, "type": Type}
+
+
+def cap_timeout(timeout, limit):
+    """
+    Cap a requests timeout to a time limit
+
+    Args:
+        timeout: Timeout in seconds, a (connect, read) tuple, or None
+        limit: Largest timeout allowed in seconds
+
+    Returns:
+        Timeout of the same shape, no part of it above limit
+    """
+    if timeout is None:
+        return limit
+    if isinstance(timeout, tuple):
+        return tuple(cap_timeout(part, limit) for part in timeout)
+    return min(timeout, limit)
+
+
+def http_error(status_code, endpoint, error, retry_after=None):
+    """
+    Map an HTTP error status to the matching wrapper exception
+
+    Args:
+        status_code: HTTP status code of the response
+        endpoint: API endpoint that was requested
+        error: Description of the HTTP error
+        retry_after: Seconds from the Retry-After header of a 429, if any
+
+    Returns:
+        Exception to raise, with the status in its status_code attribute
+    """
+    if status_code == 404:
+        exception = ResourceNotFoundError(f"Resource not found: {endpoint}")
+    elif status_code == 429:
+        exception = RateLimitError(f"Rate limit exceeded: {endpoint}", retry_after)
+    else:
+        exception = PokeAPIError(f"HTTP Error: {error}")
+    exception.status_code = status_code
+    return exception
+
+
+def parse_resource_list(data):
+    """
+    Build a PaginatedResponse from a list endpoint payload
+
+    Args:
+        data: JSON response of a list endpoint as dictionary
+
+    Returns:
+        PaginatedResponse containing the results
+    """
+    # Create a new PaginatedResponse
+    paginated_response = PaginatedResponse(
+        count=data.get("count", 0),
+        next=data.get("next"),
+        previous=data.get("previous"),
+        results=[],
+    )
+
+    # Convert the results to the appropriate model
+    for item in data.get("results", []):
+        # Extract ID from URL
+        url_parts = item["url"].rstrip("/").split("/")
+        item_id = int(url_parts[-1])
+
+        # Create a simple dict with the necessary data
+        item_data = {"id": item_id, "name": item["name"], "url": item["url"]}
+
+        # For the list view, we don't need to parse the full model
+        # Just create a simple object with id, name, and url
+        paginated_response.results.append(item_data)
+
+    return paginated_response
+
+
+def parse_resource_url(url):
+    """
+    Split the URL of an API resource into its type and identifier
+
+    Args:
+        url: Resource URL, e.g. "https://pokeapi.co/api/v2/type/10/"
+
+    Returns:
+        Tuple of (resource_type, identifier), the identifier an int when
+        it is numeric
+
+    Raises:
+        InvalidParameterError: If the URL does not point to a resource
+    """
+    parts = urlsplit(url).path.strip("/").split("/")
+    if len(parts) < 2 or not parts[-1]:
+        raise InvalidParameterError(f"Not a resource URL: {url}")
+    resource_type, identifier = parts[-2], parts[-1]
+    return resource_type, int(identifier) if identifier.isdigit() else identifier
+
+
+def collect_references(node, path, found):
+    """
+    Find the references reached by following a path from a node
+
+    Lists along the way are walked item by item. A reference reached
+    before the end of the path is collected with the rest of the path,
+    which continues in the resource it points to once that is resolved.
+
+    Args:
+        node: Model, list, decoded JSON dictionary or reference
+        path: Tuple of attribute names still to follow
+        found: List receiving (NamedAPIResource, rest_of_path) tuples
+
+    Raises:
+        InvalidParameterError: If the path names a field a model lacks
+    """
+    if isinstance(node, list):
+        for item in node:
+            collect_references(item, path, found)
+        return
+    if isinstance(node, dict) and "url" in node:
+        # Raw JSON of a resource without a model still holds plain references
+        node = intern_resource(node)
+    if isinstance(node, NamedAPIResource):
+        found.append((node, path))
+        return
+    if node is None or not path:
+        return
+
+    name, rest = path[0], path[1:]
+    if isinstance(node, dict):
+        collect_references(node.get(name), rest, found)
+        return
+    fields = getattr(node, "FIELDS", None)
+    if fields is not None and name not in fields:
+        raise InvalidParameterError(
+            f"Unknown {type(node).__name__} field in path: {name}"
+        )
+    collect_references(getattr(node, name, None), rest, found)
 
 
 class PokeAPI:
@@ -18,11 +188,118 @@ class PokeAPI:
 
     BASE_URL = "https://pokeapi.co/api/v2/"
 
-    def __init__(self):
+    def __init__(
+        self,
+        base_url=None,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        timeout=DEFAULT_TIMEOUT,
+        headers=None,
+        cache=None,
+        http_cache=None,
+        lazy_hydration=False,
+        json_backend=None,
+        rate_limiter=None,
+        retry_policy=None,
+        circuit_breaker=None,
+        hedge_policy=None,
+        hooks=None,
+        mirror=None,
+        offline=False,
+    ):
         """
         Initialize the PokéAPI client
+
+        The client owns a pooled, keep-alive HTTP session that is reused by
+        every request and can be shared between threads. Call ``close()``
+        or use the client as a context manager to release the connections.
+
+        Args:
+            base_url: Root URL of the API (default: BASE_URL)
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum number of connections kept per host
+            pool_block: Whether to block instead of opening extra
+                connections once a host has pool_maxsize connections in use
+            timeout: Default timeout in seconds for each request, or a
+                (connect, read) tuple, or None for no timeout
+                (default: DEFAULT_TIMEOUT)
+            headers: Default headers sent with every request
+            cache: Optional ResourceCache for fetched resources
+            http_cache: Optional HTTPCache persisting responses on disk
+            lazy_hydration: Whether Pokemon build their moves, held items,
+                game indices and past types only when first accessed
+            json_backend: JSON decoder to use, "orjson", "msgspec" or
+                "json" (default: the fastest one installed)
+            rate_limiter: Optional RateLimiter throttling outgoing requests;
+                it may be shared with other clients
+            retry_policy: Optional RetryPolicy retrying transient failures
+                (default: no retries)
+            circuit_breaker: Optional CircuitBreaker failing fast while a
+                host keeps failing; it may be shared with other clients
+            hedge_policy: Optional HedgePolicy sending a duplicate of
+                requests that are slower than usual
+            hooks: Optional Hooks, or list of Hooks, called at each step
+                of a lookup, e.g. a MetricsCollector (default: none, with
+                no timing overhead)
+            mirror: Optional Mirror answering resource lookups from a
+                local copy kept up to date by sync()
+            offline: Whether to answer everything from the mirror, list
+                endpoints included, and never use the network
+
+        Raises:
+            InvalidParameterError: If offline is set without a mirror
         """
+        if offline and mirror is None:
+            raise InvalidParameterError("An offline client needs a mirror")
         self.logger = logging.getLogger("pokeapi_wrapper")
+        self.base_url = (base_url or self.BASE_URL).rstrip("/") + "/"
+        self.timeout = timeout
+        self.cache = cache
+        self.http_cache = http_cache
+        self.lazy_hydration = lazy_hydration
+        self._loads = get_decoder(json_backend)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.hedge_policy = hedge_policy
+        if isinstance(hooks, (list, tuple)):
+            hooks = CompositeHooks(hooks)
+        self.hooks = hooks
+        self.mirror = mirror
+        self.offline = offline
+        self._hedge_executor = None
+        self._hedge_workers = max(2 * pool_maxsize, 8)
+        self._hedge_lock = threading.Lock()
+        # Maps (resource_type, name) to the numeric ID seen in responses
+        self._aliases = {}
+        self._in_flight = SingleFlight()
+        self._type_chart = None
+
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """Close the pooled connections held by the client"""
+        with self._hedge_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _make_request(self, endpoint, params=None):
         """
@@ -39,22 +316,316 @@ class PokeAPI:
             ResourceNotFoundError: If the resource is not found
             PokeAPIError: If there's an error with the API request
         """
-        url = urljoin(self.BASE_URL, endpoint)
+        return self._fetch(endpoint, params)[0]
+
+    def _fetch(self, endpoint, params=None, revalidate=False):
+        """
+        Make a request to the PokéAPI and measure the response body
+
+        Args:
+            endpoint: API endpoint to request
+            params: Query parameters
+            revalidate: Whether to revalidate a disk cache entry even while
+                it is fresh (default: False)
+
+        Returns:
+            Tuple of (JSON response as dictionary, body size in bytes)
+
+        Raises:
+            ResourceNotFoundError: If the resource is not found
+            PokeAPIError: If there's an error with the API request
+        """
+        if self.mirror is not None:
+            mirrored = self._fetch_mirrored(endpoint, params)
+            if mirrored is not None:
+                return mirrored
+        if self.offline:
+            raise ResourceNotFoundError(f"Resource not in the mirror: {endpoint}")
+
+        url = urljoin(self.base_url, endpoint)
+
+        cached = None
+        headers = None
+        if self.http_cache is not None:
+            cache_key = self.http_cache.key(url, params)
+            cached = self.http_cache.get(cache_key)
+            if cached is not None:
+                if not revalidate and self.http_cache.is_fresh(cached):
+                    if self.hooks is not None:
+                        self.hooks.on_cache_hit("disk", cache_key)
+                    return self._decode(cached.body, endpoint), len(cached.body)
+                headers = cached.validators()
+            if self.hooks is not None:
+                self.hooks.on_cache_miss("disk", cache_key)
+
+        response = self._send(url, params, headers, endpoint)
+        if response.status_code == 304 and cached is not None:
+            self.http_cache.touch(cache_key)
+            return self._decode(cached.body, endpoint), len(cached.body)
+        body = response.content
+
+        data = self._decode(body, endpoint)
+        if self.http_cache is not None:
+            self.http_cache.put(
+                cache_key,
+                body,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return data, len(body)
+
+    def _fetch_mirrored(self, endpoint, params):
+        """
+        Answer a request from the mirror
+
+        Returns:
+            Tuple of (JSON response as dictionary, body size in bytes), or
+            None if the mirror cannot answer it
+        """
+        resource_type, _, identifier = endpoint.strip("/").partition("/")
+        if not identifier:
+            # Online, list pages come from the API so they include new items
+            if not self.offline:
+                return None
+            params = params or {}
+            page = self.mirror.list_page(
+                resource_type,
+                int(params.get("limit", 20)),
+                int(params.get("offset", 0)),
+                self.base_url,
+            )
+            return page, 0
+
+        body = self.mirror.get(resource_type, identifier)
+        if body is None:
+            if self.hooks is not None:
+                self.hooks.on_cache_miss("mirror", endpoint)
+            return None
+        if self.hooks is not None:
+            self.hooks.on_cache_hit("mirror", endpoint)
+        return self._decode(body, endpoint), len(body)
+
+    def _send(self, url, params, headers, endpoint):
+        """
+        Send a GET request, retrying transient failures per the retry policy
+
+        Args:
+            url: Absolute request URL
+            params: Query parameters
+            headers: Extra request headers
+            endpoint: API endpoint, used in error messages
+
+        Returns:
+            The successful (2xx or 304) response
+
+        Raises:
+            ResourceNotFoundError: If the resource is not found
+            RateLimitError: If the server answered 429
+            CircuitOpenError: If the circuit of the host is open
+            DeadlineExceededError: If the call ran out of time
+            NetworkError: If the server could not be reached
+            PokeAPIError: If there's an error with the API request
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if self.hedge_policy is not None:
+                    return self._send_hedged(url, params, headers, endpoint)
+                return self._send_once(url, params, headers, endpoint)
+            except PokeAPIError as e:
+                policy = self.retry_policy
+                if policy is None or not policy.is_retryable("GET", e):
+                    raise
+                delay = policy.next_delay(
+                    attempt,
+                    time.monotonic() - started,
+                    getattr(e, "retry_after", None),
+                )
+                deadline = current_deadline()
+                if delay is None or (
+                    deadline is not None and time.monotonic() + delay >= deadline
+                ):
+                    raise
+                self.logger.debug(
+                    "Retrying %s in %.2fs after attempt %d: %s",
+                    endpoint,
+                    delay,
+                    attempt,
+                    e,
+                )
+                if self.hooks is not None:
+                    self.hooks.on_retry(endpoint, attempt, delay, e)
+                time.sleep(delay)
+
+    def _send_once(self, url, params, headers, endpoint):
+        """
+        Send one GET request, applying the rate limiter and circuit breaker
 
+        Args:
+            url: Absolute request URL
+            params: Query parameters
+            headers: Extra request headers
+            endpoint: API endpoint, used in error messages
+
+        Returns:
+            The successful (2xx or 304) response
+        """
+        host = urlsplit(url).netloc
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(host)
+        if self.rate_limiter is not None:
+            # Fails at once if the wait would outlast the call's deadline
+            self.rate_limiter.acquire(remaining())
+        # Never wait on the socket for longer than the call has left
+        left = remaining()
+        timeout = self.timeout if left is None else cap_timeout(self.timeout, left)
+
+        hooks = self.hooks
+        if hooks is not None:
+            hooks.on_request_start(endpoint)
+            start = time.perf_counter()
+        response = None
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            return data
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                raise ResourceNotFoundError(f"Resource not found: {endpoint}")
-            else:
-                raise PokeAPIError(f"HTTP Error: {e}")
+            response = self.session.get(
+                url, params=params, headers=headers, timeout=timeout
+            )
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ) as e:
+            if isinstance(e, requests.exceptions.Timeout) and timeout != self.timeout:
+                raise DeadlineExceededError(f"Deadline exceeded: {endpoint}")
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure(host)
+            raise NetworkError(f"Network Error: {e}")
         except requests.exceptions.RequestException as e:
             raise PokeAPIError(f"Request Error: {e}")
+        finally:
+            if hooks is not None:
+                seconds = time.perf_counter() - start
+                if response is None:
+                    hooks.on_request_end(endpoint, None, seconds, None, 0)
+                else:
+                    # requests stops the clock once the headers are parsed
+                    hooks.on_request_end(
+                        endpoint,
+                        response.status_code,
+                        seconds,
+                        response.elapsed.total_seconds(),
+                        len(response.content),
+                    )
+
+        if self.circuit_breaker is not None:
+            if response.status_code >= 500:
+                self.circuit_breaker.record_failure(host)
+            else:
+                self.circuit_breaker.record_success(host)
+
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code
+            retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+            if status_code == 429 and self.rate_limiter is not None:
+                self.rate_limiter.on_rate_limited(retry_after)
+            raise http_error(status_code, endpoint, e, retry_after)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_success()
+        return response
+
+    def _send_timed(self, url, params, headers, endpoint):
+        """Send one GET request and record its latency for hedging"""
+        start = time.monotonic()
+        response = self._send_once(url, params, headers, endpoint)
+        self.hedge_policy.record(time.monotonic() - start)
+        return response
+
+    def _get_hedge_executor(self):
+        """Get the thread pool running hedged requests, creating it once"""
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self._hedge_workers,
+                    thread_name_prefix="pokeapi-hedge",
+                )
+            return self._hedge_executor
+
+    def _send_hedged(self, url, params, headers, endpoint):
+        """
+        Send one GET request, hedging it if it is slower than usual
+
+        If no response has arrived after the hedge delay, the request is
+        sent a second time and the first successful response is returned.
+        A request already on the wire cannot be interrupted; the response
+        of the slower one is discarded and its connection goes back to the
+        pool.
+
+        Args:
+            url: Absolute request URL
+            params: Query parameters
+            headers: Extra request headers
+            endpoint: API endpoint, used in error messages
+
+        Returns:
+            The successful (2xx or 304) response
+        """
+        delay = self.hedge_policy.delay()
+        if delay is None:
+            return self._send_timed(url, params, headers, endpoint)
+
+        executor = self._get_hedge_executor()
+        deadline = current_deadline()
+        args = (deadline, self._send_timed, url, params, headers, endpoint)
+        attempts = [executor.submit(run_with_deadline, *args)]
+        if not wait(attempts, timeout=delay).done:
+            attempts.append(executor.submit(run_with_deadline, *args))
+
+        error = None
+        try:
+            for future in as_completed(attempts):
+                try:
+                    response = future.result()
+                except PokeAPIError as e:
+                    error = error or e
+                    continue
+                if len(attempts) > 1:
+                    self.hedge_policy.record_hedge(won=future is attempts[1])
+                return response
+            raise error
+        finally:
+            for future in attempts:
+                future.cancel()
+
+    def _decode(self, body, endpoint=None):
+        """
+        Decode a JSON response body
+
+        Raises:
+            PokeAPIError: If the body is not valid JSON
+        """
+        hooks = self.hooks
+        if hooks is not None:
+            start = time.perf_counter()
+        try:
+            data = self._loads(body)
         except ValueError as e:
             raise PokeAPIError(f"Invalid JSON response: {e}")
+        if hooks is not None:
+            hooks.on_decode(endpoint, time.perf_counter() - start, len(body))
+        return data
+
+    def _hydrate(self, model, data):
+        """Build a model from a decoded payload"""
+        hooks = self.hooks
+        if hooks is None:
+            return model.from_json(data, lazy=self.lazy_hydration)
+        start = time.perf_counter()
+        instance = model.from_json(data, lazy=self.lazy_hydration)
+        hooks.on_hydrate(model.__name__, time.perf_counter() - start)
+        return instance
 
     def _get_resource(self, resource_type, identifier):
         """
@@ -67,10 +638,447 @@ class PokeAPI:
         Returns:
             JSON response as dictionary
         """
+        key = self._resource_key(resource_type, identifier)
+        if self.cache is not None and self.cache.store == "json":
+            data = self.cache.get(key)
+            if data is not MISSING:
+                if self.hooks is not None:
+                    self.hooks.on_cache_hit("memory", key)
+                return data
+            if self.hooks is not None:
+                self.hooks.on_cache_miss("memory", key)
+        # Concurrent lookups of the same resource share one request; the
+        # flight is keyed by what it returns, so it never joins a model lookup
+        return self._coalesce(
+            ("json", key), self._load_resource, resource_type, identifier
+        )
+
+    def _load_resource(self, resource_type, identifier):
+        """Fetch a resource and store it in the JSON cache"""
+        data, size = self._fetch_resource(resource_type, identifier)
+        if self.cache is not None and self.cache.store == "json":
+            self.cache.set((resource_type, data["id"]), data, size)
+        return data
+
+    def _get_model(self, resource_type, identifier, model):
+        """
+        Get a resource by its identifier as a hydrated model
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            identifier: Name or ID of the resource
+            model: Model class built from the JSON payload
+
+        Returns:
+            Instance of model
+        """
+        if self.cache is None or self.cache.store != "model":
+            data = self._get_resource(resource_type, identifier)
+            return self._hydrate(model, data)
+
+        key = self._resource_key(resource_type, identifier)
+        instance = self.cache.get(key)
+        if instance is not MISSING:
+            if self.hooks is not None:
+                self.hooks.on_cache_hit("memory", key)
+            return instance
+        if self.hooks is not None:
+            self.hooks.on_cache_miss("memory", key)
+        return self._coalesce(
+            ("model", key), self._load_model, resource_type, identifier, model
+        )
+
+    def _coalesce(self, key, function, *args):
+        """
+        Run function(*args) through the single-flight group
+
+        Waiting for a request already in flight counts against the
+        deadline of the current call. The shared request runs under the
+        deadline of the caller that started it, so a caller that joined it
+        and still has time left when it fails on that deadline runs it
+        again under its own.
+
+        Raises:
+            DeadlineExceededError: If the call ran out of time waiting
+        """
+        while True:
+            started = []
+
+            def run():
+                started.append(True)
+                return function(*args)
+
+            try:
+                return self._in_flight.do(key, run, timeout=remaining())
+            except TimeoutError:
+                raise DeadlineExceededError(f"Deadline exceeded waiting for {key}")
+            except DeadlineExceededError:
+                if started:
+                    raise
+                deadline = current_deadline()
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+
+    def _get_projection(self, resource_type, identifier, model, fields):
+        """
+        Get a resource as a model with only some of its fields populated
+
+        The unrequested fields are dropped right after decoding, so they are
+        never hydrated or kept alive by the model. The id and name fields are
+        always included.
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            identifier: Name or ID of the resource
+            model: Model class built from the JSON payload
+            fields: Iterable of top-level field names
+
+        Returns:
+            Instance of model
+
+        Raises:
+            InvalidParameterError: If a field is not an attribute of model
+        """
+        fields = set(fields)
+        unknown = fields - model.FIELDS
+        if unknown:
+            raise InvalidParameterError(
+                f"Unknown {resource_type} fields: {', '.join(sorted(unknown))}"
+            )
+        fields.update(("id", "name"))
+        data = self._get_resource(resource_type, identifier)
+        selected = {field: data[field] for field in fields if field in data}
+        return self._hydrate(model, selected)
+
+    def _load_model(self, resource_type, identifier, model):
+        """Fetch a resource, hydrate it and store the model in the cache"""
+        data, size = self._fetch_resource(resource_type, identifier)
+        instance = self._hydrate(model, data)
+        self.cache.set((resource_type, data["id"]), instance, size)
+        return instance
+
+    def _fetch_resource(self, resource_type, identifier):
+        """Fetch a resource from the API, bypassing the cache"""
         endpoint = f"{resource_type}/{identifier}"
-        return self._make_request(endpoint)
+        data, size = self._fetch(endpoint)
+        self._remember_alias(resource_type, data.get("name"), data.get("id"))
+        return data, size
+
+    def invalidate(self, resource_type=None, identifier=None):
+        """
+        Drop cached resources
+
+        Args:
+            resource_type: Type of resource to drop (default: all types)
+            identifier: Name or ID of the single resource to drop
+                (default: every resource of resource_type)
+        """
+        if self.cache is None:
+            return
+        if identifier is None:
+            self.cache.clear(resource_type)
+        else:
+            self.cache.invalidate(self._resource_key(resource_type, identifier))
+
+    def cache_stats(self):
+        """
+        Get the counters of the configured caches
+
+        Returns:
+            Dictionary with the "memory" and "disk" cache stats, each None
+            if that cache is not configured
+        """
+        return {
+            "memory": self.cache.stats() if self.cache is not None else None,
+            "disk": self.http_cache.stats() if self.http_cache is not None else None,
+        }
+
+    def sync(
+        self,
+        mirror=None,
+        resource_type="pokemon",
+        max_age=86400,
+        page_size=100,
+        max_workers=8,
+        progress=None,
+        timeout=None,
+    ):
+        """
+        Mirror every resource of a type into a local Mirror
+
+        The first sync walks the list endpoint and fetches every resource.
+        Later syncs are incremental: while the upstream count still matches
+        the mirror the listing is not walked again, new resources are
+        fetched, and only entries older than max_age are revalidated with
+        conditional requests, so unchanged ones cost a 304 and no body.
+        Resources that disappeared upstream are removed. A sync with
+        failures leaves the listing to be walked again next time. List pages
+        are always revalidated with the API, even when the disk cache holds
+        a fresh copy.
+
+        Args:
+            mirror: Mirror to fill (default: the client's mirror)
+            resource_type: Type of resource to mirror (default: 'pokemon')
+            max_age: Seconds after which a mirrored resource is revalidated,
+                or None to never revalidate (default: one day)
+            page_size: Number of items requested per list page
+            max_workers: Number of worker threads (default: 8)
+            progress: Optional callable receiving (completed, total) after
+                each resource is fetched or revalidated
+            timeout: Seconds the whole call may take; resources that have
+                not been synced by then count as failed (default: no limit
+                beyond the request timeout)
+
+        Returns:
+            Dictionary with the upstream count and the number of resources
+            fetched (new), updated, revalidated (unchanged, 304), skipped
+            (still fresh), removed and failed
+
+        Raises:
+            InvalidParameterError: If there is no mirror or the client is
+                offline
+            DeadlineExceededError: If the listing could not be read before
+                the timeout
+            PokeAPIError: If the list endpoint could not be read
+        """
+        mirror = mirror if mirror is not None else self.mirror
+        if mirror is None or self.offline:
+            raise InvalidParameterError("sync needs a mirror and an online client")
+
+        deadline = deadline_after(timeout)
+        with deadline_scope(deadline):
+            # The disk cache may hold a day-old listing; always ask the API
+            count = self._get_resource_list(resource_type, 1, revalidate=True).count
+            stored = mirror.entries(resource_type)
+            if mirror.count(resource_type) == count == len(stored):
+                listed = set(stored)
+            else:
+                listed = {
+                    item["id"]
+                    for item in self._iter_resource_list(
+                        resource_type, page_size, 2, True, max_workers, None, True
+                    )
+                }
+
+        now = time.time()
+        stale = {
+            resource_id
+            for resource_id in listed & stored.keys()
+            if max_age is not None and stored[resource_id].synced_at + max_age <= now
+        }
+        new = listed - stored.keys()
+        removed = stored.keys() - listed
+        stats = dict.fromkeys(
+            ("fetched", "updated", "revalidated", "removed", "failed"), 0
+        )
+        stats["count"] = count
+        stats["skipped"] = len(listed) - len(new) - len(stale)
+
+        def fetch(resource_id):
+            endpoint = f"{resource_type}/{resource_id}"
+            entry = stored.get(resource_id)
+            headers = entry.validators() if entry is not None else None
+            try:
+                response = self._send(
+                    urljoin(self.base_url, endpoint), None, headers, endpoint
+                )
+            except ResourceNotFoundError:
+                if entry is None:
+                    raise
+                mirror.delete(resource_type, [resource_id])
+                return "removed"
+            if response.status_code == 304:
+                mirror.touch(resource_type, resource_id)
+                return "revalidated"
+            body = response.content
+            data = self._decode(body, endpoint)
+            mirror.put(
+                resource_type,
+                data["id"],
+                data["name"],
+                body,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            self._remember_alias(resource_type, data["name"], data["id"])
+            return "fetched" if entry is None else "updated"
+
+        requests_by_key = {resource_id: resource_id for resource_id in new | stale}
+        for resource_id, _, outcome, error in self._iter_many(
+            fetch, requests_by_key, max_workers, progress, deadline
+        ):
+            if error is not None:
+                self.logger.warning(
+                    "Could not sync %s/%s: %s", resource_type, resource_id, error
+                )
+                outcome = "failed"
+            stats[outcome] += 1
+
+        # Only a complete sync may skip the listing next time
+        if not stats["failed"]:
+            mirror.delete(resource_type, removed)
+            stats["removed"] += len(removed)
+            mirror.set_count(resource_type, count)
+        return stats
+
+    def _get_reference(self, url):
+        """
+        Get the resource a reference URL points to, through the cache
+
+        Args:
+            url: URL of the resource
+
+        Returns:
+            Model from RESOURCE_MODELS, or the JSON dictionary for
+            resource types without a model
+        """
+        resource_type, identifier = parse_resource_url(url)
+        model = RESOURCE_MODELS.get(resource_type)
+        if model is None:
+            return self._get_resource(resource_type, identifier)
+        return self._get_model(resource_type, identifier, model)
 
-    def _get_resource_list(self, resource_type, limit=20, offset=0):
+    def resolve(self, objs, paths, depth=1, max_workers=8, timeout=None):
+        """
+        Fetch the resources referenced by a batch of models
+
+        Each path is a chain of attribute names such as "types.type" or
+        "abilities.ability"; lists along the way are walked item by item.
+        The references found across the whole batch are deduplicated by URL
+        and fetched concurrently through the cache, so 500 Pokemon sharing
+        50 abilities cost 50 requests. The hydrated resources are returned
+        by URL, e.g. ``resolved[pokemon.abilities[0].ability.url]``; the
+        models and their shared references are left untouched.
+
+        A path may continue past a reference into the resource it points
+        to, e.g. "types.type.damage_relations.double_damage_to"; depth
+        bounds how many references are followed along a path. Resolving
+        again goes through the cache, so a cached resource costs no request.
+
+        Args:
+            objs: Model, or iterable of models, whose references to resolve
+            paths: Iterable of dotted attribute paths
+            depth: Maximum number of references followed along each path
+                (default: 1)
+            max_workers: Number of worker threads (default: 8)
+            timeout: Seconds the whole call may take; fetches that have not
+                finished by then fail with DeadlineExceededError
+                (default: no limit beyond the request timeout)
+
+        Returns:
+            Dictionary mapping the URL of every reference followed to its
+            hydrated resource
+
+        Raises:
+            InvalidParameterError: If a path names a field a model lacks
+            PokeAPIError: The first failed fetch
+        """
+        deadline = deadline_after(timeout)
+        batch = [objs] if hasattr(objs, "FIELDS") else list(objs)
+        level = [(obj, tuple(path.split("."))) for obj in batch for path in paths]
+        # Kept per call: references are interned and shared by every client
+        resolved = {}
+
+        for _ in range(depth):
+            found = []
+            for node, path in level:
+                collect_references(node, path, found)
+
+            pending = {
+                reference.url: reference.url
+                for reference, _ in found
+                if reference.url and reference.url not in resolved
+            }
+            for url, _, result, error in self._iter_many(
+                self._get_reference, pending, max_workers, None, deadline
+            ):
+                if error is not None:
+                    raise error
+                resolved[url] = result
+
+            level = [
+                (resolved[reference.url], rest)
+                for reference, rest in found
+                if rest and reference.url in resolved
+            ]
+            if not level:
+                break
+        return resolved
+
+    def _remember_alias(self, resource_type, name, resource_id):
+        """Record that a resource name and numeric ID refer to the same item"""
+        if name is not None and resource_id is not None:
+            self._aliases[(resource_type, name)] = resource_id
+
+    def _resource_key(self, resource_type, identifier):
+        """
+        Get the canonical key of a resource identifier
+
+        Numeric IDs (as ints or digit strings) and names that are known to
+        belong to an ID share the key (resource_type, id); names that have
+        not been seen yet fall back to (resource_type, name).
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            identifier: Name or ID of the resource
+
+        Returns:
+            Tuple identifying the resource
+        """
+        if isinstance(identifier, str):
+            identifier = identifier.strip().lower()
+            if identifier.isdigit():
+                identifier = int(identifier)
+        if isinstance(identifier, int):
+            return (resource_type, identifier)
+        return (
+            resource_type,
+            self._aliases.get((resource_type, identifier), identifier),
+        )
+
+    def _iter_many(self, fetch, requests_by_key, max_workers, progress, deadline):
+        """
+        Fetch several resources concurrently, yielding them as they complete
+
+        Args:
+            fetch: Callable fetching a single resource by identifier
+            requests_by_key: Dictionary mapping each canonical key to the
+                identifier to fetch it with
+            max_workers: Number of worker threads
+            progress: Optional callable receiving (completed, total)
+            deadline: Monotonic deadline shared by every fetch, or None
+
+        Yields:
+            Tuples of (key, identifier, result, error) where exactly one of
+            result and error is set
+        """
+        total = len(requests_by_key)
+        if not total:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, total))
+        futures = {
+            executor.submit(run_with_deadline, deadline, fetch, identifier): (
+                key,
+                identifier,
+            )
+            for key, identifier in requests_by_key.items()
+        }
+        try:
+            for completed, future in enumerate(as_completed(futures), start=1):
+                key, identifier = futures[future]
+                error = future.exception()
+                result = None if error is not None else future.result()
+                if progress is not None:
+                    progress(completed, total)
+                yield key, identifier, result, error
+        finally:
+            # Stop queued work if the caller abandons the iteration early
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _get_resource_list(self, resource_type, limit=20, offset=0, revalidate=False):
         """
         Get a paginated list of resources
 
@@ -78,42 +1086,329 @@ class PokeAPI:
             resource_type: Type of resource (e.g., 'pokemon')
             limit: Number of results to return
             offset: Offset for pagination
+            revalidate: Whether to revalidate a cached page with the API
+                even while it is fresh (default: False)
 
         Returns:
             PaginatedResponse containing the results
         """
         params = {"limit": limit, "offset": offset}
-        data = self._make_request(resource_type, params)
-
-        # Create a new PaginatedResponse
-        paginated_response = PaginatedResponse(
-            count=data.get("count", 0),
-            next=data.get("next"),
-            previous=data.get("previous"),
-            results=[],
-        )
+        data = self._fetch(resource_type, params, revalidate)[0]
+        paginated_response = parse_resource_list(data)
+        for item in paginated_response.results:
+            self._remember_alias(resource_type, item["name"], item["id"])
+        return paginated_response
+
+    def _iter_resource_list(
+        self,
+        resource_type,
+        page_size,
+        prefetch,
+        sharded,
+        max_workers,
+        timeout,
+        revalidate=False,
+    ):
+        """
+        Iterate over every item of a list endpoint
 
-        # Convert the results to the appropriate model
-        for item in data.get("results", []):
-            # Extract ID from URL
-            url_parts = item["url"].rstrip("/").split("/")
-            item_id = int(url_parts[-1])
+        Pages are addressed by offset, so upcoming pages can be requested
+        before the current one has been consumed.
 
-            # Create a simple dict with the necessary data
-            item_data = {"id": item_id, "name": item["name"], "url": item["url"]}
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            page_size: Number of items requested per page
+            prefetch: Number of pages fetched ahead in the background
+            sharded: Whether to fetch every remaining page concurrently as
+                soon as the first page reports the total count
+            max_workers: Number of worker threads
+            timeout: Seconds allowed for each page request, or None; pages
+                never outlast the deadline of the current call
+            revalidate: Whether to revalidate cached pages with the API
 
-            # For the list view, we don't need to parse the full model
-            # Just create a simple object with id, name, and url
-            paginated_response.results.append(item_data)
+        Yields:
+            List items as dictionaries with id, name and url
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = deque()
+        next_offset = 0
 
-        return paginated_response
+        def submit():
+            nonlocal next_offset
+            # Pages also stop at the deadline of the call iterating them
+            deadline = deadline_after(timeout)
+            outer = current_deadline()
+            if outer is not None and (deadline is None or outer < deadline):
+                deadline = outer
+            pending.append(
+                executor.submit(
+                    run_with_deadline,
+                    deadline,
+                    self._get_resource_list,
+                    resource_type,
+                    page_size,
+                    next_offset,
+                    revalidate,
+                )
+            )
+            next_offset += page_size
+
+        try:
+            submit()
+            while pending:
+                page = pending.popleft().result()
+                # Queue the following pages before handing out this one
+                window = page.count if sharded else max(prefetch, 1)
+                while next_offset < page.count and len(pending) < window:
+                    submit()
+                yield from page.results
+                if not page.results:
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
 
     # Pokemon endpoints
-    def get_pokemon(self, identifier):
-        """Get a Pokemon by name or ID"""
-        pokemon_data = self._get_resource("pokemon", identifier)
-        return Pokemon(**pokemon_data)
-
-    def get_pokemon_list(self, limit=20, offset=0):
-        """Get a list of Pokemon"""
-        return self._get_resource_list("pokemon", limit, offset)
+    def get_pokemon(self, identifier, fields=None, timeout=None):
+        """
+        Get a Pokemon by name or ID
+
+        Args:
+            identifier: Name or ID of the Pokemon
+            fields: Optional iterable of attribute names to populate, e.g.
+                ["types", "stats"]; the other attributes keep their
+                defaults and are never hydrated (default: all fields)
+            timeout: Seconds the whole call may take, including retries
+                and waits (default: no limit beyond the request timeout)
+
+        Returns:
+            Pokemon
+
+        Raises:
+            DeadlineExceededError: If the call took longer than timeout
+        """
+        with deadline_scope(deadline_after(timeout)):
+            if fields is not None:
+                return self._get_projection("pokemon", identifier, Pokemon, fields)
+            return self._get_model("pokemon", identifier, Pokemon)
+
+    def get_pokemon_list(self, limit=20, offset=0, timeout=None):
+        """
+        Get a list of Pokemon
+
+        Args:
+            limit: Number of results to return (default: 20)
+            offset: Offset for pagination (default: 0)
+            timeout: Seconds the whole call may take (default: no limit
+                beyond the request timeout)
+
+        Returns:
+            PaginatedResponse containing the results
+        """
+        with deadline_scope(deadline_after(timeout)):
+            return self._get_resource_list("pokemon", limit, offset)
+
+    def iter_pokemon(
+        self, page_size=100, prefetch=2, sharded=False, max_workers=8, timeout=None
+    ):
+        """
+        Iterate over every Pokemon in the catalogue
+
+        While items are being consumed the next prefetch pages are fetched
+        in the background. In sharded mode the first page provides the total
+        count and every remaining page is fetched concurrently; items are
+        still yielded in catalogue order.
+
+        Args:
+            page_size: Number of Pokemon requested per page (default: 100)
+            prefetch: Number of pages fetched ahead (default: 2)
+            sharded: Whether to fetch all remaining pages at once
+                (default: False)
+            max_workers: Number of worker threads (default: 8)
+            timeout: Seconds allowed for each page request (default: no
+                limit beyond the request timeout)
+
+        Yields:
+            Dictionaries with the id, name and url of each Pokemon
+        """
+        return self._iter_resource_list(
+            "pokemon", page_size, prefetch, sharded, max_workers, timeout
+        )
+
+    def get_pokemon_many(
+        self,
+        identifiers,
+        max_workers=8,
+        return_exceptions=False,
+        progress=None,
+        timeout=None,
+    ):
+        """
+        Get several Pokemon concurrently
+
+        Requests fan out over a thread pool. Duplicate identifiers, including
+        a name and an ID that are known to refer to the same Pokemon, are
+        fetched once. A name the client has not seen yet cannot be matched
+        to its ID up front, so on a new client "pikachu" and 25 still cost
+        two requests; their slots then share the same Pokemon.
+
+        Args:
+            identifiers: Iterable of names or IDs
+            max_workers: Number of worker threads (default: 8)
+            return_exceptions: Whether to put the exception of a failed
+                lookup in its slot instead of raising it (default: False)
+            progress: Optional callable receiving (completed, total) after
+                each distinct Pokemon is fetched
+            timeout: Seconds the whole batch may take; lookups that have
+                not finished by then fail with DeadlineExceededError
+                (default: no limit beyond the request timeout)
+
+        Returns:
+            List of Pokemon in the same order as identifiers
+
+        Raises:
+            PokeAPIError: The first failure, if return_exceptions is False
+        """
+        deadline = deadline_after(timeout)
+        identifiers = list(identifiers)
+        keys = [self._resource_key("pokemon", identifier) for identifier in identifiers]
+        requests_by_key = {}
+        for key, identifier in zip(keys, identifiers):
+            requests_by_key.setdefault(key, identifier)
+
+        outcomes = {}
+        for key, identifier, result, error in self._iter_many(
+            self.get_pokemon, requests_by_key, max_workers, progress, deadline
+        ):
+            if error is not None and not return_exceptions:
+                raise error
+            outcomes[key] = error if error is not None else result
+
+        # Merge the aliases only discovered from the responses
+        by_id = {}
+        for key in keys:
+            result = outcomes[key]
+            if isinstance(result, Pokemon) and result.id is not None:
+                outcomes[key] = by_id.setdefault(result.id, result)
+        return [outcomes[key] for key in keys]
+
+    def iter_pokemon_many(
+        self,
+        identifiers,
+        max_workers=8,
+        return_exceptions=False,
+        progress=None,
+        timeout=None,
+    ):
+        """
+        Get several Pokemon concurrently, yielding each one as it arrives
+
+        Works like get_pokemon_many but yields results in completion order,
+        so processing can start before the slowest request returns. A name
+        and an ID of the same Pokemon may both be requested on a new client;
+        only the first of them to arrive is yielded.
+
+        Args:
+            identifiers: Iterable of names or IDs
+            max_workers: Number of worker threads (default: 8)
+            return_exceptions: Whether to yield the exception of a failed
+                lookup instead of raising it (default: False)
+            progress: Optional callable receiving (completed, total) after
+                each distinct Pokemon is fetched
+            timeout: Seconds the whole batch may take; lookups that have
+                not finished by then fail with DeadlineExceededError
+                (default: no limit beyond the request timeout)
+
+        Yields:
+            Tuples of (identifier, Pokemon), once per distinct Pokemon
+
+        Raises:
+            PokeAPIError: The first failure, if return_exceptions is False
+        """
+        deadline = deadline_after(timeout)
+        requests_by_key = {}
+        for identifier in identifiers:
+            key = self._resource_key("pokemon", identifier)
+            requests_by_key.setdefault(key, identifier)
+
+        seen = set()
+        for key, identifier, result, error in self._iter_many(
+            self.get_pokemon, requests_by_key, max_workers, progress, deadline
+        ):
+            if error is not None:
+                if not return_exceptions:
+                    raise error
+                yield identifier, error
+            elif result.id is None or result.id not in seen:
+                seen.add(result.id)
+                yield identifier, result
+
+    # Ability endpoints
+    def get_ability(self, identifier, timeout=None):
+        """
+        Get an ability by name or ID
+
+        Args:
+            identifier: Name or ID of the ability
+            timeout: Seconds the whole call may take, including retries
+                and waits (default: no limit beyond the request timeout)
+
+        Returns:
+            Ability
+        """
+        with deadline_scope(deadline_after(timeout)):
+            return self._get_model("ability", identifier, Ability)
+
+    # Type endpoints
+    def get_type(self, identifier, timeout=None):
+        """
+        Get a type by name or ID
+
+        Args:
+            identifier: Name or ID of the type
+            timeout: Seconds the whole call may take, including retries
+                and waits (default: no limit beyond the request timeout)
+
+        Returns:
+            Type
+        """
+        with deadline_scope(deadline_after(timeout)):
+            return self._get_model("type", identifier, Type)
+
+    def get_type_chart(self, max_workers=8, timeout=None):
+        """
+        Get the effectiveness chart of the standard types
+
+        The first call fetches the 18 types concurrently through the cache
+        and builds the chart; later calls return the same chart.
+
+        Args:
+            max_workers: Number of worker threads (default: 8)
+            timeout: Seconds the whole call may take, including retries
+                and waits (default: no limit beyond the request timeout)
+
+        Returns:
+            TypeChart
+
+        Raises:
+            ImportError: If NumPy is not installed
+            PokeAPIError: The first failed fetch
+        """
+        if self._type_chart is None:
+            # Deferred so that NumPy is only imported by clients using it
+            from .typechart import STANDARD_TYPES, TypeChart
+
+            types = {}
+            for name, _, result, error in self._iter_many(
+                self.get_type,
+                {name: name for name in STANDARD_TYPES},
+                max_workers,
+                None,
+                deadline_after(timeout),
+            ):
+                if error is not None:
+                    raise error
+                types[name] = result
+            self._type_chart = TypeChart(types[name] for name in STANDARD_TYPES)
+        return self._type_chart
@@ -0,0 +1,357 @@
+"""
+Asyncio client for the PokéAPI wrapper
+"""
+
+import asyncio
+import logging
+import time
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .api import DEFAULT_TIMEOUT, PokeAPI, http_error, parse_resource_list
+from .deadline import remaining
+from .decoding import get_decoder
+from .ratelimit import parse_retry_after
+from .models.pokemon import Pokemon
+from .exceptions import DeadlineExceededError, NetworkError, PokeAPIError
+from .singleflight import AsyncSingleFlight
+
+
+class AsyncPokeAPI:
+    """
+    Asyncio client for the PokéAPI wrapper
+
+    Mirrors the surface of PokeAPI with coroutine methods. Requests share a
+    pooled aiohttp session and a semaphore caps how many of them are in
+    flight at once, so a single event loop can drive hundreds of concurrent
+    lookups. Concurrent lookups of the same resource share one request.
+    Use the client as an async context manager or call
+    ``await close()`` when done.
+    """
+
+    BASE_URL = PokeAPI.BASE_URL
+
+    def __init__(
+        self,
+        base_url=None,
+        max_concurrency=100,
+        pool_size=100,
+        limit_per_host=0,
+        timeout=DEFAULT_TIMEOUT,
+        headers=None,
+        json_backend=None,
+        rate_limiter=None,
+        retry_policy=None,
+        circuit_breaker=None,
+        hedge_policy=None,
+    ):
+        """
+        Initialize the asyncio PokéAPI client
+
+        Args:
+            base_url: Root URL of the API (default: BASE_URL)
+            max_concurrency: Maximum number of requests in flight at once
+            pool_size: Maximum number of open connections in total
+            limit_per_host: Maximum number of open connections per host
+                (default: no per-host limit)
+            timeout: Total timeout in seconds for each request, or None
+                for no timeout (default: DEFAULT_TIMEOUT)
+            headers: Default headers sent with every request
+            json_backend: JSON decoder to use, "orjson", "msgspec" or
+                "json" (default: the fastest one installed)
+            rate_limiter: Optional RateLimiter throttling outgoing requests;
+                it may be shared with other clients, threaded or not
+            retry_policy: Optional RetryPolicy retrying transient failures
+                (default: no retries)
+            circuit_breaker: Optional CircuitBreaker failing fast while a
+                host keeps failing; it may be shared with other clients
+            hedge_policy: Optional HedgePolicy sending a duplicate of
+                requests that are slower than usual
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncPokeAPI requires aiohttp; install it with "
+                "'pip install pkmn_api_wrapper_yotaenom[async]'"
+            )
+        self.logger = logging.getLogger("pokeapi_wrapper")
+        self.base_url = (base_url or self.BASE_URL).rstrip("/") + "/"
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self._loads = get_decoder(json_backend)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.hedge_policy = hedge_policy
+        self.session = None
+        self._semaphore = None
+        self._in_flight = AsyncSingleFlight()
+
+    def _get_session(self):
+        # The session and semaphore must be created inside the running loop
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size, limit_per_host=self.limit_per_host
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.session
+
+    async def close(self):
+        """Close the pooled connections held by the client"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _make_request(self, endpoint, params=None):
+        """
+        Make a request to the PokéAPI
+
+        Args:
+            endpoint: API endpoint to request
+            params: Query parameters
+
+        Returns:
+            JSON response as dictionary
+
+        Raises:
+            ResourceNotFoundError: If the resource is not found
+            PokeAPIError: If there's an error with the API request
+        """
+        url = urljoin(self.base_url, endpoint)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if self.hedge_policy is not None:
+                    body = await self._request_hedged(url, params, endpoint)
+                else:
+                    body = await self._request_once(url, params, endpoint)
+                break
+            except PokeAPIError as e:
+                policy = self.retry_policy
+                if policy is None or not policy.is_retryable("GET", e):
+                    raise
+                delay = policy.next_delay(
+                    attempt,
+                    time.monotonic() - started,
+                    getattr(e, "retry_after", None),
+                )
+                if delay is None:
+                    raise
+                self.logger.debug(
+                    "Retrying %s in %.2fs after attempt %d: %s",
+                    endpoint,
+                    delay,
+                    attempt,
+                    e,
+                )
+                await asyncio.sleep(delay)
+
+        try:
+            return self._loads(body)
+        except ValueError as e:
+            raise PokeAPIError(f"Invalid JSON response: {e}")
+
+    async def _request_once(self, url, params, endpoint):
+        """
+        Send one GET request and read its body
+
+        Args:
+            url: Absolute request URL
+            params: Query parameters
+            endpoint: API endpoint, used in error messages
+
+        Returns:
+            Response body as bytes
+        """
+        session = self._get_session()
+        host = urlsplit(url).netloc
+
+        async with self._semaphore:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request(host)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(remaining())
+            try:
+                async with session.get(url, params=params) as response:
+                    if self.circuit_breaker is not None:
+                        if response.status >= 500:
+                            self.circuit_breaker.record_failure(host)
+                        else:
+                            self.circuit_breaker.record_success(host)
+                    if response.status >= 400:
+                        error = f"{response.status} {response.reason} for url: {url}"
+                        retry_after = parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                        if response.status == 429 and self.rate_limiter is not None:
+                            self.rate_limiter.on_rate_limited(retry_after)
+                        raise http_error(response.status, endpoint, error, retry_after)
+                    body = await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure(host)
+                raise NetworkError(f"Network Error: {str(e) or 'timed out'} ({url})")
+            except aiohttp.ClientError as e:
+                raise PokeAPIError(f"Request Error: {e}")
+            if self.rate_limiter is not None:
+                self.rate_limiter.on_success()
+        return body
+
+    async def _request_timed(self, url, params, endpoint):
+        """Send one GET request and record its latency for hedging"""
+        start = time.monotonic()
+        body = await self._request_once(url, params, endpoint)
+        self.hedge_policy.record(time.monotonic() - start)
+        return body
+
+    async def _request_hedged(self, url, params, endpoint):
+        """
+        Send one GET request, hedging it if it is slower than usual
+
+        If no response has arrived after the hedge delay, the request is
+        sent a second time; the first successful response is returned and
+        the other request is cancelled.
+
+        Args:
+            url: Absolute request URL
+            params: Query parameters
+            endpoint: API endpoint, used in error messages
+
+        Returns:
+            Response body as bytes
+        """
+        delay = self.hedge_policy.delay()
+        if delay is None:
+            return await self._request_timed(url, params, endpoint)
+
+        first = asyncio.ensure_future(self._request_timed(url, params, endpoint))
+        attempts = [first]
+        pending = {first}
+        error = None
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                attempts.append(
+                    asyncio.ensure_future(self._request_timed(url, params, endpoint))
+                )
+                pending.add(attempts[1])
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        if len(attempts) > 1:
+                            self.hedge_policy.record_hedge(won=task is attempts[1])
+                        return task.result()
+                    error = error or task.exception()
+                if not pending:
+                    raise error
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _with_timeout(self, awaitable, timeout):
+        """
+        Await a call within a time budget
+
+        Raises:
+            DeadlineExceededError: If the call took longer than timeout
+        """
+        if timeout is None:
+            return await awaitable
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(f"Deadline of {timeout}s exceeded")
+
+    async def _get_resource(self, resource_type, identifier):
+        """
+        Get a resource by its identifier
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            identifier: Name or ID of the resource
+
+        Returns:
+            JSON response as dictionary
+        """
+        endpoint = f"{resource_type}/{identifier}"
+        key = (resource_type, str(identifier).strip().lower())
+        return await self._in_flight.do(key, self._make_request, endpoint)
+
+    async def _get_resource_list(self, resource_type, limit=20, offset=0):
+        """
+        Get a paginated list of resources
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            limit: Number of results to return
+            offset: Offset for pagination
+
+        Returns:
+            PaginatedResponse containing the results
+        """
+        params = {"limit": limit, "offset": offset}
+        data = await self._make_request(resource_type, params)
+        return parse_resource_list(data)
+
+    # Pokemon endpoints
+    async def get_pokemon(self, identifier, timeout=None):
+        """
+        Get a Pokemon by name or ID
+
+        Args:
+            identifier: Name or ID of the Pokemon
+            timeout: Seconds the whole call may take, including retries
+                and waits (default: no limit beyond the request timeout)
+
+        Returns:
+            Pokemon
+
+        Raises:
+            DeadlineExceededError: If the call took longer than timeout
+        """
+        pokemon_data = await self._with_timeout(
+            self._get_resource("pokemon", identifier), timeout
+        )
+        return Pokemon.from_json(pokemon_data)
+
+    async def get_pokemon_list(self, limit=20, offset=0, timeout=None):
+        """
+        Get a list of Pokemon
+
+        Args:
+            limit: Number of results to return (default: 20)
+            offset: Offset for pagination (default: 0)
+            timeout: Seconds the whole call may take (default: no limit
+                beyond the request timeout)
+
+        Returns:
+            PaginatedResponse containing the results
+        """
+        return await self._with_timeout(
+            self._get_resource_list("pokemon", limit, offset), timeout
+        )
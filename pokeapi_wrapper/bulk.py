@@ -0,0 +1,105 @@
+"""
+Bulk loading of Pokemon payloads for the PokéAPI wrapper
+
+Decoding and hydrating a full dex is CPU-bound and held back by the GIL.
+load_pokemon_bulk spreads the work over a pool of processes in chunks;
+each chunk comes back as one pickle, in which every shared reference is
+stored once and the models are plain tuples of their slots.
+"""
+
+import gc
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+
+from .decoding import get_decoder
+from .exceptions import PokeAPIError
+from .models.pokemon import Pokemon
+
+
+@contextmanager
+def _gc_paused(pause):
+    """Pause the cyclic garbage collector for a block if pause is true"""
+    collecting = pause and gc.isenabled()
+    if collecting:
+        gc.disable()
+    try:
+        yield
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def _load_chunk(payloads, json_backend, lazy, pause_gc):
+    """Decode and hydrate a chunk of payloads"""
+    loads = get_decoder(json_backend)
+    pokemon = []
+    with _gc_paused(pause_gc):
+        for payload in payloads:
+            try:
+                data = loads(payload)
+            except ValueError as e:
+                raise PokeAPIError(f"Invalid JSON payload: {e}")
+            pokemon.append(Pokemon.from_json(data, lazy=lazy))
+    return pokemon
+
+
+def load_pokemon_bulk(
+    raw_payloads,
+    processes=None,
+    chunksize=None,
+    lazy=False,
+    json_backend=None,
+    pause_gc=False,
+):
+    """
+    Decode and hydrate many Pokemon payloads in parallel
+
+    The models hold no reference cycles, so collecting during such a large
+    allocation burst only burns time. The worker processes belong to the
+    loader and always build their chunks with the cyclic garbage collector
+    paused. The calling process is left alone unless pause_gc is set, since
+    pausing it affects every thread of the process.
+
+    Args:
+        raw_payloads: Iterable of Pokemon JSON bodies as bytes or str
+        processes: Number of worker processes; 1 loads everything in the
+            calling process (default: os.cpu_count())
+        chunksize: Number of payloads sent to a worker at a time
+            (default: about four chunks per process)
+        lazy: Whether the Pokemon keep their lazy fields as raw JSON
+            until first accessed (default: False)
+        json_backend: JSON decoder to use, "orjson", "msgspec" or "json"
+            (default: the fastest one installed)
+        pause_gc: Whether to also pause the garbage collector of the
+            calling process while it builds or unpickles the models
+            (default: False)
+
+    Returns:
+        List of Pokemon in the same order as raw_payloads
+
+    Raises:
+        PokeAPIError: If a payload is not valid JSON
+    """
+    payloads = list(raw_payloads)
+    if not payloads:
+        return []
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(payloads)))
+    if chunksize is None:
+        chunksize = math.ceil(len(payloads) / (processes * 4))
+
+    if processes == 1:
+        return _load_chunk(payloads, json_backend, lazy, pause_gc)
+    chunks = [
+        payloads[start : start + chunksize]
+        for start in range(0, len(payloads), chunksize)
+    ]
+    with _gc_paused(pause_gc), ProcessPoolExecutor(max_workers=processes) as executor:
+        results = executor.map(
+            _load_chunk, chunks, repeat(json_backend), repeat(lazy), repeat(True)
+        )
+        return [pokemon for chunk in results for pokemon in chunk]
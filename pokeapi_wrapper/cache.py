@@ -0,0 +1,172 @@
+"""
+In-memory resource cache for the PokéAPI wrapper
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from .exceptions import InvalidParameterError
+
+MISSING = object()
+
+
+class ResourceCache:
+    """
+    Bounded, thread-safe LRU cache for API resources
+
+    Entries are keyed by (resource_type, id) so that a name and a numeric ID
+    of the same resource share one entry. The cache holds either the raw
+    JSON payloads or the hydrated models, evicts the least recently used
+    entries once the entry or byte budget is exceeded and expires entries
+    after a per-resource-type time to live.
+    """
+
+    STORES = ("json", "model")
+
+    def __init__(self, max_entries=1024, max_bytes=None, ttl=None, store="json"):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum number of entries (None for no limit)
+            max_bytes: Maximum total size of the cached response bodies in
+                bytes (None for no limit)
+            ttl: Time to live in seconds, either a number applied to every
+                resource type or a dictionary mapping resource types to
+                seconds; the "default" key applies to unlisted types
+                (default: entries never expire)
+            store: "json" to cache raw payloads or "model" to cache the
+                hydrated models
+
+        Raises:
+            InvalidParameterError: If store is not a supported value
+        """
+        if store not in self.STORES:
+            raise InvalidParameterError(
+                f"store must be one of {', '.join(self.STORES)}, not {store!r}"
+            )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _ttl_for(self, resource_type):
+        if isinstance(self.ttl, dict):
+            return self.ttl.get(resource_type, self.ttl.get("default"))
+        return self.ttl
+
+    def get(self, key):
+        """
+        Get a cached value
+
+        Args:
+            key: Tuple of (resource_type, id)
+
+        Returns:
+            The cached value, or MISSING if it is absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            value, size, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.total_bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, size=0):
+        """
+        Store a value, evicting least recently used entries if needed
+
+        Args:
+            key: Tuple of (resource_type, id)
+            value: Payload or model to cache
+            size: Size of the response body in bytes
+        """
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        ttl = self._ttl_for(key[0])
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous[1]
+            self._entries[key] = (value, size, expires_at)
+            self.total_bytes += size
+
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+            ):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+
+    def invalidate(self, key):
+        """
+        Remove one entry
+
+        Args:
+            key: Tuple of (resource_type, id)
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self.total_bytes -= entry[1]
+            return True
+
+    def clear(self, resource_type=None):
+        """
+        Remove every entry, or every entry of one resource type
+
+        Args:
+            resource_type: Type of resource to remove (default: all types)
+        """
+        with self._lock:
+            if resource_type is None:
+                self._entries.clear()
+                self.total_bytes = 0
+                return
+            for key in [key for key in self._entries if key[0] == resource_type]:
+                self.total_bytes -= self._entries.pop(key)[1]
+
+    def stats(self):
+        """
+        Get the cache counters
+
+        Returns:
+            Dictionary with hits, misses, evictions, expirations, entries
+            and bytes
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,100 @@
+"""
+Command line interface for the PokéAPI wrapper
+
+Usage:
+    pokeapi-wrapper sync DATABASE [--type pokemon] [--max-age SECONDS]
+"""
+
+import argparse
+import logging
+import sys
+
+from .api import PokeAPI
+from .exceptions import PokeAPIError
+from .mirror import Mirror
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+
+
+def _sync(args):
+    """Run the sync command"""
+    mirror = Mirror(args.database)
+    rate_limiter = RateLimiter(rate=args.rate) if args.rate else None
+    failed = 0
+    with PokeAPI(
+        base_url=args.base_url,
+        rate_limiter=rate_limiter,
+        retry_policy=RetryPolicy(),
+        mirror=mirror,
+    ) as api:
+        for resource_type in args.resource_types or ["pokemon"]:
+            try:
+                stats = api.sync(
+                    resource_type=resource_type,
+                    max_age=args.max_age,
+                    max_workers=args.workers,
+                )
+            except PokeAPIError as e:
+                print(f"{resource_type}: sync failed: {e}", file=sys.stderr)
+                failed += 1
+                continue
+            print(
+                f"{resource_type}: {stats['count']} upstream, "
+                f"{stats['fetched']} new, {stats['updated']} updated, "
+                f"{stats['revalidated']} unchanged, {stats['skipped']} fresh, "
+                f"{stats['removed']} removed, {stats['failed']} failed"
+            )
+            failed += stats["failed"]
+    mirror.close()
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    """
+    Run the command line interface
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit status
+    """
+    parser = argparse.ArgumentParser(
+        prog="pokeapi-wrapper", description="Tools for the PokéAPI wrapper"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sync = commands.add_parser(
+        "sync", help="Mirror resources into a local database for offline use"
+    )
+    sync.add_argument("database", help="Path of the mirror database")
+    sync.add_argument(
+        "--type",
+        dest="resource_types",
+        action="append",
+        metavar="TYPE",
+        help="Resource type to mirror, may be repeated (default: pokemon)",
+    )
+    sync.add_argument(
+        "--max-age",
+        type=float,
+        default=86400,
+        help="Seconds after which mirrored resources are revalidated "
+        "(default: 86400)",
+    )
+    sync.add_argument(
+        "--workers", type=int, default=8, help="Concurrent requests (default: 8)"
+    )
+    sync.add_argument(
+        "--rate", type=float, help="Maximum requests per second (default: no limit)"
+    )
+    sync.add_argument("--base-url", help="Root URL of the API")
+    sync.set_defaults(run=_sync)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
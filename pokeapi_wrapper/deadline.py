@@ -0,0 +1,89 @@
+"""
+Per-call deadlines for the PokéAPI wrapper
+
+A public client method called with a timeout runs under an absolute
+deadline held in a context variable, so every request, retry and wait made
+on its behalf, however deeply nested, draws from the same time budget.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+
+from .exceptions import DeadlineExceededError
+
+_deadline = contextvars.ContextVar("pokeapi_wrapper_deadline", default=None)
+
+
+def deadline_after(timeout):
+    """
+    Get the deadline a timeout ends at
+
+    Args:
+        timeout: Seconds from now, or None
+
+    Returns:
+        Monotonic deadline, or None if timeout is None
+    """
+    return None if timeout is None else time.monotonic() + timeout
+
+
+@contextmanager
+def deadline_scope(deadline):
+    """
+    Run a block under a deadline
+
+    Nested scopes keep the earlier of the two deadlines.
+
+    Args:
+        deadline: Monotonic deadline, or None for no deadline
+    """
+    current = _deadline.get()
+    if deadline is None or (current is not None and current <= deadline):
+        yield
+        return
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def run_with_deadline(deadline, function, *args):
+    """
+    Call function(*args) under a deadline, e.g. in a worker thread
+
+    Args:
+        deadline: Monotonic deadline, or None for no deadline
+        function: Callable to run
+        *args: Arguments passed to function
+
+    Returns:
+        The result of the call
+    """
+    with deadline_scope(deadline):
+        return function(*args)
+
+
+def current_deadline():
+    """Get the deadline of the current scope, or None"""
+    return _deadline.get()
+
+
+def remaining():
+    """
+    Get the time left before the current deadline
+
+    Returns:
+        Seconds left, or None if there is no deadline
+
+    Raises:
+        DeadlineExceededError: If the deadline has passed
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceededError("Deadline exceeded")
+    return left
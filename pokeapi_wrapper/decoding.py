@@ -0,0 +1,89 @@
+"""
+JSON decoding backends for the PokéAPI wrapper
+
+Response bodies are decoded straight from bytes with the fastest available
+backend: orjson, then msgspec, then the standard library.
+"""
+
+import json
+
+from .exceptions import InvalidParameterError
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _orjson_decoder():
+    import orjson
+
+    # orjson.JSONDecodeError is a ValueError subclass
+    return orjson.loads
+
+
+def _msgspec_decoder():
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+
+    def decode(body):
+        try:
+            return decoder.decode(body)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return decode
+
+
+def _json_decoder():
+    return json.loads
+
+
+_FACTORIES = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": _json_decoder,
+}
+
+
+def get_decoder(backend=None):
+    """
+    Get a JSON decoding function
+
+    Args:
+        backend: "orjson", "msgspec" or "json", or None to pick the first
+            one that is installed
+
+    Returns:
+        Callable decoding bytes or str, raising ValueError on invalid JSON
+
+    Raises:
+        InvalidParameterError: If backend is not a known backend
+        ImportError: If the requested backend is not installed
+    """
+    if backend is None:
+        for name in BACKENDS:
+            try:
+                return _FACTORIES[name]()
+            except ImportError:
+                continue
+    if backend not in _FACTORIES:
+        raise InvalidParameterError(
+            f"JSON backend must be one of {', '.join(BACKENDS)}, not {backend!r}"
+        )
+    return _FACTORIES[backend]()
+
+
+def available_backends():
+    """
+    Get the JSON backends that are installed
+
+    Returns:
+        List of backend names in order of preference
+    """
+    available = []
+    for name in BACKENDS:
+        try:
+            _FACTORIES[name]()
+        except ImportError:
+            continue
+        available.append(name)
+    return available
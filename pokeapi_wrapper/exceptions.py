@@ -16,12 +16,25 @@ class InvalidParameterError(PokeAPIError):
 
 class RateLimitError(PokeAPIError):
     """Exception raised when the API rate limit is exceeded"""
-    pass
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        # Seconds the server asked to wait before retrying, if it said so
+        self.retry_after = retry_after
 
 class NetworkError(PokeAPIError):
     """Exception raised when there's a network error"""
     pass
 
+class CircuitOpenError(NetworkError):
+    """Exception raised when requests to a failing host are short-circuited"""
+    def __init__(self, message, host=None):
+        super().__init__(message)
+        self.host = host
+
+class DeadlineExceededError(NetworkError):
+    """Exception raised when a call runs out of its time budget"""
+    pass
+
 class ParsingError(PokeAPIError):
     """Exception raised when there's an error parsing the API response"""
     pass 
\ No newline at end of file
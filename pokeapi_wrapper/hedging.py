@@ -0,0 +1,118 @@
+"""
+Request hedging for the PokéAPI wrapper
+"""
+
+import threading
+from collections import deque
+
+
+class LatencyTracker:
+    """Ring buffer of the most recent request latencies"""
+
+    def __init__(self, size=256):
+        """
+        Initialize the tracker
+
+        Args:
+            size: Number of latencies kept
+        """
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        """Record the latency of a successful request"""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percent):
+        """
+        Get a percentile of the recorded latencies
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or None if nothing was recorded
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * percent / 100))
+        return samples[index]
+
+    def __len__(self):
+        return len(self._samples)
+
+
+class HedgePolicy:
+    """
+    Policy for hedged requests
+
+    Once ``min_samples`` latencies have been observed, a request that has
+    not answered after the ``percentile``-th latency of the recent ones is
+    sent a second time. The first successful response wins and the other
+    request is cancelled or its response discarded. Each hedge costs one
+    extra request, so with the default 95th percentile about 5% of
+    requests are duplicated.
+    """
+
+    def __init__(self, percentile=95, min_samples=20, min_delay=0.005, window=256):
+        """
+        Initialize the policy
+
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            min_samples: Latencies to observe before hedging starts
+            min_delay: Shortest wait in seconds before a hedge
+            window: Number of recent latencies the percentile is taken over
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.latencies = LatencyTracker(window)
+        self.hedged_requests = 0
+        self.hedges_won = 0
+        self._lock = threading.Lock()
+
+    def delay(self):
+        """
+        Get how long to wait for a response before hedging
+
+        Returns:
+            Seconds to wait, or None while too few latencies are known
+        """
+        if len(self.latencies) < self.min_samples:
+            return None
+        return max(self.min_delay, self.latencies.percentile(self.percentile))
+
+    def record(self, seconds):
+        """Record the latency of a successful request"""
+        self.latencies.record(seconds)
+
+    def record_hedge(self, won):
+        """
+        Record a hedged request
+
+        Args:
+            won: Whether the hedge answered before the original request
+        """
+        with self._lock:
+            self.hedged_requests += 1
+            if won:
+                self.hedges_won += 1
+
+    def stats(self):
+        """
+        Get the hedging counters
+
+        Returns:
+            Dictionary with hedged_requests, hedges_won and the current
+            hedge delay in seconds (None while hedging is not active)
+        """
+        with self._lock:
+            return {
+                "hedged_requests": self.hedged_requests,
+                "hedges_won": self.hedges_won,
+                "delay": self.delay(),
+            }
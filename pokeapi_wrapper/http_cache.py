@@ -0,0 +1,235 @@
+"""
+Persistent HTTP response cache for the PokéAPI wrapper
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+)
+"""
+
+
+class CachedResponse:
+    """A response body stored in the HTTP cache"""
+
+    def __init__(self, body, etag=None, last_modified=None, stored_at=None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    def validators(self):
+        """
+        Get the conditional request headers for revalidating this response
+
+        Returns:
+            Dictionary of If-None-Match / If-Modified-Since headers
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """
+    SQLite-backed HTTP response cache shared across processes
+
+    Responses are keyed by the normalized URL and query parameters. Fresh
+    entries are served without contacting the API; stale entries are
+    revalidated with If-None-Match / If-Modified-Since so that a 304 reuses
+    the stored body. Once the stored bodies exceed max_bytes the least
+    recently used entries are evicted.
+    """
+
+    def __init__(self, path, ttl=86400, max_bytes=None):
+        """
+        Initialize the cache
+
+        Args:
+            path: Path of the SQLite database file
+            ttl: Seconds an entry is served without revalidation (None for
+                never, 0 to always revalidate) (default: one day)
+            max_bytes: Maximum total size of the stored bodies in bytes
+                (None for no limit)
+        """
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connect().execute(_SCHEMA)
+
+    def _connect(self):
+        # sqlite3 connections must not be shared between threads or processes
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def key(url, params=None):
+        """
+        Build the cache key of a request
+
+        Args:
+            url: Absolute request URL
+            params: Query parameters
+
+        Returns:
+            Normalized URL with sorted query parameters
+        """
+        parts = urlsplit(url)
+        path = parts.path.rstrip("/") or "/"
+        query = sorted((params or {}).items())
+        return urlunsplit(
+            (parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), "")
+        )
+
+    def is_fresh(self, entry):
+        """Whether an entry can be served without revalidation"""
+        if self.ttl is None:
+            return True
+        return entry.stored_at + self.ttl > time.time()
+
+    def get(self, key):
+        """
+        Get a stored response
+
+        Args:
+            key: Cache key from key()
+
+        Returns:
+            CachedResponse, or None if nothing is stored
+        """
+        connection = self._connect()
+        row = connection.execute(
+            "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        connection.execute(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+        )
+        with self._lock:
+            self.hits += 1
+        return CachedResponse(*row)
+
+    def put(self, key, body, etag=None, last_modified=None):
+        """
+        Store a response, evicting least recently used entries if needed
+
+        Args:
+            key: Cache key from key()
+            body: Response body as bytes
+            etag: ETag header of the response
+            last_modified: Last-Modified header of the response
+        """
+        if self.max_bytes is not None and len(body) > self.max_bytes:
+            return
+        now = time.time()
+        connection = self._connect()
+        connection.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(key, body, etag, last_modified, stored_at, accessed_at, size) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, body, etag, last_modified, now, now, len(body)),
+        )
+        if self.max_bytes is not None:
+            self._evict(connection)
+
+    def touch(self, key):
+        """
+        Mark a stored response as fresh after a successful revalidation
+
+        Args:
+            key: Cache key from key()
+        """
+        now = time.time()
+        self._connect().execute(
+            "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+            (now, now, key),
+        )
+        with self._lock:
+            self.revalidations += 1
+
+    def _evict(self, connection):
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        victims = []
+        rows = connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM responses WHERE key = ?", victims)
+        with self._lock:
+            self.evictions += len(victims)
+
+    def clear(self):
+        """Remove every stored response"""
+        self._connect().execute("DELETE FROM responses")
+
+    def stats(self):
+        """
+        Get the cache counters
+
+        The entry and byte totals cover every process sharing the database;
+        hits, misses, revalidations and evictions are counted per process.
+
+        Returns:
+            Dictionary with entries, bytes, hits, misses, revalidations and
+            evictions
+        """
+        entries, total = (
+            self._connect()
+            .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses")
+            .fetchone()
+        )
+        with self._lock:
+            return {
+                "entries": entries,
+                "bytes": total,
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+            }
+
+    def close(self):
+        """Close the connection of the calling thread"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -0,0 +1,438 @@
+"""
+Secondary indexes of Pokemon for the PokéAPI wrapper
+
+A PokemonIndex maps keys such as a type, an ability or a move learned in
+a version group to the sorted array of the IDs of the matching Pokemon.
+Questions like "which Pokemon learn earthquake in scarlet-violet" then
+read one or two small arrays instead of scanning every Pokemon's moves.
+
+Index files (little-endian):
+
+- header: magic, version and number of keys
+- one entry per key: key length, number of IDs, the key as UTF-8 with its
+  parts separated by U+001F, then the IDs as unsigned 32-bit integers
+"""
+
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+
+from .decoding import get_decoder
+from .exceptions import ParsingError
+from .models.pokemon import Pokemon
+
+MAGIC = b"PKMNINDX"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sII")
+_ENTRY = struct.Struct("<HI")
+_SEPARATOR = "\x1f"
+_TYPECODE = "I"
+
+# Key of the posting listing every indexed Pokemon
+_ALL = ("pokemon",)
+
+
+def intersection(*postings):
+    """
+    Get the IDs present in every posting
+
+    Args:
+        *postings: Sorted arrays of IDs
+
+    Returns:
+        Sorted array of IDs
+    """
+    if not postings:
+        return array(_TYPECODE)
+    smallest = min(postings, key=len)
+    common = set(smallest)
+    for posting in postings:
+        if posting is not smallest:
+            common.intersection_update(posting)
+    return array(_TYPECODE, sorted(common))
+
+
+def union(*postings):
+    """
+    Get the IDs present in any posting
+
+    Args:
+        *postings: Sorted arrays of IDs
+
+    Returns:
+        Sorted array of IDs
+    """
+    if len(postings) == 1:
+        return array(_TYPECODE, postings[0])
+    return array(_TYPECODE, sorted(set().union(*postings)))
+
+
+def index_keys(pokemon):
+    """
+    Get the keys a Pokemon is indexed under
+
+    Args:
+        pokemon: Pokemon, or an object with the same fields such as a
+            snapshot view
+
+    Returns:
+        Set of key tuples: ("type", name), ("ability", name), ("move",
+        name), ("version_group", name), ("learn_method", name) and
+        ("learn", move, version_group, learn_method)
+    """
+    keys = {_ALL}
+    for t in pokemon.types:
+        if t.type is not None:
+            keys.add(("type", t.type.name))
+    for a in pokemon.abilities:
+        if a.ability is not None:
+            keys.add(("ability", a.ability.name))
+    for move in pokemon.moves:
+        if move.move is None:
+            continue
+        name = move.move.name
+        keys.add(("move", name))
+        for detail in move.version_group_details:
+            group = detail.version_group
+            method = detail.move_learn_method
+            if group is not None:
+                keys.add(("version_group", group.name))
+            if method is not None:
+                keys.add(("learn_method", method.name))
+            if group is not None and method is not None:
+                keys.add(("learn", name, group.name, method.name))
+    return keys
+
+
+def _names(value):
+    """Normalize a name or iterable of names to a set, None if not given"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return {value}
+    return set(value)
+
+
+class PokemonIndex:
+    """
+    Inverted indexes of Pokemon by type, ability, move and learnset
+
+    Every key maps to a sorted array of Pokemon IDs, so an index of the
+    whole dex stays small and loads from disk in a few milliseconds.
+    Queries combine the arrays with set intersections and unions, and
+    ``update`` re-indexes a single Pokemon when it changes, e.g. after a
+    sync, without rebuilding the rest.
+
+    Build an index from Pokemon models, from snapshot views, or from a
+    Mirror with ``PokemonIndex.from_mirror``; ``save`` and ``load`` keep
+    it on disk.
+    """
+
+    def __init__(self, pokemon=()):
+        """
+        Initialize the index
+
+        Args:
+            pokemon: Iterable of Pokemon, or of objects with the same
+                fields such as snapshot views; a later Pokemon replaces an
+                earlier one with the same ID
+        """
+        keys_by_id = {p.id: index_keys(p) for p in pokemon}
+        ids_by_key = {}
+        for pokemon_id, keys in keys_by_id.items():
+            for key in keys:
+                ids_by_key.setdefault(key, []).append(pokemon_id)
+        self._postings = {
+            key: array(_TYPECODE, sorted(ids)) for key, ids in ids_by_key.items()
+        }
+        self._keys_by_id = keys_by_id
+        self._learn_keys = {}
+        for key in self._postings:
+            if key[0] == "learn":
+                self._learn_keys.setdefault(key[1], set()).add(key)
+
+    @classmethod
+    def from_mirror(cls, mirror, json_backend=None):
+        """
+        Build an index of every Pokemon stored in a mirror
+
+        Args:
+            mirror: Mirror filled by PokeAPI.sync
+            json_backend: JSON decoder to use, "orjson", "msgspec" or
+                "json" (default: the fastest one installed)
+
+        Returns:
+            PokemonIndex
+        """
+        loads = get_decoder(json_backend)
+        return cls(
+            Pokemon.from_json(loads(body), lazy=True)
+            for body in mirror.bodies("pokemon")
+        )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an index saved with save
+
+        Args:
+            path: Path of the index file
+
+        Returns:
+            PokemonIndex
+
+        Raises:
+            ParsingError: If the file is not an index of this version
+        """
+        path = os.fspath(path)
+        with open(path, "rb") as f:
+            data = memoryview(f.read())
+        try:
+            magic, version, key_count = _HEADER.unpack_from(data, 0)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != VERSION:
+            raise ParsingError(f"Not a version {VERSION} index: {path}")
+
+        index = cls()
+        postings = index._postings
+        position = _HEADER.size
+        try:
+            for _ in range(key_count):
+                key_size, id_count = _ENTRY.unpack_from(data, position)
+                position += _ENTRY.size
+                key = str(data[position : position + key_size], "utf-8")
+                position += key_size
+                posting = array(_TYPECODE)
+                posting.frombytes(data[position : position + id_count * 4])
+                position += id_count * 4
+                if len(posting) != id_count:
+                    raise struct.error("truncated postings")
+                postings[tuple(key.split(_SEPARATOR))] = posting
+        except (struct.error, ValueError):
+            raise ParsingError(f"Corrupt index file: {path}")
+        if sys.byteorder == "big":
+            for posting in postings.values():
+                posting.byteswap()
+        for key in postings:
+            if key[0] == "learn":
+                index._learn_keys.setdefault(key[1], set()).add(key)
+        # Not kept for loaded indexes, so loading stays cheap
+        index._keys_by_id = None
+        return index
+
+    def save(self, path):
+        """
+        Write the index to a file
+
+        The file is written to a temporary name first and then moved into
+        place, so readers never see a partial index.
+
+        Args:
+            path: Path of the index file
+        """
+        path = os.fspath(path)
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(MAGIC, VERSION, len(self._postings)))
+                for key, posting in self._postings.items():
+                    encoded = _SEPARATOR.join(key).encode("utf-8")
+                    if sys.byteorder == "big":
+                        posting = array(_TYPECODE, posting)
+                        posting.byteswap()
+                    f.write(_ENTRY.pack(len(encoded), len(posting)))
+                    f.write(encoded)
+                    f.write(posting.tobytes())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def __len__(self):
+        return len(self._postings.get(_ALL, ()))
+
+    def __contains__(self, pokemon_id):
+        posting = self._postings.get(_ALL, ())
+        position = bisect_left(posting, pokemon_id)
+        return position < len(posting) and posting[position] == pokemon_id
+
+    def __repr__(self):
+        return f"PokemonIndex({len(self)} Pokemon, {len(self._postings)} keys)"
+
+    def get(self, *key):
+        """
+        Get the IDs of the Pokemon indexed under a key
+
+        Args:
+            *key: Key parts, e.g. ("type", "fire") or ("learn",
+                "earthquake", "scarlet-violet", "machine")
+
+        Returns:
+            Sorted array of IDs (a copy), empty if the key is unknown
+        """
+        return array(_TYPECODE, self._postings.get(key, ()))
+
+    def names(self, kind):
+        """
+        Get the names indexed under a kind of key
+
+        Args:
+            kind: "type", "ability", "move", "version_group" or
+                "learn_method"
+
+        Returns:
+            Sorted list of names
+        """
+        return sorted(key[1] for key in self._postings if key[0] == kind)
+
+    def learners(self, move, version_group=None, method=None):
+        """
+        Get the Pokemon learning a move
+
+        Args:
+            move: Name of the move
+            version_group: Name or names of version groups the move must be
+                learned in (default: any)
+            method: Name or names of learn methods, e.g. "level-up" or
+                "machine" (default: any)
+
+        Returns:
+            Sorted array of IDs
+        """
+        groups = _names(version_group)
+        methods = _names(method)
+        if groups is None and methods is None:
+            return self.get("move", move)
+        postings = [
+            self._postings[key]
+            for key in self._learn_keys.get(move, ())
+            if (groups is None or key[2] in groups)
+            and (methods is None or key[3] in methods)
+        ]
+        return union(*postings) if postings else array(_TYPECODE)
+
+    def query(
+        self, type=None, ability=None, move=None, version_group=None, method=None
+    ):
+        """
+        Get the Pokemon matching every given condition
+
+        Each condition is a name, or a list of names of which any may
+        match. With a move, version_group and method apply to how that move
+        is learned; without one, they match Pokemon learning any move in
+        those version groups or with those methods.
+
+        Args:
+            type: Type name or names
+            ability: Ability name or names
+            move: Move name or names
+            version_group: Version group name or names
+            method: Learn method name or names
+
+        Returns:
+            Sorted array of IDs; every indexed Pokemon if no condition is
+            given
+        """
+        parts = []
+        for kind, value in (("type", type), ("ability", ability)):
+            names = _names(value)
+            if names is not None:
+                parts.append(self._any(kind, names))
+        moves = _names(move)
+        if moves is not None:
+            parts.append(
+                union(*(self.learners(name, version_group, method) for name in moves))
+                if moves
+                else array(_TYPECODE)
+            )
+        else:
+            for kind, value in (
+                ("version_group", version_group),
+                ("learn_method", method),
+            ):
+                names = _names(value)
+                if names is not None:
+                    parts.append(self._any(kind, names))
+        if not parts:
+            return self.get(*_ALL)
+        return intersection(*parts)
+
+    def _any(self, kind, names):
+        postings = [
+            self._postings[(kind, name)]
+            for name in names
+            if (kind, name) in self._postings
+        ]
+        return union(*postings) if postings else array(_TYPECODE)
+
+    def update(self, pokemon):
+        """
+        Index a new or changed Pokemon in place
+
+        Only the keys the Pokemon gained or lost are touched.
+
+        Args:
+            pokemon: Pokemon, or an object with the same fields
+        """
+        new = index_keys(pokemon)
+        old = self._keys_of(pokemon.id)
+        for key in old - new:
+            self._discard(key, pokemon.id)
+        for key in new - old:
+            self._insert(key, pokemon.id)
+        if self._keys_by_id is not None:
+            self._keys_by_id[pokemon.id] = new
+
+    def remove(self, pokemon_id):
+        """
+        Remove a Pokemon from the index
+
+        Args:
+            pokemon_id: ID of the Pokemon; unknown IDs are ignored
+        """
+        for key in self._keys_of(pokemon_id):
+            self._discard(key, pokemon_id)
+        if self._keys_by_id is not None:
+            self._keys_by_id.pop(pokemon_id, None)
+
+    def _keys_of(self, pokemon_id):
+        """Get the keys a Pokemon is currently indexed under"""
+        if self._keys_by_id is not None:
+            return self._keys_by_id.get(pokemon_id, set())
+        # A loaded index has no per-Pokemon keys; search the postings
+        keys = set()
+        for key, posting in self._postings.items():
+            position = bisect_left(posting, pokemon_id)
+            if position < len(posting) and posting[position] == pokemon_id:
+                keys.add(key)
+        return keys
+
+    def _insert(self, key, pokemon_id):
+        posting = self._postings.get(key)
+        if posting is None:
+            posting = self._postings[key] = array(_TYPECODE)
+            if key[0] == "learn":
+                self._learn_keys.setdefault(key[1], set()).add(key)
+        position = bisect_left(posting, pokemon_id)
+        if position == len(posting) or posting[position] != pokemon_id:
+            posting.insert(position, pokemon_id)
+
+    def _discard(self, key, pokemon_id):
+        posting = self._postings.get(key)
+        if posting is None:
+            return
+        position = bisect_left(posting, pokemon_id)
+        if position < len(posting) and posting[position] == pokemon_id:
+            del posting[position]
+        if not posting:
+            del self._postings[key]
+            if key[0] == "learn":
+                self._learn_keys[key[1]].discard(key)
+                if not self._learn_keys[key[1]]:
+                    del self._learn_keys[key[1]]
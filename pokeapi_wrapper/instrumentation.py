@@ -0,0 +1,554 @@
+"""
+Request lifecycle instrumentation for the PokéAPI wrapper
+
+A client built with ``hooks=`` calls the hooks at each step of a lookup:
+
+- ``on_cache_hit`` / ``on_cache_miss``: memory or disk cache lookups
+- ``on_request_start`` / ``on_request_end``: each HTTP request sent,
+  hedged duplicates and retries included
+- ``on_retry``: a failed request about to be sent again
+- ``on_decode``: JSON decoding of a response body
+- ``on_hydrate``: building a model from decoded JSON
+
+Without hooks the client skips every timing call, so instrumentation costs
+nothing unless it is switched on.
+"""
+
+import threading
+from bisect import bisect_left
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def endpoint_label(endpoint):
+    """
+    Group an endpoint with the other requests for the same kind of resource
+
+    Args:
+        endpoint: API endpoint, e.g. "pokemon/25"
+
+    Returns:
+        "pokemon/{id}" for single resources, "pokemon" for list pages
+    """
+    resource_type, _, identifier = endpoint.strip("/").partition("/")
+    return f"{resource_type}/{{id}}" if identifier else resource_type
+
+
+class Hooks:
+    """
+    Base class of client hooks; every hook does nothing
+
+    Override the hooks of interest. Hooks are called from the thread making
+    the request, so they must be thread-safe, and should return quickly.
+    """
+
+    def on_request_start(self, endpoint):
+        """
+        Called before an HTTP request is sent
+
+        Args:
+            endpoint: API endpoint, e.g. "pokemon/25"
+        """
+
+    def on_request_end(self, endpoint, status, seconds, wait, size):
+        """
+        Called once an HTTP request has completed or failed
+
+        Args:
+            endpoint: API endpoint, e.g. "pokemon/25"
+            status: HTTP status code, or None if no response arrived
+            seconds: Total time of the request
+            wait: Time until the response headers arrived, connecting
+                included, or None if no response arrived; the body
+                download took seconds - wait
+            size: Size of the response body in bytes
+        """
+
+    def on_retry(self, endpoint, attempt, delay, error):
+        """
+        Called before a failed request is sent again
+
+        Args:
+            endpoint: API endpoint, e.g. "pokemon/25"
+            attempt: Number of attempts made so far
+            delay: Seconds waited before the next attempt
+            error: PokeAPIError raised by the last attempt
+        """
+
+    def on_decode(self, endpoint, seconds, size):
+        """
+        Called after a response body has been decoded
+
+        Args:
+            endpoint: API endpoint, e.g. "pokemon/25"
+            seconds: Time spent decoding
+            size: Size of the body in bytes
+        """
+
+    def on_hydrate(self, model, seconds):
+        """
+        Called after a model has been built from decoded JSON
+
+        Args:
+            model: Name of the model class, e.g. "Pokemon"
+            seconds: Time spent building the model
+        """
+
+    def on_cache_hit(self, layer, key):
+        """
+        Called when a cache lookup finds the resource
+
+        Args:
+            layer: "memory" for the ResourceCache, "disk" for the HTTPCache,
+                "mirror" for the Mirror
+            key: Key that was looked up
+        """
+
+    def on_cache_miss(self, layer, key):
+        """
+        Called when a cache lookup does not find a usable resource
+
+        Args:
+            layer: "memory" for the ResourceCache, "disk" for the HTTPCache,
+                "mirror" for the Mirror
+            key: Key that was looked up
+        """
+
+
+class CompositeHooks(Hooks):
+    """Hooks forwarding every call to several hooks in order"""
+
+    def __init__(self, hooks):
+        """
+        Initialize the composite
+
+        Args:
+            hooks: Iterable of Hooks
+        """
+        self.hooks = list(hooks)
+
+    def on_request_start(self, endpoint):
+        for hooks in self.hooks:
+            hooks.on_request_start(endpoint)
+
+    def on_request_end(self, endpoint, status, seconds, wait, size):
+        for hooks in self.hooks:
+            hooks.on_request_end(endpoint, status, seconds, wait, size)
+
+    def on_retry(self, endpoint, attempt, delay, error):
+        for hooks in self.hooks:
+            hooks.on_retry(endpoint, attempt, delay, error)
+
+    def on_decode(self, endpoint, seconds, size):
+        for hooks in self.hooks:
+            hooks.on_decode(endpoint, seconds, size)
+
+    def on_hydrate(self, model, seconds):
+        for hooks in self.hooks:
+            hooks.on_hydrate(model, seconds)
+
+    def on_cache_hit(self, layer, key):
+        for hooks in self.hooks:
+            hooks.on_cache_hit(layer, key)
+
+    def on_cache_miss(self, layer, key):
+        for hooks in self.hooks:
+            hooks.on_cache_miss(layer, key)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of durations
+
+    Memory stays constant however many values are observed. Percentiles
+    are estimated by interpolating within the bucket they fall in, as
+    Prometheus' histogram_quantile does. Not thread-safe on its own.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, bounds=DEFAULT_BUCKETS):
+        """
+        Initialize the histogram
+
+        Args:
+            bounds: Increasing upper bounds of the buckets; a last bucket
+                without an upper bound is added
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        """Add a value"""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, percent):
+        """
+        Estimate a percentile of the observed values
+
+        Args:
+            percent: Percentile to estimate, between 0 and 100
+
+        Returns:
+            Estimated value, or None if nothing was observed
+        """
+        if not self.count:
+            return None
+        rank = self.count * percent / 100
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+    def cumulative(self):
+        """
+        Get the cumulative bucket counts
+
+        Returns:
+            List of (upper_bound, count of values <= upper_bound), ending
+            with (float("inf"), count)
+        """
+        total = 0
+        buckets = []
+        for bound, bucket_count in zip(self.bounds + (float("inf"),), self.counts):
+            total += bucket_count
+            buckets.append((bound, total))
+        return buckets
+
+    def summary(self):
+        """
+        Summarize the histogram
+
+        Returns:
+            Dictionary with count, mean, p50, p95, p99 and max
+        """
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class _EndpointMetrics:
+    """Request metrics of one endpoint label"""
+
+    __slots__ = ("latency", "wait", "decode", "bytes", "statuses", "retries")
+
+    def __init__(self, bounds):
+        self.latency = Histogram(bounds)
+        self.wait = Histogram(bounds)
+        self.decode = Histogram(bounds)
+        self.bytes = 0
+        self.statuses = {}
+        self.retries = 0
+
+
+class MetricsCollector(Hooks):
+    """
+    In-memory metrics gathered from the client hooks
+
+    Requests are grouped by endpoint_label(), so "pokemon/1" and
+    "pokemon/25" share the "pokemon/{id}" histograms. For each label the
+    collector keeps histograms of the request latency, the time to the
+    response headers and the decode time, plus the bytes received, the
+    count of each status (None for failed connections) and the retries.
+    Hydration times are kept per model and cache lookups per layer.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        Initialize the collector
+
+        Args:
+            buckets: Upper bounds in seconds of the histogram buckets
+        """
+        self.buckets = tuple(buckets)
+        self._endpoints = {}
+        self._hydrate = {}
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, endpoint):
+        label = endpoint_label(endpoint)
+        metrics = self._endpoints.get(label)
+        if metrics is None:
+            metrics = self._endpoints[label] = _EndpointMetrics(self.buckets)
+        return metrics
+
+    def on_request_end(self, endpoint, status, seconds, wait, size):
+        with self._lock:
+            metrics = self._endpoint(endpoint)
+            metrics.latency.observe(seconds)
+            if wait is not None:
+                metrics.wait.observe(wait)
+            metrics.bytes += size
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+
+    def on_retry(self, endpoint, attempt, delay, error):
+        with self._lock:
+            self._endpoint(endpoint).retries += 1
+
+    def on_decode(self, endpoint, seconds, size):
+        with self._lock:
+            self._endpoint(endpoint).decode.observe(seconds)
+
+    def on_hydrate(self, model, seconds):
+        with self._lock:
+            histogram = self._hydrate.get(model)
+            if histogram is None:
+                histogram = self._hydrate[model] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def on_cache_hit(self, layer, key):
+        with self._lock:
+            counts = self._cache.setdefault(layer, {"hits": 0, "misses": 0})
+            counts["hits"] += 1
+
+    def on_cache_miss(self, layer, key):
+        with self._lock:
+            counts = self._cache.setdefault(layer, {"hits": 0, "misses": 0})
+            counts["misses"] += 1
+
+    def percentile(self, endpoint, percent):
+        """
+        Estimate a request latency percentile
+
+        Args:
+            endpoint: Endpoint or endpoint label, e.g. "pokemon/25"
+            percent: Percentile to estimate, between 0 and 100
+
+        Returns:
+            Latency in seconds, or None if no request was seen
+        """
+        with self._lock:
+            metrics = self._endpoints.get(endpoint_label(endpoint))
+            return None if metrics is None else metrics.latency.percentile(percent)
+
+    def snapshot(self):
+        """
+        Get a summary of everything collected
+
+        Returns:
+            Dictionary with "endpoints" (per label: requests, bytes,
+            statuses, retries and latency, wait and decode summaries),
+            "hydrate" (per model summary) and "cache" (per layer hits and
+            misses)
+        """
+        with self._lock:
+            return {
+                "endpoints": {
+                    label: {
+                        "requests": metrics.latency.count,
+                        "bytes": metrics.bytes,
+                        "statuses": dict(metrics.statuses),
+                        "retries": metrics.retries,
+                        "latency": metrics.latency.summary(),
+                        "wait": metrics.wait.summary(),
+                        "decode": metrics.decode.summary(),
+                    }
+                    for label, metrics in self._endpoints.items()
+                },
+                "hydrate": {
+                    model: histogram.summary()
+                    for model, histogram in self._hydrate.items()
+                },
+                "cache": {layer: dict(counts) for layer, counts in self._cache.items()},
+            }
+
+    def reset(self):
+        """Forget everything collected so far"""
+        with self._lock:
+            self._endpoints.clear()
+            self._hydrate.clear()
+            self._cache.clear()
+
+    def render_prometheus(self, prefix="pokeapi"):
+        """
+        Render the metrics in the Prometheus text exposition format
+
+        Args:
+            prefix: Prefix of every metric name
+
+        Returns:
+            Exposition text, e.g. to serve from a /metrics endpoint
+        """
+        lines = []
+
+        def histogram(name, help_text, label, histograms):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for value, data in histograms:
+                labels = f'{label}="{value}"'
+                for bound, count in data.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(
+                        f'{prefix}_{name}_bucket{{{labels},le="{le}"}} {count}'
+                    )
+                lines.append(f"{prefix}_{name}_sum{{{labels}}} {data.sum!r}")
+                lines.append(f"{prefix}_{name}_count{{{labels}}} {data.count}")
+
+        def counter(name, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}{{{labels}}} {value}")
+
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            histogram(
+                "request_duration_seconds",
+                "HTTP request latency",
+                "endpoint",
+                [(label, metrics.latency) for label, metrics in endpoints],
+            )
+            histogram(
+                "response_wait_seconds",
+                "Time until the response headers arrived",
+                "endpoint",
+                [(label, metrics.wait) for label, metrics in endpoints],
+            )
+            histogram(
+                "decode_duration_seconds",
+                "JSON decoding time",
+                "endpoint",
+                [(label, metrics.decode) for label, metrics in endpoints],
+            )
+            histogram(
+                "hydrate_duration_seconds",
+                "Model building time",
+                "model",
+                sorted(self._hydrate.items()),
+            )
+            counter(
+                "responses_total",
+                "HTTP responses by status",
+                [
+                    (f'endpoint="{label}",status="{status or "error"}"', count)
+                    for label, metrics in endpoints
+                    for status, count in metrics.statuses.items()
+                ],
+            )
+            counter(
+                "response_bytes_total",
+                "Bytes of response bodies received",
+                [
+                    (f'endpoint="{label}"', metrics.bytes)
+                    for label, metrics in endpoints
+                ],
+            )
+            counter(
+                "retries_total",
+                "Requests sent again after a failure",
+                [
+                    (f'endpoint="{label}"', metrics.retries)
+                    for label, metrics in endpoints
+                ],
+            )
+            counter(
+                "cache_lookups_total",
+                "Cache lookups by layer and result",
+                [
+                    (f'layer="{layer}",result="{result}"', counts[key])
+                    for layer, counts in sorted(self._cache.items())
+                    for result, key in (("hit", "hits"), ("miss", "misses"))
+                ],
+            )
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHooks(Hooks):
+    """
+    Hooks recording into OpenTelemetry instruments
+
+    Takes any meter with the OpenTelemetry metrics API, e.g.
+    ``opentelemetry.metrics.get_meter("pokeapi_wrapper")``; this module
+    does not import OpenTelemetry itself.
+    """
+
+    def __init__(self, meter, prefix="pokeapi"):
+        """
+        Initialize the hooks and create their instruments
+
+        Args:
+            meter: OpenTelemetry Meter
+            prefix: Prefix of every instrument name
+        """
+        self.request_duration = meter.create_histogram(
+            f"{prefix}.request.duration", unit="s", description="HTTP request latency"
+        )
+        self.response_wait = meter.create_histogram(
+            f"{prefix}.response.wait",
+            unit="s",
+            description="Time until the response headers arrived",
+        )
+        self.response_size = meter.create_histogram(
+            f"{prefix}.response.size", unit="By", description="Response body size"
+        )
+        self.decode_duration = meter.create_histogram(
+            f"{prefix}.decode.duration", unit="s", description="JSON decoding time"
+        )
+        self.hydrate_duration = meter.create_histogram(
+            f"{prefix}.hydrate.duration", unit="s", description="Model building time"
+        )
+        self.retries = meter.create_counter(
+            f"{prefix}.retries", description="Requests sent again after a failure"
+        )
+        self.cache_lookups = meter.create_counter(
+            f"{prefix}.cache.lookups", description="Cache lookups by layer and result"
+        )
+
+    def on_request_end(self, endpoint, status, seconds, wait, size):
+        attributes = {"endpoint": endpoint_label(endpoint), "status": status or 0}
+        self.request_duration.record(seconds, attributes)
+        if wait is not None:
+            self.response_wait.record(wait, attributes)
+            self.response_size.record(size, attributes)
+
+    def on_retry(self, endpoint, attempt, delay, error):
+        self.retries.add(1, {"endpoint": endpoint_label(endpoint)})
+
+    def on_decode(self, endpoint, seconds, size):
+        self.decode_duration.record(seconds, {"endpoint": endpoint_label(endpoint)})
+
+    def on_hydrate(self, model, seconds):
+        self.hydrate_duration.record(seconds, {"model": model})
+
+    def on_cache_hit(self, layer, key):
+        self.cache_lookups.add(1, {"layer": layer, "result": "hit"})
+
+    def on_cache_miss(self, layer, key):
+        self.cache_lookups.add(1, {"layer": layer, "result": "miss"})
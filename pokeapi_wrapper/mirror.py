@@ -0,0 +1,295 @@
+"""
+Offline mirror of API resources for the PokéAPI wrapper
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    resource_type TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (resource_type, id)
+);
+CREATE INDEX IF NOT EXISTS resources_by_name ON resources (resource_type, name);
+CREATE TABLE IF NOT EXISTS listings (
+    resource_type TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+class MirrorEntry:
+    """Sync state of a mirrored resource"""
+
+    __slots__ = ("etag", "last_modified", "synced_at")
+
+    def __init__(self, etag=None, last_modified=None, synced_at=None):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.synced_at = synced_at
+
+    def validators(self):
+        """
+        Get the conditional request headers for revalidating this resource
+
+        Returns:
+            Dictionary of If-None-Match / If-Modified-Since headers
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class Mirror:
+    """
+    SQLite-backed local copy of whole resource types
+
+    The mirror is filled and kept up to date by PokeAPI.sync, which stores
+    the raw response bodies with their validators so that later syncs only
+    revalidate. A client built with ``mirror=`` answers lookups from it,
+    and with ``offline=True`` never falls back to the network. The
+    database can be shared between threads and processes.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize the mirror
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = os.fspath(path)
+        self._local = threading.local()
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self):
+        # sqlite3 connections must not be shared between threads or processes
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, resource_type, identifier):
+        """
+        Get the body of a mirrored resource
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            identifier: Name or ID of the resource
+
+        Returns:
+            JSON body as bytes, or None if the resource is not mirrored
+        """
+        if isinstance(identifier, str):
+            identifier = identifier.strip().lower()
+            if identifier.isdigit():
+                identifier = int(identifier)
+        column = "id" if isinstance(identifier, int) else "name"
+        row = (
+            self._connect()
+            .execute(
+                f"SELECT body FROM resources WHERE resource_type = ? AND {column} = ?",
+                (resource_type, identifier),
+            )
+            .fetchone()
+        )
+        return None if row is None else row[0]
+
+    def put(
+        self, resource_type, resource_id, name, body, etag=None, last_modified=None
+    ):
+        """
+        Store a resource, replacing any previous copy
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            resource_id: Numeric ID of the resource
+            name: Name of the resource
+            body: JSON body as bytes
+            etag: ETag header of the response
+            last_modified: Last-Modified header of the response
+        """
+        self._connect().execute(
+            "INSERT OR REPLACE INTO resources "
+            "(resource_type, id, name, body, etag, last_modified, synced_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (resource_type, resource_id, name, body, etag, last_modified, time.time()),
+        )
+
+    def touch(self, resource_type, resource_id):
+        """
+        Mark a resource as up to date after a successful revalidation
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            resource_id: Numeric ID of the resource
+        """
+        self._connect().execute(
+            "UPDATE resources SET synced_at = ? WHERE resource_type = ? AND id = ?",
+            (time.time(), resource_type, resource_id),
+        )
+
+    def delete(self, resource_type, resource_ids):
+        """
+        Remove resources
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            resource_ids: Iterable of numeric IDs
+        """
+        self._connect().executemany(
+            "DELETE FROM resources WHERE resource_type = ? AND id = ?",
+            [(resource_type, resource_id) for resource_id in resource_ids],
+        )
+
+    def entries(self, resource_type):
+        """
+        Get the sync state of every mirrored resource of a type
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+
+        Returns:
+            Dictionary mapping each ID to its MirrorEntry
+        """
+        rows = (
+            self._connect()
+            .execute(
+                "SELECT id, etag, last_modified, synced_at FROM resources "
+                "WHERE resource_type = ?",
+                (resource_type,),
+            )
+            .fetchall()
+        )
+        return {row[0]: MirrorEntry(*row[1:]) for row in rows}
+
+    def bodies(self, resource_type):
+        """
+        Iterate over the bodies of every mirrored resource of a type
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+
+        Returns:
+            Iterator of JSON bodies as bytes, in ID order
+        """
+        cursor = self._connect().execute(
+            "SELECT body FROM resources WHERE resource_type = ? ORDER BY id",
+            (resource_type,),
+        )
+        return (row[0] for row in cursor)
+
+    def count(self, resource_type):
+        """
+        Get the upstream count recorded by the last complete sync
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+
+        Returns:
+            Number of resources, or None if the type was never synced
+        """
+        row = (
+            self._connect()
+            .execute(
+                "SELECT count FROM listings WHERE resource_type = ?", (resource_type,)
+            )
+            .fetchone()
+        )
+        return None if row is None else row[0]
+
+    def set_count(self, resource_type, count):
+        """
+        Record the upstream count after a complete sync
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            count: Number of resources upstream
+        """
+        self._connect().execute(
+            "INSERT OR REPLACE INTO listings (resource_type, count, synced_at) "
+            "VALUES (?, ?, ?)",
+            (resource_type, count, time.time()),
+        )
+
+    def list_page(self, resource_type, limit, offset, base_url):
+        """
+        Build a list endpoint payload from the mirrored resources
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            limit: Number of results
+            offset: Offset for pagination
+            base_url: Root URL the resource URLs start with
+
+        Returns:
+            Payload shaped like the API's, with count, next, previous and
+            results
+        """
+        connection = self._connect()
+        (count,) = connection.execute(
+            "SELECT COUNT(*) FROM resources WHERE resource_type = ?", (resource_type,)
+        ).fetchone()
+        rows = connection.execute(
+            "SELECT id, name FROM resources WHERE resource_type = ? "
+            "ORDER BY id LIMIT ? OFFSET ?",
+            (resource_type, limit, offset),
+        ).fetchall()
+        root = f"{base_url}{resource_type}"
+        return {
+            "count": count,
+            "next": (
+                f"{root}?offset={offset + limit}&limit={limit}"
+                if offset + limit < count
+                else None
+            ),
+            "previous": (
+                f"{root}?offset={max(offset - limit, 0)}&limit={limit}"
+                if offset > 0
+                else None
+            ),
+            "results": [
+                {"name": name, "url": f"{root}/{resource_id}/"}
+                for resource_id, name in rows
+            ],
+        }
+
+    def stats(self):
+        """
+        Get the size of the mirror
+
+        Returns:
+            Dictionary with the number of resources of each type and the
+            total bytes stored
+        """
+        connection = self._connect()
+        rows = connection.execute(
+            "SELECT resource_type, COUNT(*) FROM resources GROUP BY resource_type"
+        ).fetchall()
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(body)), 0) FROM resources"
+        ).fetchone()
+        return {"resources": dict(rows), "bytes": total}
+
+    def close(self):
+        """Close the connection of the calling thread"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
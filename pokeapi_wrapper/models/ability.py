@@ -0,0 +1,33 @@
+"""
+Ability models for the PokéAPI wrapper
+"""
+
+from .schema import nested_list, ref, schema_model, value
+
+
+@schema_model
+class AbilityPokemon:
+    """Pokemon with an ability model"""
+
+    SCHEMA = {
+        "is_hidden": value(False),
+        "slot": value(),
+        "pokemon": ref(),
+    }
+
+
+@schema_model
+class Ability:
+    """Ability model"""
+
+    SCHEMA = {
+        "id": value(),
+        "name": value(),
+        "is_main_series": value(False),
+        "generation": ref(),
+        "names": value(factory=list),
+        "effect_entries": value(factory=list),
+        "effect_changes": value(factory=list),
+        "flavor_text_entries": value(factory=list),
+        "pokemon": nested_list(AbilityPokemon, lazy=True),
+    }
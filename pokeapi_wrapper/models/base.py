@@ -2,16 +2,80 @@
 Base models for the PokéAPI wrapper
 """
 
-class NamedAPIResource:
+from collections.abc import Mapping
+
+class NamedAPIResource(Mapping):
     """
     Named API resource model
     
-    This is used for resources that have a name and URL
+    This is used for resources that have a name and URL. Instances are
+    immutable and also behave as a read-only {"name", "url"} mapping, so
+    they can stand in for the raw reference dictionaries of the API.
     """
+    __slots__ = ("id", "name", "url")
+
+    _KEYS = ("name", "url")
+
     def __init__(self, id=None, name=None, url=None, **kwargs):
-        self.id = id
-        self.name = name
-        self.url = url
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "url", url)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getitem__(self, key):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+    def __eq__(self, other):
+        if isinstance(other, NamedAPIResource):
+            return self.name == other.name and self.url == other.url
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self):
+        return hash((self.name, self.url))
+
+    def __repr__(self):
+        return f"{type(self).__name__}(name={self.name!r}, url={self.url!r})"
+
+    def __reduce__(self):
+        return intern_resource, ({"id": self.id, "name": self.name, "url": self.url},)
+
+_interned = {}
+# The same resources keyed by URL alone, for the generated from_json fast path
+_interned_by_url = {}
+
+def intern_resource(data):
+    """
+    Get the shared NamedAPIResource for a {"name", "url"} reference
+    
+    Identical references (the same move learn method, version group, type,
+    stat, ...) repeat thousands of times across Pokemon payloads; interning
+    makes them all point to one immutable object.
+    
+    Args:
+        data: Reference dictionary, or an existing NamedAPIResource or None
+    
+    Returns:
+        NamedAPIResource shared by every identical reference
+    """
+    if not isinstance(data, dict):
+        return data
+    key = (data.get("name"), data.get("url"))
+    resource = _interned.get(key)
+    if resource is None:
+        resource = _interned.setdefault(key, NamedAPIResource(**data))
+        if key[1] is not None:
+            _interned_by_url.setdefault(key[1], resource)
+    return resource
 
 class VersionGameIndex:
     """
@@ -19,9 +83,17 @@ class VersionGameIndex:
     
     This is used for resources that have a game index in different versions
     """
+    __slots__ = ("game_index", "version")
+
     def __init__(self, game_index=None, version=None, **kwargs):
         self.game_index = game_index
-        self.version = version
+        self.version = intern_resource(version)
+
+    def __getstate__(self):
+        return (self.game_index, self.version)
+
+    def __setstate__(self, state):
+        self.game_index, self.version = state
 
 class PaginatedResponse:
     """
@@ -29,8 +101,10 @@ class PaginatedResponse:
     
     This is used for endpoints that return a paginated list of resources
     """
+    __slots__ = ("count", "next", "previous", "results")
+
     def __init__(self, count=0, next=None, previous=None, results=None):
         self.count = count
         self.next = next
         self.previous = previous
-        self.results = results or [] 
\ No newline at end of file
+        self.results = results or []
\ No newline at end of file
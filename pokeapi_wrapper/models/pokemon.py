@@ -2,292 +2,225 @@
 Pokemon models for the PokéAPI wrapper
 """
 
-from .base import NamedAPIResource, VersionGameIndex
-from ascii_magic import AsciiArt
+from .base import VersionGameIndex
+from .schema import nested, nested_list, ref, ref_list, schema_model, value
+from ..exceptions import PokeAPIError
+from ..sprites import get_sprite_cache
 
 
+@schema_model
 class PokemonAbility:
     """Pokemon ability model"""
 
-    def __init__(self, is_hidden=False, slot=None, ability=None, **kwargs):
-        self.is_hidden = is_hidden
-        self.slot = slot
-        self.ability = ability
+    SCHEMA = {
+        "is_hidden": value(False),
+        "slot": value(),
+        "ability": ref(),
+    }
 
 
+@schema_model
 class PokemonType:
     """Pokemon type model"""
 
-    def __init__(self, slot=None, type=None, **kwargs):
-        self.slot = slot
-        self.type = type
+    SCHEMA = {
+        "slot": value(),
+        "type": ref(),
+    }
 
 
+@schema_model
 class PokemonHeldItemVersion:
     """Pokemon held item version model"""
 
-    def __init__(self, version=None, rarity=None, **kwargs):
-        self.version = version
-        self.rarity = rarity
+    SCHEMA = {
+        "version": ref(),
+        "rarity": value(),
+    }
 
 
+@schema_model
 class PokemonHeldItem:
     """Pokemon held item model"""
 
-    def __init__(self, item=None, version_details=None, **kwargs):
-        self.item = item
-        self.version_details = version_details or []
+    SCHEMA = {
+        "item": ref(),
+        "version_details": nested_list(PokemonHeldItemVersion),
+    }
 
 
+@schema_model
 class PokemonMoveVersion:
     """Pokemon move version model"""
 
-    def __init__(
-        self,
-        move_learn_method=None,
-        version_group=None,
-        level_learned_at=None,
-        **kwargs,
-    ):
-        self.move_learn_method = move_learn_method
-        self.version_group = version_group
-        self.level_learned_at = level_learned_at
+    SCHEMA = {
+        "move_learn_method": ref(),
+        "version_group": ref(),
+        "level_learned_at": value(),
+    }
 
 
+@schema_model
 class PokemonMove:
     """Pokemon move model"""
 
-    def __init__(self, move=None, version_group_details=None, **kwargs):
-        self.move = move
-        self.version_group_details = version_group_details or []
+    SCHEMA = {
+        "move": ref(),
+        "version_group_details": nested_list(PokemonMoveVersion),
+    }
 
 
+@schema_model
 class PokemonStat:
     """Pokemon stat model"""
 
-    def __init__(self, stat=None, effort=None, base_stat=None, **kwargs):
-        self.stat = stat
-        self.effort = effort
-        self.base_stat = base_stat
+    SCHEMA = {
+        "stat": ref(),
+        "effort": value(),
+        "base_stat": value(),
+    }
 
 
+@schema_model
 class PokemonSprites:
     """Pokemon sprites model"""
 
-    def __init__(
-        self,
-        front_default=None,
-        front_shiny=None,
-        front_female=None,
-        front_shiny_female=None,
-        back_default=None,
-        back_shiny=None,
-        back_female=None,
-        back_shiny_female=None,
-        other=None,
-        versions=None,
-        **kwargs,
-    ):
-        self.front_default = front_default
-        self.front_shiny = front_shiny
-        self.front_female = front_female
-        self.front_shiny_female = front_shiny_female
-        self.back_default = back_default
-        self.back_shiny = back_shiny
-        self.back_female = back_female
-        self.back_shiny_female = back_shiny_female
-        self.other = other or {}
-        self.versions = versions or {}
-
-
+    SCHEMA = {
+        "front_default": value(),
+        "front_shiny": value(),
+        "front_female": value(),
+        "front_shiny_female": value(),
+        "back_default": value(),
+        "back_shiny": value(),
+        "back_female": value(),
+        "back_shiny_female": value(),
+        "other": value(factory=dict),
+        "versions": value(factory=dict),
+    }
+
+
+@schema_model
 class PokemonTypePast:
     """Pokemon type past model"""
 
-    def __init__(self, generation=None, types=None, **kwargs):
-        self.generation = generation
-        self.types = types or []
+    SCHEMA = {
+        "generation": ref(),
+        "types": nested_list(PokemonType),
+    }
 
 
+@schema_model
 class Pokemon:
-    """Pokemon model"""
-
-    def __init__(
-        self,
-        id=None,
-        name=None,
-        base_experience=None,
-        height=None,
-        is_default=False,
-        order=None,
-        weight=None,
-        abilities=None,
-        forms=None,
-        game_indices=None,
-        held_items=None,
-        location_area_encounters=None,
-        moves=None,
-        past_types=None,
-        sprites=None,
-        species=None,
-        stats=None,
-        types=None,
-        **kwargs,
+    """
+    Pokemon model
+
+    Build instances from API payloads with ``Pokemon.from_json(data)``, or
+    pass the fields as keyword arguments. With lazy=True the heavy list
+    fields (moves, held_items, game_indices and past_types) keep their raw
+    JSON and only build their model objects the first time they are
+    accessed. ``Pokemon.FIELDS`` holds the field names.
+    """
+
+    SCHEMA = {
+        "id": value(),
+        "name": value(),
+        "base_experience": value(),
+        "height": value(),
+        "is_default": value(False),
+        "order": value(),
+        "weight": value(),
+        "abilities": nested_list(PokemonAbility),
+        "forms": ref_list(),
+        "game_indices": nested_list(VersionGameIndex, lazy=True),
+        "held_items": nested_list(PokemonHeldItem, lazy=True),
+        "location_area_encounters": value(),
+        "moves": nested_list(PokemonMove, lazy=True),
+        "past_types": nested_list(PokemonTypePast, lazy=True),
+        "sprites": nested(PokemonSprites),
+        "species": ref(),
+        "stats": nested_list(PokemonStat),
+        "types": nested_list(PokemonType),
+    }
+
+    def get_sprite_url(self, shiny=False, back=False):
+        """
+        Get the URL of one of the Pokemon's sprites
+
+        Args:
+            shiny: Whether to use the shiny sprite (default: False)
+            back: Whether to use the back sprite (default: False)
+
+        Returns:
+            Sprite URL or None if the Pokemon has no such sprite
+        """
+        if not self.sprites:
+            return None
+        if back:
+            return self.sprites.back_shiny if shiny else self.sprites.back_default
+        return self.sprites.front_shiny if shiny else self.sprites.front_default
+
+    def render_ascii_sprite(
+        self, width=40, shiny=False, back=False, colored=True, cache=None
     ):
-        # Process nested objects before assigning to attributes
-        if abilities is not None:
-            abilities = (
-                [PokemonAbility(**ability) for ability in abilities]
-                if isinstance(abilities[0], dict)
-                else abilities
-            )
-
-        if types is not None:
-            types = (
-                [PokemonType(**type_data) for type_data in types]
-                if isinstance(types[0], dict)
-                else types
-            )
-
-        if stats is not None:
-            stats = (
-                [PokemonStat(**stat) for stat in stats]
-                if isinstance(stats[0], dict)
-                else stats
-            )
-
-        if moves is not None:
-            processed_moves = []
-            for move_data in moves:
-                if isinstance(move_data, dict):
-                    move_copy = dict(move_data)
-                    if (
-                        "version_group_details" in move_copy
-                        and move_copy["version_group_details"]
-                    ):
-                        move_copy["version_group_details"] = [
-                            PokemonMoveVersion(**detail)
-                            for detail in move_copy["version_group_details"]
-                        ]
-                    processed_moves.append(PokemonMove(**move_copy))
-                else:
-                    processed_moves.append(move_data)
-            moves = processed_moves
-
-        if held_items is not None:
-            processed_held_items = []
-            for item_data in held_items:
-                if isinstance(item_data, dict):
-                    item_copy = dict(item_data)
-                    if "version_details" in item_copy and item_copy["version_details"]:
-                        item_copy["version_details"] = [
-                            PokemonHeldItemVersion(**detail)
-                            for detail in item_copy["version_details"]
-                        ]
-                    processed_held_items.append(PokemonHeldItem(**item_copy))
-                else:
-                    processed_held_items.append(item_data)
-            held_items = processed_held_items
-
-        if sprites is not None and isinstance(sprites, dict):
-            sprites = PokemonSprites(**sprites)
-
-        if species is not None and isinstance(species, dict):
-            species = NamedAPIResource(**species)
-
-        if forms is not None:
-            forms = [
-                NamedAPIResource(**form) if isinstance(form, dict) else form
-                for form in forms
-            ]
-
-        if game_indices is not None:
-            game_indices = [
-                VersionGameIndex(**index) if isinstance(index, dict) else index
-                for index in game_indices
-            ]
-
-        if past_types is not None:
-            processed_past_types = []
-            for past_type_data in past_types:
-                if isinstance(past_type_data, dict):
-                    past_type_copy = dict(past_type_data)
-                    if "types" in past_type_copy:
-                        past_type_copy["types"] = [
-                            PokemonType(**t) for t in past_type_copy["types"]
-                        ]
-                    if "generation" in past_type_copy and isinstance(
-                        past_type_copy["generation"], dict
-                    ):
-                        past_type_copy["generation"] = NamedAPIResource(
-                            **past_type_copy["generation"]
-                        )
-                    processed_past_types.append(PokemonTypePast(**past_type_copy))
-                else:
-                    processed_past_types.append(past_type_data)
-            past_types = processed_past_types
-
-        # Assign all attributes
-        self.id = id
-        self.name = name
-        self.base_experience = base_experience
-        self.height = height
-        self.is_default = is_default
-        self.order = order
-        self.weight = weight
-        self.abilities = abilities or []
-        self.forms = forms or []
-        self.game_indices = game_indices or []
-        self.held_items = held_items or []
-        self.location_area_encounters = location_area_encounters
-        self.moves = moves or []
-        self.past_types = past_types or []
-        self.sprites = sprites
-        self.species = species
-        self.stats = stats or []
-        self.types = types or []
-
-    def get_ascii_sprite(self, width=40, shiny=False, back=False, colored=True):
         """
-        Get an ASCII representation of the Pokemon's sprite using ascii_magic
+        Render the Pokemon's sprite as ASCII art without printing it
+
+        The sprite image and the rendering are cached, so rendering the
+        same sprite again is nearly free.
 
         Args:
             width: Width of the ASCII art in columns (default: 40)
-            height: Height of the ASCII art in rows (default: 20)
             shiny: Whether to use the shiny sprite (default: False)
             back: Whether to use the back sprite (default: False)
             colored: Whether to use colored ASCII art (default: True)
+            cache: SpriteCache to use (default: the shared sprite cache)
 
         Returns:
             ASCII art string or None if the sprite couldn't be loaded
         """
-
-        # Determine which sprite to use
-        sprite_url = None
-        if self.sprites:
-            if back:
-                sprite_url = (
-                    self.sprites.back_shiny if shiny else self.sprites.back_default
-                )
-            else:
-                sprite_url = (
-                    self.sprites.front_shiny if shiny else self.sprites.front_default
-                )
-
-        # Convert the sprite to ASCII
-        if sprite_url:
-            return AsciiArt.from_url(sprite_url).to_terminal(columns=width)
-        else:
+        sprite_url = self.get_sprite_url(shiny=shiny, back=back)
+        if not sprite_url:
             return None
+        if cache is None:
+            cache = get_sprite_cache()
+        try:
+            return cache.render(sprite_url, width=width, colored=colored)
+        except PokeAPIError:
+            return None
+
+    def get_ascii_sprite(
+        self, width=40, shiny=False, back=False, colored=True, cache=None
+    ):
+        """
+        Print and return an ASCII representation of the Pokemon's sprite
+
+        Args:
+            width: Width of the ASCII art in columns (default: 40)
+            shiny: Whether to use the shiny sprite (default: False)
+            back: Whether to use the back sprite (default: False)
+            colored: Whether to use colored ASCII art (default: True)
+            cache: SpriteCache to use (default: the shared sprite cache)
+
+        Returns:
+            ASCII art string or None if the sprite couldn't be loaded
+        """
+        ascii_sprite = self.render_ascii_sprite(
+            width=width, shiny=shiny, back=back, colored=colored, cache=cache
+        )
+        if ascii_sprite:
+            print(ascii_sprite)
+        return ascii_sprite
 
-    def show_pokemon(self, colored=True):
+    def show_pokemon(self, colored=True, cache=None):
         """
         Display the Pokémon's characteristics and ASCII sprite in the terminal
 
         Args:
             colored: Whether to use colored ASCII art (default: True)
+            cache: SpriteCache to use (default: the shared sprite cache)
         """
         # Get the ASCII sprite
-        ascii_sprite = self.get_ascii_sprite(width=60, colored=colored)
+        ascii_sprite = self.render_ascii_sprite(width=60, colored=colored, cache=cache)
 
         # Create a header with the Pokémon's name and ID
         name = self.name.upper()
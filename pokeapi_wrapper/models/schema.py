@@ -0,0 +1,296 @@
+"""
+Declarative model schemas for the PokéAPI wrapper
+
+A model lists its fields once in a ``SCHEMA`` dictionary and the
+``schema_model`` decorator compiles it, like ``dataclasses`` does, into
+source code specialized to that model:
+
+- ``__init__`` accepts the fields as keyword arguments, either as raw JSON
+  or as already-built objects, and tolerates unknown keys
+- ``from_json(data, lazy=False)`` builds an instance straight from a decoded
+  payload, with one dictionary lookup and no type checks per field
+- ``__getstate__`` / ``__setstate__`` pickle an instance as a plain tuple
+  of its slots, in schema order
+
+Field kinds:
+
+- ``value(default=None, factory=None)``: stored as is
+- ``ref()``: a {"name", "url"} reference, interned as a NamedAPIResource
+- ``nested(Model)``: a nested object
+- ``ref_list(lazy=False)``: a list of references
+- ``nested_list(Model, lazy=False)``: a list of nested objects
+
+Lazy list fields keep their raw JSON until first accessed when the model
+is built with ``lazy=True``.
+"""
+
+from .base import _interned_by_url, intern_resource
+
+
+class Field:
+    """Declaration of one model field"""
+
+    __slots__ = ("kind", "model", "default", "factory", "lazy")
+
+    def __init__(self, kind, model=None, default=None, factory=None, lazy=False):
+        self.kind = kind
+        self.model = model
+        self.default = default
+        self.factory = factory
+        self.lazy = lazy
+
+
+def value(default=None, factory=None):
+    """
+    Declare a plain field
+
+    Args:
+        default: Value used when the field is missing
+        factory: Callable building the value used when the field is
+            missing or None, for mutable defaults
+    """
+    return Field("value", default=default, factory=factory)
+
+
+def ref():
+    """Declare a {"name", "url"} reference field"""
+    return Field("ref")
+
+
+def nested(model):
+    """
+    Declare a nested object field
+
+    Args:
+        model: Model class of the nested object
+    """
+    return Field("nested", model=model)
+
+
+def ref_list(lazy=False):
+    """
+    Declare a list of references
+
+    Args:
+        lazy: Whether to defer building the list when the model is lazy
+    """
+    return Field("ref_list", lazy=lazy)
+
+
+def nested_list(model, lazy=False):
+    """
+    Declare a list of nested objects
+
+    Args:
+        model: Model class of the items
+        lazy: Whether to defer building the list when the model is lazy
+    """
+    return Field("nested_list", model=model, lazy=lazy)
+
+
+class _Unhydrated:
+    """Raw JSON of a lazy field that has not been read yet"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+
+class _LazyField:
+    """
+    Descriptor that hydrates a raw JSON list the first time it is read
+
+    The value lives in a private slot named after the field. Once
+    hydrated, the models replace the raw JSON so later reads are plain
+    attribute lookups. Concurrent first reads may both hydrate; the
+    results are equivalent and the last one wins.
+    """
+
+    def __init__(self, build):
+        self.build = build
+
+    def __set_name__(self, owner, name):
+        self.storage = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self.storage)
+        if type(value) is _Unhydrated:
+            value = self.build(value.data)
+            setattr(instance, self.storage, value)
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.storage, value)
+
+
+def _json_builder(model):
+    """Get the function building model from a JSON dictionary"""
+    from_json = getattr(model, "from_json", None)
+    if from_json is not None:
+        return from_json
+    return lambda data: model(**data)
+
+
+def _list_builder(field):
+    """Get the function building a lazy list field from its raw value"""
+    if field.kind == "ref_list":
+        return lambda items: [intern_resource(item) for item in items]
+    build = _json_builder(field.model)
+    return lambda items: [build(item) if type(item) is dict else item for item in items]
+
+
+def _init_lines(name, field, target):
+    """Lines of __init__ storing argument name into attribute target"""
+    kind = field.kind
+    if kind == "value":
+        if field.factory is not None:
+            return [f"self.{target} = {name} if {name} is not None else _f_{name}()"]
+        return [f"self.{target} = {name}"]
+    if kind == "ref":
+        return [f"self.{target} = _intern({name})"]
+    if kind == "nested":
+        return [
+            f"self.{target} = _j_{name}({name}) if type({name}) is dict else {name}"
+        ]
+    if kind == "ref_list":
+        built = f"[_intern(item) for item in {name}]"
+    else:
+        built = f"[_j_{name}(item) if type(item) is dict else item for item in {name}]"
+    if field.lazy:
+        return [
+            f"if not {name}:",
+            f"    self.{target} = []",
+            "elif lazy:",
+            f"    self.{target} = _Unhydrated({name})",
+            "else:",
+            f"    self.{target} = {built}",
+        ]
+    return [f"self.{target} = {built} if {name} else []"]
+
+
+def _from_json_lines(name, field, target):
+    """Lines of from_json storing key name of data into attribute target"""
+    kind = field.kind
+    if kind == "value":
+        if field.factory is not None:
+            return [
+                f"value = get({name!r})",
+                f"self.{target} = value if value is not None else _f_{name}()",
+            ]
+        return [f"self.{target} = get({name!r}, _d_{name})"]
+    if kind == "ref":
+        # Most references were seen before: find them by URL without a call
+        return [
+            f"value = get({name!r})",
+            "try:",
+            "    resource = _by_url[value['url']]",
+            "    if resource.name != value['name']:",
+            "        resource = _intern(value)",
+            "except (TypeError, KeyError):",
+            "    resource = _intern(value)",
+            f"self.{target} = resource",
+        ]
+    if kind == "nested":
+        return [
+            f"value = get({name!r})",
+            f"self.{target} = _j_{name}(value) if value is not None else None",
+        ]
+    if kind == "ref_list":
+        built = "[_intern(item) for item in value]"
+    else:
+        built = f"[_j_{name}(item) for item in value]"
+    if field.lazy:
+        built = f"_Unhydrated(value) if lazy else {built}"
+    return [f"value = get({name!r})", f"self.{target} = {built} if value else []"]
+
+
+def _compile(cls, schema):
+    """Generate __init__, from_json, __getstate__ and __setstate__"""
+    namespace = {
+        "_cls": cls,
+        "_new": object.__new__,
+        "_intern": intern_resource,
+        "_by_url": _interned_by_url,
+        "_Unhydrated": _Unhydrated,
+    }
+    parameters = ["self"]
+    init_body = []
+    json_body = ["self = _new(_cls)", "get = data.get"]
+    targets = []
+    for name, field in schema.items():
+        target = f"_{name}" if field.lazy else name
+        targets.append(f"self.{target}")
+        namespace[f"_d_{name}"] = field.default
+        if field.factory is not None:
+            namespace[f"_f_{name}"] = field.factory
+        if field.model is not None:
+            namespace[f"_j_{name}"] = _json_builder(field.model)
+        parameters.append(f"{name}=_d_{name}")
+        init_body.extend(_init_lines(name, field, target))
+        json_body.extend(_from_json_lines(name, field, target))
+    parameters.extend(["lazy=False", "**kwargs"])
+    json_body.append("return self")
+
+    # Lazy fields are pickled as they are, hydrated or not
+    state = "".join(target + ", " for target in targets)
+    source = "\n".join(
+        [f"def __init__({', '.join(parameters)}):"]
+        + ["    " + line for line in init_body or ["pass"]]
+        + ["", "def from_json(data, lazy=False):"]
+        + ["    " + line for line in json_body]
+        + ["", "def __getstate__(self):", f"    return ({state})"]
+        + ["", "def __setstate__(self, state):"]
+        + [f"    ({state}) = state" if state else "    pass"]
+    )
+    exec(compile(source, f"<schema {cls.__name__}>", "exec"), namespace)
+    return tuple(
+        namespace[name]
+        for name in ("__init__", "from_json", "__getstate__", "__setstate__")
+    )
+
+
+def schema_model(cls):
+    """
+    Compile the SCHEMA of a model class
+
+    Returns a new class with the same name, methods and docstring, plus
+    __slots__ for every field, the generated __init__, a from_json static
+    method, tuple-based __getstate__ and __setstate__, a FIELDS frozenset
+    of the field names and a lazy descriptor for every lazy field.
+
+    Args:
+        cls: Class with a SCHEMA dictionary mapping field names to fields
+
+    Returns:
+        The compiled model class
+    """
+    schema = cls.SCHEMA
+    namespace = {
+        key: item
+        for key, item in cls.__dict__.items()
+        if key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = tuple(
+        f"_{name}" if field.lazy else name for name, field in schema.items()
+    )
+    namespace["FIELDS"] = frozenset(schema)
+    for name, field in schema.items():
+        if field.lazy:
+            namespace[name] = _LazyField(_list_builder(field))
+
+    compiled = type(cls)(cls.__name__, cls.__bases__, namespace)
+    init, from_json, getstate, setstate = _compile(compiled, schema)
+    for function in (init, from_json, getstate, setstate):
+        function.__qualname__ = f"{compiled.__qualname__}.{function.__name__}"
+    from_json.__doc__ = (
+        f"Build a {compiled.__name__} from a decoded JSON dictionary; with "
+        "lazy=True lazy fields keep their raw JSON until first accessed"
+    )
+    compiled.__init__ = init
+    compiled.from_json = staticmethod(from_json)
+    compiled.__getstate__ = getstate
+    compiled.__setstate__ = setstate
+    return compiled
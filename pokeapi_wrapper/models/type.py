@@ -0,0 +1,47 @@
+"""
+Type models for the PokéAPI wrapper
+"""
+
+from .schema import nested, nested_list, ref, ref_list, schema_model, value
+
+
+@schema_model
+class TypeRelations:
+    """Damage relations of a type model"""
+
+    SCHEMA = {
+        "no_damage_to": ref_list(),
+        "half_damage_to": ref_list(),
+        "double_damage_to": ref_list(),
+        "no_damage_from": ref_list(),
+        "half_damage_from": ref_list(),
+        "double_damage_from": ref_list(),
+    }
+
+
+@schema_model
+class TypePokemon:
+    """Pokemon of a type model"""
+
+    SCHEMA = {
+        "slot": value(),
+        "pokemon": ref(),
+    }
+
+
+@schema_model
+class Type:
+    """Type model"""
+
+    SCHEMA = {
+        "id": value(),
+        "name": value(),
+        "damage_relations": nested(TypeRelations),
+        "past_damage_relations": value(factory=list),
+        "game_indices": value(factory=list),
+        "generation": ref(),
+        "move_damage_class": ref(),
+        "names": value(factory=list),
+        "pokemon": nested_list(TypePokemon, lazy=True),
+        "moves": ref_list(lazy=True),
+    }
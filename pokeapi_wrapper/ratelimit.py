@@ -0,0 +1,196 @@
+"""
+Client-side rate limiting for the PokéAPI wrapper
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from .exceptions import DeadlineExceededError
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """
+    Adaptive token bucket shared by every thread and coroutine of a client
+
+    Each request takes one token; tokens refill at ``rate`` per second up to
+    ``burst``. A request that finds the bucket empty reserves the next token
+    and waits for it, so waiting callers are served in arrival order. When
+    the server answers 429 the rate is cut multiplicatively and requests
+    pause for the Retry-After delay; each success then raises the rate
+    additively until it is back at the configured maximum.
+    """
+
+    def __init__(
+        self,
+        rate=20.0,
+        burst=None,
+        adaptive=True,
+        min_rate=0.5,
+        decrease_factor=0.5,
+        increase_step=None,
+    ):
+        """
+        Initialize the limiter
+
+        Args:
+            rate: Maximum sustained requests per second
+            burst: Maximum number of requests sent back to back
+                (default: rate, at least 1)
+            adaptive: Whether 429 responses lower the rate
+            min_rate: Lowest rate adaptation may reach
+            decrease_factor: Factor applied to the rate on each 429
+            increase_step: Requests per second regained on each success
+                (default: 5% of rate)
+        """
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self.adaptive = adaptive
+        self.min_rate = min_rate
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step if increase_step is not None else rate / 20
+        self.requests = 0
+        self.throttled_requests = 0
+        self.throttled_seconds = 0.0
+        self.rate_limited_responses = 0
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self, timeout):
+        """
+        Take a token and return how long to wait before using it
+
+        Raises:
+            DeadlineExceededError: If the wait would be longer than timeout;
+                the token is given back
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            wait = max(wait, self._blocked_until - now)
+            if timeout is not None and wait > timeout:
+                self._tokens += 1
+                raise DeadlineExceededError(
+                    f"Deadline exceeded: the rate limiter needs {wait:.2f}s"
+                )
+            self.requests += 1
+            if wait > 0:
+                self.throttled_requests += 1
+                self.throttled_seconds += wait
+            return wait
+
+    def acquire(self, timeout=None):
+        """
+        Block the calling thread until a request may be sent
+
+        Args:
+            timeout: Longest acceptable wait in seconds, or None for no limit
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            DeadlineExceededError: At once, without waiting or using up a
+                token, if the wait would be longer than timeout
+        """
+        wait = self._reserve(timeout)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, timeout=None):
+        """
+        Suspend the calling coroutine until a request may be sent
+
+        Args:
+            timeout: Longest acceptable wait in seconds, or None for no limit
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            DeadlineExceededError: At once, without waiting or using up a
+                token, if the wait would be longer than timeout
+        """
+        # Imported here so that threaded clients never load asyncio
+        import asyncio
+
+        wait = self._reserve(timeout)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_rate_limited(self, retry_after=None):
+        """
+        Record a 429 response
+
+        Args:
+            retry_after: Seconds the server asked to wait, if any
+        """
+        with self._lock:
+            self.rate_limited_responses += 1
+            if self.adaptive:
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                # Drop the burst allowance so the lower rate applies at once
+                self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(
+                    self._blocked_until, time.monotonic() + retry_after
+                )
+
+    def on_success(self):
+        """Record a successful response"""
+        if self.adaptive and self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def stats(self):
+        """
+        Get the limiter counters
+
+        Returns:
+            Dictionary with requests, throttled_requests, throttled_seconds,
+            rate_limited_responses and the current rate
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "throttled_requests": self.throttled_requests,
+                "throttled_seconds": self.throttled_seconds,
+                "rate_limited_responses": self.rate_limited_responses,
+                "rate": self.rate,
+            }
@@ -0,0 +1,208 @@
+"""
+Retries and circuit breaking for the PokéAPI wrapper
+"""
+
+import random
+import threading
+import time
+
+from .exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    NetworkError,
+    RateLimitError,
+)
+
+
+class RetryPolicy:
+    """
+    Retry policy with jittered exponential backoff
+
+    Only idempotent methods are retried, and only after a network error, a
+    429 or one of ``retry_statuses``. The n-th retry waits a random time
+    between 0 and ``min(backoff_max, backoff_base * 2 ** (n - 1))`` ("full
+    jitter"), or at least as long as the server's Retry-After. Retrying
+    stops after ``max_attempts`` attempts or once the next attempt would
+    start after ``deadline`` seconds.
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff_base=0.1,
+        backoff_max=5.0,
+        deadline=None,
+        jitter=True,
+        retry_statuses=(500, 502, 503, 504),
+        retry_rate_limited=True,
+        methods=("GET", "HEAD", "OPTIONS"),
+    ):
+        """
+        Initialize the policy
+
+        Args:
+            max_attempts: Maximum number of attempts, including the first
+            backoff_base: Backoff ceiling in seconds for the first retry
+            backoff_max: Largest backoff ceiling in seconds
+            deadline: Seconds after the first attempt past which no retry
+                is started (default: no deadline)
+            jitter: Whether to randomize the backoff
+            retry_statuses: HTTP status codes worth retrying
+            retry_rate_limited: Whether to retry 429 responses
+            methods: HTTP methods that are safe to retry
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_rate_limited = retry_rate_limited
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def is_retryable(self, method, error):
+        """
+        Check whether a failed request may be sent again
+
+        Args:
+            method: HTTP method of the request
+            error: PokeAPIError raised by the attempt
+
+        Returns:
+            True if the request should be retried
+        """
+        if method.upper() not in self.methods:
+            return False
+        if isinstance(error, (CircuitOpenError, DeadlineExceededError)):
+            return False
+        if isinstance(error, NetworkError):
+            return True
+        if isinstance(error, RateLimitError):
+            return self.retry_rate_limited
+        return getattr(error, "status_code", None) in self.retry_statuses
+
+    def backoff(self, attempt):
+        """
+        Get the backoff before the retry following an attempt
+
+        Args:
+            attempt: Number of attempts made so far
+
+        Returns:
+            Seconds to wait
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+    def next_delay(self, attempt, elapsed, retry_after=None):
+        """
+        Get the wait before the next attempt, if there is one
+
+        Args:
+            attempt: Number of attempts made so far
+            elapsed: Seconds since the first attempt started
+            retry_after: Seconds the server asked to wait, if any
+
+        Returns:
+            Seconds to wait, or None if the request should not be retried
+        """
+        if attempt >= self.max_attempts:
+            return None
+        delay = self.backoff(attempt)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if self.deadline is not None and elapsed + delay >= self.deadline:
+            return None
+        return delay
+
+
+class _Circuit:
+    """Failure state of one host"""
+
+    __slots__ = ("failures", "opened_at")
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_at = None
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker
+
+    After ``failure_threshold`` consecutive failures (network errors or 5xx
+    responses) the circuit of a host opens and requests to it fail at once
+    with CircuitOpenError. Once ``reset_timeout`` seconds have passed a
+    single probe request is let through: if it succeeds the circuit
+    closes, otherwise it stays open for another ``reset_timeout``.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        """
+        Initialize the breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            reset_timeout: Seconds an open circuit waits before a probe
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def before_request(self, host):
+        """
+        Check that a request to host may be sent
+
+        Args:
+            host: Host (and port) the request goes to
+
+        Raises:
+            CircuitOpenError: If the circuit of host is open
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.opened_at is None:
+                return
+            now = time.monotonic()
+            remaining = circuit.opened_at + self.reset_timeout - now
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f"Circuit open for {host}, retry in {remaining:.1f}s", host
+                )
+            # Let this request through as the probe; the rest keep failing
+            circuit.opened_at = now
+
+    def record_success(self, host):
+        """Record a request to host that got a response"""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is not None:
+                circuit.failures = 0
+                circuit.opened_at = None
+
+    def record_failure(self, host):
+        """Record a request to host that failed"""
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            circuit.failures += 1
+            if circuit.failures >= self.failure_threshold:
+                circuit.opened_at = time.monotonic()
+
+    def state(self, host):
+        """
+        Get the state of the circuit of a host
+
+        Args:
+            host: Host (and port) to check
+
+        Returns:
+            "closed", "open", or "half-open" once a probe is allowed
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.opened_at is None:
+                return "closed"
+            if time.monotonic() - circuit.opened_at < self.reset_timeout:
+                return "open"
+            return "half-open"
@@ -0,0 +1,109 @@
+"""
+Request coalescing for the PokéAPI wrapper
+
+Concurrent callers asking for the same key share a single in-flight call
+and all receive its result or its exception.
+"""
+
+import threading
+
+
+class _Call:
+    """An in-flight call awaited by one or more threads"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group
+
+    The first thread to call ``do`` for a key runs the function; threads
+    arriving while it is still running wait for it and share its outcome.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, function, *args, timeout=None):
+        """
+        Run function(*args) unless a call for key is already in flight
+
+        Args:
+            key: Hashable key identifying the call
+            function: Callable to run
+            *args: Arguments passed to function
+            timeout: Seconds to wait for a call already in flight
+                (default: no limit)
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            TimeoutError: If the call in flight did not finish in time
+            Exception: Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Timed out waiting for {key!r}")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function(*args)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Single-flight group for coroutines of one event loop
+
+    The shared call runs as its own task, so cancelling one waiter does not
+    cancel the call for the others.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, function, *args):
+        """
+        Await function(*args) unless a call for key is already in flight
+
+        Args:
+            key: Hashable key identifying the call
+            function: Coroutine function to run
+            *args: Arguments passed to function
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        # Imported here so that threaded clients never load asyncio
+        import asyncio
+
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(function(*args))
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
@@ -0,0 +1,596 @@
+"""
+Compact binary snapshots of the dex for the PokéAPI wrapper
+
+A snapshot is written once, e.g. after a sync, and opened with mmap at
+every process start: nothing is parsed up front, and a lookup by ID or name
+reads a single fixed-width record. Lists and strings are decoded only when
+a view accesses them.
+
+Layout (little-endian):
+
+- header: magic, version, entry counts and section offsets
+- records: one fixed-width record per Pokemon, sorted by ID, with the
+  scalar fields, the six stats, the sprite URLs and the offsets of its
+  variable-length lists
+- name index: record numbers sorted by Pokemon name
+- references: (name, url) string number pairs, shared by every record
+- strings: offsets table followed by the UTF-8 bytes
+- variable section: types, abilities, forms and moves with their version
+  group details
+
+Snapshots keep the scalar fields, stats, sprite URLs, species, types,
+abilities, forms and moves; game_indices, held_items, past_types and the
+"other" / "versions" sprites are left out to keep records compact.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+
+from .exceptions import InvalidParameterError, ParsingError, ResourceNotFoundError
+from .models.base import intern_resource
+from .models.pokemon import (
+    Pokemon,
+    PokemonAbility,
+    PokemonMove,
+    PokemonMoveVersion,
+    PokemonSprites,
+    PokemonStat,
+    PokemonType,
+)
+
+MAGIC = b"PKMNSNAP"
+VERSION = 1
+
+SPRITE_FIELDS = (
+    "front_default",
+    "front_shiny",
+    "front_female",
+    "front_shiny_female",
+    "back_default",
+    "back_shiny",
+    "back_female",
+    "back_shiny_female",
+)
+STAT_SLOTS = 6
+
+# magic, version, Pokemon, strings, references, then the section offsets:
+# records, name index, references, strings, variable
+_HEADER = struct.Struct("<8sIIII5Q")
+# id, name, species, height, weight, base_experience, order,
+# location_area_encounters, is_default, stat count, base stats, efforts,
+# stat references, sprites, then (offset, count) of types, abilities,
+# forms and moves
+_RECORD = struct.Struct(f"<IIIIIiiIBB6H6B6I{len(SPRITE_FIELDS)}I" + "IH" * 4)
+_U32 = struct.Struct("<I")
+_PAIR = struct.Struct("<II")
+_TYPE = struct.Struct("<HI")
+_ABILITY = struct.Struct("<H?I")
+_MOVE = struct.Struct("<IH")
+_DETAIL = struct.Struct("<IIH")
+
+# Sentinels standing for None
+_NONE = 0xFFFFFFFF
+_NONE_INT = -(2**31)
+_NONE_SHORT = 0xFFFF
+
+
+def _or(value, none):
+    return none if value is None else value
+
+
+def _unless(value, none):
+    return None if value == none else value
+
+
+def write_snapshot(pokemon, path):
+    """
+    Write Pokemon to a snapshot file
+
+    The file is written to a temporary name first and then moved into
+    place, so readers never see a partial snapshot.
+
+    Args:
+        pokemon: Iterable of Pokemon, e.g. from get_pokemon_many or
+            load_pokemon_bulk; a later Pokemon replaces an earlier one
+            with the same ID
+        path: Path of the snapshot file
+
+    Returns:
+        Number of Pokemon written
+
+    Raises:
+        InvalidParameterError: If a Pokemon has more than six stats
+    """
+    strings = {}
+    references = {}
+
+    def string(text):
+        if text is None:
+            return _NONE
+        return strings.setdefault(text, len(strings))
+
+    def reference(resource):
+        if resource is None:
+            return _NONE
+        key = (string(resource["name"]), string(resource["url"]))
+        return references.setdefault(key, len(references))
+
+    by_id = {p.id: p for p in pokemon}
+    ordered = [by_id[pokemon_id] for pokemon_id in sorted(by_id)]
+    records = []
+    variable = bytearray()
+
+    def section(items, pack):
+        offset = len(variable)
+        for item in items:
+            variable.extend(pack(item))
+        return offset, len(items)
+
+    def pack_move(move):
+        details = move.version_group_details
+        packed = _MOVE.pack(reference(move.move), len(details))
+        return packed + b"".join(
+            _DETAIL.pack(
+                reference(detail.move_learn_method),
+                reference(detail.version_group),
+                _or(detail.level_learned_at, _NONE_SHORT),
+            )
+            for detail in details
+        )
+
+    for p in ordered:
+        stats = p.stats
+        if len(stats) > STAT_SLOTS:
+            raise InvalidParameterError(f"{p.name} has more than {STAT_SLOTS} stats")
+        padding = [0] * (STAT_SLOTS - len(stats))
+        sprites = p.sprites
+        lists = [
+            section(
+                p.types,
+                lambda t: _TYPE.pack(_or(t.slot, _NONE_SHORT), reference(t.type)),
+            ),
+            section(
+                p.abilities,
+                lambda a: _ABILITY.pack(
+                    _or(a.slot, _NONE_SHORT), bool(a.is_hidden), reference(a.ability)
+                ),
+            ),
+            section(p.forms, lambda form: _U32.pack(reference(form))),
+            section(p.moves, pack_move),
+        ]
+        records.append(
+            _RECORD.pack(
+                p.id,
+                string(p.name),
+                reference(p.species),
+                _or(p.height, _NONE),
+                _or(p.weight, _NONE),
+                _or(p.base_experience, _NONE_INT),
+                _or(p.order, _NONE_INT),
+                string(p.location_area_encounters),
+                bool(p.is_default),
+                len(stats),
+                *[_or(stat.base_stat, 0) for stat in stats] + padding,
+                *[_or(stat.effort, 0) for stat in stats] + padding,
+                *[reference(stat.stat) for stat in stats] + [_NONE] * len(padding),
+                *[
+                    string(getattr(sprites, field, None) if sprites else None)
+                    for field in SPRITE_FIELDS
+                ],
+                *[number for pair in lists for number in pair],
+            )
+        )
+
+    names = sorted(range(len(ordered)), key=lambda index: ordered[index].name or "")
+    encoded = [text.encode("utf-8") for text in strings]
+    string_offsets = [0]
+    for data in encoded:
+        string_offsets.append(string_offsets[-1] + len(data))
+
+    sections = [
+        b"".join(records),
+        struct.pack(f"<{len(names)}I", *names),
+        b"".join(_PAIR.pack(*key) for key in references),
+        struct.pack(f"<{len(string_offsets)}I", *string_offsets) + b"".join(encoded),
+        bytes(variable),
+    ]
+    offsets = []
+    position = _HEADER.size
+    for data in sections:
+        offsets.append(position)
+        position += len(data)
+    header = _HEADER.pack(
+        MAGIC, VERSION, len(ordered), len(strings), len(references), *offsets
+    )
+
+    path = os.fspath(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            for data in sections:
+                f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return len(ordered)
+
+
+class PokemonView:
+    """
+    Read-only Pokemon backed by a record of a Snapshot
+
+    Has the attributes of a Pokemon and its sprite and display methods.
+    Scalars are read from the record when the view is created; lists are
+    decoded from the snapshot on first access and then kept. Fields left
+    out of snapshots are empty.
+    """
+
+    __slots__ = (
+        "_snapshot",
+        "_record",
+        "_types",
+        "_abilities",
+        "_forms",
+        "_moves",
+        "_stats",
+        "_sprites",
+    )
+
+    game_indices = ()
+    held_items = ()
+    past_types = ()
+
+    def __init__(self, snapshot, record):
+        self._snapshot = snapshot
+        self._record = record
+        self._types = None
+        self._abilities = None
+        self._forms = None
+        self._moves = None
+        self._stats = None
+        self._sprites = None
+
+    def __repr__(self):
+        return f"PokemonView(id={self.id!r}, name={self.name!r})"
+
+    @property
+    def id(self):
+        return self._record[0]
+
+    @property
+    def name(self):
+        return self._snapshot._string(self._record[1])
+
+    @property
+    def species(self):
+        return self._snapshot._reference(self._record[2])
+
+    @property
+    def height(self):
+        return _unless(self._record[3], _NONE)
+
+    @property
+    def weight(self):
+        return _unless(self._record[4], _NONE)
+
+    @property
+    def base_experience(self):
+        return _unless(self._record[5], _NONE_INT)
+
+    @property
+    def order(self):
+        return _unless(self._record[6], _NONE_INT)
+
+    @property
+    def location_area_encounters(self):
+        return self._snapshot._string(self._record[7])
+
+    @property
+    def is_default(self):
+        return bool(self._record[8])
+
+    @property
+    def stats(self):
+        if self._stats is None:
+            record = self._record
+            count = record[9]
+            reference = self._snapshot._reference
+            self._stats = [
+                PokemonStat(
+                    stat=reference(record[22 + index]),
+                    effort=record[16 + index],
+                    base_stat=record[10 + index],
+                )
+                for index in range(count)
+            ]
+        return self._stats
+
+    @property
+    def sprites(self):
+        if self._sprites is None:
+            string = self._snapshot._string
+            urls = self._record[28 : 28 + len(SPRITE_FIELDS)]
+            self._sprites = PokemonSprites(
+                **{field: string(url) for field, url in zip(SPRITE_FIELDS, urls)}
+            )
+        return self._sprites
+
+    def _section(self, index):
+        start = 28 + len(SPRITE_FIELDS) + 2 * index
+        return self._record[start], self._record[start + 1]
+
+    @property
+    def types(self):
+        if self._types is None:
+            offset, count = self._section(0)
+            snapshot = self._snapshot
+            self._types = [
+                PokemonType(
+                    slot=_unless(slot, _NONE_SHORT), type=snapshot._reference(ref)
+                )
+                for slot, ref in snapshot._iter(_TYPE, offset, count)
+            ]
+        return self._types
+
+    @property
+    def abilities(self):
+        if self._abilities is None:
+            offset, count = self._section(1)
+            snapshot = self._snapshot
+            self._abilities = [
+                PokemonAbility(
+                    is_hidden=hidden,
+                    slot=_unless(slot, _NONE_SHORT),
+                    ability=snapshot._reference(ref),
+                )
+                for slot, hidden, ref in snapshot._iter(_ABILITY, offset, count)
+            ]
+        return self._abilities
+
+    @property
+    def forms(self):
+        if self._forms is None:
+            offset, count = self._section(2)
+            snapshot = self._snapshot
+            self._forms = [
+                snapshot._reference(ref)
+                for (ref,) in snapshot._iter(_U32, offset, count)
+            ]
+        return self._forms
+
+    @property
+    def moves(self):
+        if self._moves is None:
+            offset, count = self._section(3)
+            self._moves = self._snapshot._moves(offset, count)
+        return self._moves
+
+    def to_pokemon(self):
+        """
+        Build a standalone Pokemon from the view
+
+        Returns:
+            Pokemon with every field of the snapshot
+        """
+        return Pokemon(
+            id=self.id,
+            name=self.name,
+            base_experience=self.base_experience,
+            height=self.height,
+            is_default=self.is_default,
+            order=self.order,
+            weight=self.weight,
+            abilities=list(self.abilities),
+            forms=list(self.forms),
+            location_area_encounters=self.location_area_encounters,
+            moves=list(self.moves),
+            sprites=self.sprites,
+            species=self.species,
+            stats=list(self.stats),
+            types=list(self.types),
+        )
+
+    get_sprite_url = Pokemon.get_sprite_url
+    render_ascii_sprite = Pokemon.render_ascii_sprite
+    get_ascii_sprite = Pokemon.get_ascii_sprite
+    show_pokemon = Pokemon.show_pokemon
+
+
+class Snapshot:
+    """
+    Memory-mapped reader of a snapshot file
+
+    Opening a snapshot only reads its header; the operating system pages
+    the rest in as lookups touch it. Views are built on demand, and the
+    strings and references they decode are shared between views. A
+    snapshot can be read from several threads.
+    """
+
+    def __init__(self, path):
+        """
+        Open a snapshot
+
+        Args:
+            path: Path of a file written by write_snapshot
+
+        Raises:
+            ParsingError: If the file is not a snapshot of this version
+        """
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            try:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ParsingError(f"Empty snapshot file: {self.path}")
+        try:
+            fields = _HEADER.unpack_from(self._buffer, 0)
+        except struct.error:
+            fields = (None,)
+        if fields[0] != MAGIC or fields[1] != VERSION:
+            self._buffer.close()
+            raise ParsingError(f"Not a version {VERSION} snapshot: {self.path}")
+        (
+            _,
+            _,
+            self._count,
+            string_count,
+            _,
+            self._records,
+            self._names,
+            self._references,
+            self._string_offsets,
+            self._variable,
+        ) = fields
+        self._string_data = self._string_offsets + _U32.size * (string_count + 1)
+        # Slices of a memoryview share the mapped pages instead of copying
+        self._memory = memoryview(self._buffer)
+        self._strings = {}
+        self._resources = {}
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        """Iterate over views of every Pokemon, in ID order"""
+        for index in range(self._count):
+            yield self._view(index)
+
+    def __contains__(self, identifier):
+        return self._find(identifier) is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Unmap the file; views must not be used afterwards"""
+        self._memory.release()
+        self._buffer.close()
+
+    def get(self, identifier):
+        """
+        Get a Pokemon by name or ID
+
+        Args:
+            identifier: Name or ID of the Pokemon
+
+        Returns:
+            PokemonView
+
+        Raises:
+            ResourceNotFoundError: If the Pokemon is not in the snapshot
+        """
+        index = self._find(identifier)
+        if index is None:
+            raise ResourceNotFoundError(f"Pokemon not in snapshot: {identifier}")
+        return self._view(index)
+
+    def _view(self, index):
+        record = _RECORD.unpack_from(self._buffer, self._records + index * _RECORD.size)
+        return PokemonView(self, record)
+
+    def _find(self, identifier):
+        """Get the record number of a Pokemon by binary search, or None"""
+        if isinstance(identifier, str):
+            identifier = identifier.strip().lower()
+            if identifier.isdigit():
+                identifier = int(identifier)
+        buffer = self._buffer
+        low, high = 0, self._count
+        if isinstance(identifier, int):
+            while low < high:
+                middle = (low + high) // 2
+                (pokemon_id,) = _U32.unpack_from(
+                    buffer, self._records + middle * _RECORD.size
+                )
+                if pokemon_id < identifier:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low < self._count:
+                found = _U32.unpack_from(buffer, self._records + low * _RECORD.size)
+                if found[0] == identifier:
+                    return low
+            return None
+
+        def record_at(position):
+            return _U32.unpack_from(buffer, self._names + position * _U32.size)[0]
+
+        def name_of(index):
+            offset = self._records + index * _RECORD.size + _U32.size
+            return self._string(_U32.unpack_from(buffer, offset)[0]) or ""
+
+        while low < high:
+            middle = (low + high) // 2
+            if name_of(record_at(middle)) < identifier:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and name_of(record_at(low)) == identifier:
+            return record_at(low)
+        return None
+
+    def _string(self, number):
+        if number == _NONE:
+            return None
+        text = self._strings.get(number)
+        if text is None:
+            start, end = _PAIR.unpack_from(
+                self._buffer, self._string_offsets + number * _U32.size
+            )
+            data = self._string_data
+            text = str(self._memory[data + start : data + end], "utf-8")
+            self._strings[number] = text
+        return text
+
+    def _reference(self, number):
+        if number == _NONE:
+            return None
+        resource = self._resources.get(number)
+        if resource is None:
+            name, url = _PAIR.unpack_from(
+                self._buffer, self._references + number * _PAIR.size
+            )
+            resource = intern_resource(
+                {"name": self._string(name), "url": self._string(url)}
+            )
+            self._resources[number] = resource
+        return resource
+
+    def _iter(self, layout, offset, count):
+        start = self._variable + offset
+        return layout.iter_unpack(self._memory[start : start + count * layout.size])
+
+    def _moves(self, offset, count):
+        buffer = self._memory
+        # Methods and version groups are a handful of references shared by
+        # every detail, so look them up in the cache before decoding
+        resources = self._resources
+        reference = self._reference
+        position = self._variable + offset
+        moves = []
+        for _ in range(count):
+            move, detail_count = _MOVE.unpack_from(buffer, position)
+            position += _MOVE.size
+            details = [
+                PokemonMoveVersion(
+                    resources.get(method) or reference(method),
+                    resources.get(group) or reference(group),
+                    None if level == _NONE_SHORT else level,
+                )
+                for method, group, level in _DETAIL.iter_unpack(
+                    buffer[position : position + detail_count * _DETAIL.size]
+                )
+            ]
+            position += detail_count * _DETAIL.size
+            moves.append(
+                PokemonMove(move=reference(move), version_group_details=details)
+            )
+        return moves
@@ -0,0 +1,310 @@
+"""
+Sprite downloads and ASCII rendering for the PokéAPI wrapper
+
+Sprite images are kept on disk once downloaded, and rendered ASCII art is
+memoized in memory, so showing the same sprite again costs neither a
+download nor a decode.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from .exceptions import NetworkError, PokeAPIError, ResourceNotFoundError
+from .singleflight import SingleFlight
+
+
+def _load_renderer():
+    """
+    Import the rendering stack on first use
+
+    Returns:
+        Tuple of the AsciiArt class and the PIL Image module
+
+    Raises:
+        ImportError: If ascii_magic is not installed
+    """
+    try:
+        from ascii_magic import AsciiArt
+        from PIL import Image
+    except ImportError as e:
+        raise ImportError(
+            "Sprite rendering requires ascii_magic; install it with "
+            "'pip install pkmn_api_wrapper_yotaenom[render]'"
+        ) from e
+    return AsciiArt, Image
+
+
+def default_cache_dir():
+    """
+    Get the default directory for downloaded sprites
+
+    Returns:
+        $XDG_CACHE_HOME/pokeapi_wrapper/sprites, or ~/.cache/... if unset
+    """
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(root, "pokeapi_wrapper", "sprites")
+
+
+class SpriteCache:
+    """
+    Cache of sprite images and their ASCII renderings
+
+    Image bytes are stored in ``directory``, one file per URL, and survive
+    the process; without a directory they are kept in memory. Renderings
+    are kept in an in-memory LRU keyed by (url, width, colored); the URL
+    already tells shiny and back sprites apart. Concurrent requests for
+    the same sprite share one download. The cache is safe to share
+    between threads.
+    """
+
+    def __init__(self, directory=None, max_renders=512, timeout=30.0):
+        """
+        Initialize the cache
+
+        Args:
+            directory: Directory for downloaded images, or None to keep
+                them in memory only (default: None)
+            max_renders: Maximum number of renderings kept in memory
+            timeout: Timeout in seconds for each download
+        """
+        self.directory = directory
+        self.max_renders = max_renders
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.downloads = 0
+        self.disk_hits = 0
+        self.render_hits = 0
+        self.render_misses = 0
+        self._images = {}
+        self._renders = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_flight = SingleFlight()
+
+    def _path(self, url):
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        extension = os.path.splitext(url.rsplit("/", 1)[-1])[1] or ".img"
+        return os.path.join(self.directory, name + extension)
+
+    def get_image(self, url):
+        """
+        Get the bytes of a sprite image, downloading it if needed
+
+        Args:
+            url: URL of the sprite
+
+        Returns:
+            Image file contents as bytes
+
+        Raises:
+            ResourceNotFoundError: If the sprite does not exist
+            NetworkError: If the sprite server could not be reached
+            PokeAPIError: If the download failed otherwise
+        """
+        if self.directory is None:
+            data = self._images.get(url)
+            if data is not None:
+                return data
+        else:
+            try:
+                with open(self._path(url), "rb") as f:
+                    data = f.read()
+            except OSError:
+                pass
+            else:
+                with self._lock:
+                    self.disk_hits += 1
+                return data
+        return self._in_flight.do(url, self._download, url)
+
+    def _download(self, url):
+        """Download a sprite and store it"""
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 404:
+                raise ResourceNotFoundError(f"Sprite not found: {url}")
+            raise PokeAPIError(f"HTTP Error: {e}")
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ) as e:
+            raise NetworkError(f"Network Error: {e}")
+        except requests.exceptions.RequestException as e:
+            raise PokeAPIError(f"Request Error: {e}")
+
+        data = response.content
+        with self._lock:
+            self.downloads += 1
+        if self.directory is None:
+            self._images[url] = data
+            return data
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first so readers never see half a file
+            fd, temp_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self._path(url))
+        except OSError:
+            # An unwritable cache directory only costs a later re-download
+            pass
+        return data
+
+    def render(self, url, width=40, colored=True):
+        """
+        Render a sprite as ASCII art
+
+        Args:
+            url: URL of the sprite
+            width: Width of the ASCII art in columns (default: 40)
+            colored: Whether to use colored ASCII art (default: True)
+
+        Returns:
+            ASCII art string
+
+        Raises:
+            PokeAPIError: If the sprite could not be downloaded or decoded
+            ImportError: If ascii_magic is not installed
+        """
+        AsciiArt, Image = _load_renderer()
+        key = (url, width, colored)
+        with self._lock:
+            art = self._renders.get(key)
+            if art is not None:
+                self._renders.move_to_end(key)
+                self.render_hits += 1
+                return art
+            self.render_misses += 1
+
+        try:
+            image = Image.open(io.BytesIO(self.get_image(url)))
+        except OSError as e:
+            raise PokeAPIError(f"Invalid sprite image {url}: {e}")
+        # to_terminal() would print the art and to_ascii() is always
+        # monochrome, so build the terminal art directly
+        art = AsciiArt.from_pillow_image(image)._img_to_art(
+            columns=width, monochrome=not colored
+        )
+
+        with self._lock:
+            self._renders[key] = art
+            while len(self._renders) > self.max_renders:
+                self._renders.popitem(last=False)
+        return art
+
+    def prefetch(self, urls, max_workers=8):
+        """
+        Download several sprites concurrently
+
+        Sprites that are already cached are skipped and failed downloads
+        are ignored; they are retried the next time they are needed.
+
+        Args:
+            urls: Iterable of sprite URLs
+            max_workers: Number of worker threads (default: 8)
+
+        Returns:
+            Number of sprites that are now cached
+        """
+        urls = list(dict.fromkeys(url for url in urls if url))
+        if not urls:
+            return 0
+
+        def fetch(url):
+            try:
+                self.get_image(url)
+            except PokeAPIError:
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return sum(executor.map(fetch, urls))
+
+    def clear(self):
+        """Drop the memoized renderings and the images kept in memory"""
+        with self._lock:
+            self._renders.clear()
+            self._images.clear()
+
+    def stats(self):
+        """
+        Get the cache counters
+
+        Returns:
+            Dictionary with downloads, disk_hits, render_hits,
+            render_misses and the number of memoized renders
+        """
+        with self._lock:
+            return {
+                "downloads": self.downloads,
+                "disk_hits": self.disk_hits,
+                "render_hits": self.render_hits,
+                "render_misses": self.render_misses,
+                "renders": len(self._renders),
+            }
+
+    def close(self):
+        """Close the pooled connections used for downloads"""
+        self.session.close()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_sprite_cache():
+    """
+    Get the sprite cache used by the Pokemon models
+
+    Returns:
+        The shared SpriteCache, created on first use with its images in
+        default_cache_dir()
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SpriteCache(default_cache_dir())
+        return _default_cache
+
+
+def set_sprite_cache(cache):
+    """
+    Replace the sprite cache used by the Pokemon models
+
+    Args:
+        cache: SpriteCache to use, or None to create a default one on
+            next use
+    """
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
+
+
+def prefetch_sprites(pokemon, shiny=False, back=False, max_workers=8, cache=None):
+    """
+    Download the sprites of several Pokemon concurrently
+
+    Args:
+        pokemon: Iterable of Pokemon
+        shiny: Whether to fetch the shiny sprites (default: False)
+        back: Whether to fetch the back sprites (default: False)
+        max_workers: Number of worker threads (default: 8)
+        cache: SpriteCache to fill (default: get_sprite_cache())
+
+    Returns:
+        Number of sprites that are now cached
+    """
+    if cache is None:
+        cache = get_sprite_cache()
+    urls = [p.get_sprite_url(shiny=shiny, back=back) for p in pokemon]
+    return cache.prefetch(urls, max_workers=max_workers)
@@ -0,0 +1,348 @@
+"""
+Columnar Pokemon tables for the PokéAPI wrapper
+
+A PokemonTable keeps the scalar fields and base stats of many Pokemon as
+NumPy arrays, one per column, with the types packed into a bitmask
+column. Filters, sorts and aggregates then run as array operations over
+the whole table instead of Python loops over models.
+"""
+
+import operator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .decoding import get_decoder
+from .exceptions import InvalidParameterError
+from .models.pokemon import Pokemon
+
+STAT_COLUMNS = (
+    "hp",
+    "attack",
+    "defense",
+    "special_attack",
+    "special_defense",
+    "speed",
+)
+
+# Fields that may be null in the API; they are stored as floats with NaN
+NULLABLE_COLUMNS = ("base_experience", "height", "weight", "order")
+
+_OPERATORS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "in": lambda column, values: np.isin(column, list(values)),
+}
+
+
+class PokemonTable:
+    """
+    Columnar view of many Pokemon backed by NumPy arrays
+
+    Columns are "id", "name", the nullable "base_experience", "height",
+    "weight" and "order" (floats, NaN when missing), the six base stats
+    "hp" to "speed", their total "bst", and "types", a bitmask whose bits
+    follow ``type_names``. Queries return new tables, so they chain::
+
+        table.where(type="fire", speed__gt=100).top_k("bst", 10)
+
+    Build a table from Pokemon models, from snapshot views, or from a
+    Mirror with ``PokemonTable.from_mirror``. Requires NumPy, installed
+    with the ``analytics`` extra.
+    """
+
+    def __init__(self, pokemon=()):
+        """
+        Initialize the table
+
+        Args:
+            pokemon: Iterable of Pokemon, or of objects with the same
+                fields such as snapshot views
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError(
+                "PokemonTable requires numpy; install it with "
+                "'pip install pkmn_api_wrapper_yotaenom[analytics]'"
+            )
+        pokemon = list(pokemon)
+        size = len(pokemon)
+        type_names = sorted(
+            {t.type.name for p in pokemon for t in p.types if t.type is not None}
+        )
+        bits = {name: 1 << bit for bit, name in enumerate(type_names)}
+        stat_index = {name: i for i, name in enumerate(STAT_COLUMNS)}
+
+        ids = np.empty(size, dtype=np.int64)
+        names = np.empty(size, dtype=object)
+        nullable = np.full((len(NULLABLE_COLUMNS), size), np.nan)
+        stats = np.zeros((len(STAT_COLUMNS), size), dtype=np.int32)
+        masks = np.zeros(size, dtype=np.uint64)
+        for row, p in enumerate(pokemon):
+            ids[row] = p.id
+            names[row] = p.name
+            for column, field in enumerate(NULLABLE_COLUMNS):
+                value = getattr(p, field)
+                if value is not None:
+                    nullable[column, row] = value
+            for stat in p.stats:
+                if stat.stat is None:
+                    continue
+                column = stat_index.get(stat.stat.name.replace("-", "_"))
+                if column is not None and stat.base_stat is not None:
+                    stats[column, row] = stat.base_stat
+            mask = 0
+            for t in p.types:
+                if t.type is not None:
+                    mask |= bits[t.type.name]
+            masks[row] = mask
+
+        columns = {"id": ids, "name": names}
+        columns.update(zip(NULLABLE_COLUMNS, nullable))
+        columns.update(zip(STAT_COLUMNS, stats))
+        columns["bst"] = stats.sum(axis=0, dtype=np.int32)
+        columns["types"] = masks
+        self._columns = columns
+        self.type_names = tuple(type_names)
+
+    @classmethod
+    def from_mirror(cls, mirror, json_backend=None):
+        """
+        Build a table from every Pokemon stored in a mirror
+
+        Args:
+            mirror: Mirror filled by PokeAPI.sync
+            json_backend: JSON decoder to use, "orjson", "msgspec" or
+                "json" (default: the fastest one installed)
+
+        Returns:
+            PokemonTable
+        """
+        loads = get_decoder(json_backend)
+        return cls(
+            Pokemon.from_json(loads(body), lazy=True)
+            for body in mirror.bodies("pokemon")
+        )
+
+    @classmethod
+    def _from_columns(cls, columns, type_names):
+        table = cls.__new__(cls)
+        table._columns = columns
+        table.type_names = type_names
+        return table
+
+    def __len__(self):
+        return len(self._columns["id"])
+
+    def __repr__(self):
+        return f"PokemonTable({len(self)} rows)"
+
+    def __getitem__(self, key):
+        """
+        Get a column by name, or a table of the selected rows
+
+        Args:
+            key: Column name, or a slice, index array or boolean mask
+
+        Returns:
+            The column's array (not a copy), or a new PokemonTable
+
+        Raises:
+            InvalidParameterError: If the column does not exist
+        """
+        if isinstance(key, str):
+            return self._column(key)
+        return self._from_columns(
+            {name: column[key] for name, column in self._columns.items()},
+            self.type_names,
+        )
+
+    def _column(self, name):
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise InvalidParameterError(f"Unknown column: {name}")
+
+    def _numeric(self, name):
+        column = self._column(name)
+        if column.dtype == object:
+            raise InvalidParameterError(f"Column is not numeric: {name}")
+        return column
+
+    def type_mask(self, *names):
+        """
+        Get the bitmask of types in the "types" column
+
+        Args:
+            *names: Type names
+
+        Returns:
+            Bitmask as a NumPy unsigned integer, or None if a type does not
+            occur in the table
+        """
+        mask = 0
+        for name in names:
+            if name not in self.type_names:
+                return None
+            mask |= 1 << self.type_names.index(name)
+        return np.uint64(mask)
+
+    def where(self, type=None, **conditions):
+        """
+        Select the rows matching every condition
+
+        Conditions are column=value for equality, or column__op=value with
+        op one of eq, ne, lt, le, gt, ge and in. ``type`` keeps the
+        Pokemon having the type, or all of the types if given a list, and
+        ``type__in`` those having any of the listed types.
+
+        Args:
+            type: Type name or list of type names
+            **conditions: Conditions on columns
+
+        Returns:
+            New PokemonTable of the matching rows
+
+        Raises:
+            InvalidParameterError: If a column or operator does not exist
+        """
+        keep = np.ones(len(self), dtype=bool)
+        if type is not None:
+            keep &= self._has_types([type] if isinstance(type, str) else type, all)
+        for key, value in conditions.items():
+            name, _, op = key.partition("__")
+            if name == "type" and op == "in":
+                keep &= self._has_types(value, any)
+                continue
+            compare = _OPERATORS.get(op or "eq")
+            if compare is None:
+                raise InvalidParameterError(f"Unknown operator: {op}")
+            keep &= compare(self._column(name), value)
+        return self[keep]
+
+    def _has_types(self, names, combine):
+        types = self._columns["types"]
+        if combine is all:
+            mask = self.type_mask(*names)
+            if mask is None:
+                return np.zeros(len(self), dtype=bool)
+            return (types & mask) == mask
+        mask = self.type_mask(*(name for name in names if name in self.type_names))
+        return (types & mask) != 0
+
+    def sort(self, column, descending=False):
+        """
+        Sort the rows by a column
+
+        The sort is stable, and NaN values go last.
+
+        Args:
+            column: Column name
+            descending: Whether to sort from the largest value
+                (default: False)
+
+        Returns:
+            New sorted PokemonTable
+
+        Raises:
+            InvalidParameterError: If the column does not exist
+        """
+        values = self._column(column)
+        if values.dtype == object:
+            order = np.argsort(values, kind="stable")
+            if descending:
+                order = order[::-1]
+        elif descending:
+            # Negating keeps equal values in their original order
+            order = np.argsort(-values.astype(np.float64), kind="stable")
+        else:
+            order = np.argsort(values, kind="stable")
+        return self[order]
+
+    def top_k(self, column, k):
+        """
+        Get the k rows with the largest values of a column
+
+        Only the top k rows are sorted, so this is cheaper than a full
+        sort on large tables.
+
+        Args:
+            column: Name of a numeric column
+            k: Number of rows
+
+        Returns:
+            New PokemonTable of at most k rows, largest first
+
+        Raises:
+            InvalidParameterError: If the column does not exist or is not
+                numeric
+        """
+        values = -self._numeric(column).astype(np.float64)
+        if k <= 0:
+            return self[:0]
+        if k < len(self):
+            candidates = np.argpartition(values, k - 1)[:k]
+            candidates.sort()
+            order = candidates[np.argsort(values[candidates], kind="stable")]
+        else:
+            order = np.argsort(values, kind="stable")
+        return self[order]
+
+    def percentile(self, column, q):
+        """
+        Get percentiles of a column, ignoring missing values
+
+        Args:
+            column: Name of a numeric column
+            q: Percentile or sequence of percentiles, between 0 and 100
+
+        Returns:
+            Float, or array of floats for a sequence of percentiles; NaN if
+            the column has no values
+
+        Raises:
+            InvalidParameterError: If the column does not exist or is not
+                numeric
+        """
+        values = self._numeric(column)
+        if values.dtype.kind == "f":
+            values = values[~np.isnan(values)]
+        if not len(values):
+            return np.full(np.shape(q), np.nan)[()]
+        return np.percentile(values, q)
+
+    def types_of(self, row):
+        """
+        Get the type names of a row
+
+        Args:
+            row: Row number
+
+        Returns:
+            List of type names, in ``type_names`` order
+        """
+        mask = int(self._columns["types"][row])
+        return [name for bit, name in enumerate(self.type_names) if mask >> bit & 1]
+
+    def rows(self):
+        """
+        Iterate over the rows as dictionaries
+
+        Returns:
+            Iterator of dictionaries with one key per column; "types" holds
+            the type names
+        """
+        names = [name for name in self._columns if name != "types"]
+        columns = [self._columns[name].tolist() for name in names]
+        for row, values in enumerate(zip(*columns)):
+            record = dict(zip(names, values))
+            record["types"] = self.types_of(row)
+            yield record
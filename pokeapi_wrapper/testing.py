@@ -0,0 +1,529 @@
+"""
+Testing helpers for the PokéAPI wrapper
+
+Provides a small local HTTP server that serves canned PokéAPI responses and
+a generator for realistic Pokemon payloads, so the client can be exercised
+and benchmarked without touching the public API.
+"""
+
+import hashlib
+import io
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+VERSION_GROUPS = [
+    "red-blue",
+    "yellow",
+    "gold-silver",
+    "crystal",
+    "ruby-sapphire",
+    "emerald",
+    "firered-leafgreen",
+    "diamond-pearl",
+    "platinum",
+    "heartgold-soulsilver",
+    "black-white",
+    "black-2-white-2",
+    "x-y",
+    "omega-ruby-alpha-sapphire",
+    "sun-moon",
+    "ultra-sun-ultra-moon",
+    "lets-go-pikachu-lets-go-eevee",
+    "sword-shield",
+    "brilliant-diamond-and-shining-pearl",
+    "scarlet-violet",
+]
+
+MOVE_LEARN_METHODS = ["level-up", "machine", "tutor", "egg"]
+
+TYPE_NAMES = [
+    "normal",
+    "fighting",
+    "flying",
+    "poison",
+    "ground",
+    "rock",
+    "bug",
+    "ghost",
+    "steel",
+    "fire",
+    "water",
+    "grass",
+    "electric",
+    "psychic",
+    "ice",
+    "dragon",
+    "dark",
+    "fairy",
+]
+
+STAT_NAMES = [
+    "hp",
+    "attack",
+    "defense",
+    "special-attack",
+    "special-defense",
+    "speed",
+]
+
+API_ROOT = "https://pokeapi.co/api/v2/"
+
+
+def _ref(resource_type, name, resource_id):
+    return {"name": name, "url": f"{API_ROOT}{resource_type}/{resource_id}/"}
+
+
+def make_pokemon_payload(
+    pokemon_id, name=None, moves=20, version_groups=6, sprite_root=None
+):
+    """
+    Build a deterministic Pokemon payload shaped like a real API response
+
+    Args:
+        pokemon_id: ID of the Pokemon
+        name: Name of the Pokemon (default: "pokemon-<id>")
+        moves: Number of entries in the moves list
+        version_groups: Number of version group details per move
+        sprite_root: URL the sprite URLs start with (default: the
+            PokeAPI sprites repository)
+
+    Returns:
+        Pokemon JSON payload as dictionary
+    """
+    name = name or f"pokemon-{pokemon_id}"
+    first_type = (pokemon_id * 7) % len(TYPE_NAMES)
+    second_type = (pokemon_id * 11 + 3) % len(TYPE_NAMES)
+    types = [{"slot": 1, "type": _ref("type", TYPE_NAMES[first_type], first_type + 1)}]
+    if pokemon_id % 2 and second_type != first_type:
+        types.append(
+            {"slot": 2, "type": _ref("type", TYPE_NAMES[second_type], second_type + 1)}
+        )
+
+    move_list = []
+    for move_index in range(moves):
+        move_id = (pokemon_id * 13 + move_index * 17) % 900 + 1
+        details = []
+        for detail_index in range(version_groups):
+            group_index = (move_index + detail_index) % len(VERSION_GROUPS)
+            method_index = (move_index + detail_index) % len(MOVE_LEARN_METHODS)
+            details.append(
+                {
+                    "level_learned_at": (
+                        (move_index * 3) % 100 if method_index == 0 else 0
+                    ),
+                    "move_learn_method": _ref(
+                        "move-learn-method",
+                        MOVE_LEARN_METHODS[method_index],
+                        method_index + 1,
+                    ),
+                    "version_group": _ref(
+                        "version-group", VERSION_GROUPS[group_index], group_index + 1
+                    ),
+                    "order": None,
+                }
+            )
+        move_list.append(
+            {
+                "move": _ref("move", f"move-{move_id}", move_id),
+                "version_group_details": details,
+            }
+        )
+
+    sprite_root = (
+        sprite_root
+        or "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon"
+    ).rstrip("/")
+    return {
+        "id": pokemon_id,
+        "name": name,
+        "base_experience": 50 + pokemon_id % 250,
+        "height": 3 + pokemon_id % 40,
+        "weight": 20 + (pokemon_id * 37) % 2000,
+        "is_default": True,
+        "order": pokemon_id,
+        "abilities": [
+            {
+                "ability": _ref(
+                    "ability", f"ability-{pokemon_id % 300 + 1}", pokemon_id % 300 + 1
+                ),
+                "is_hidden": False,
+                "slot": 1,
+            },
+            {
+                "ability": _ref(
+                    "ability", f"ability-{pokemon_id % 50 + 1}", pokemon_id % 50 + 1
+                ),
+                "is_hidden": True,
+                "slot": 3,
+            },
+        ],
+        "forms": [_ref("pokemon-form", name, pokemon_id)],
+        "game_indices": [
+            {"game_index": pokemon_id, "version": _ref("version", group, index + 1)}
+            for index, group in enumerate(VERSION_GROUPS[:version_groups])
+        ],
+        "held_items": [],
+        "location_area_encounters": f"{API_ROOT}pokemon/{pokemon_id}/encounters",
+        "moves": move_list,
+        "past_types": [],
+        "species": _ref("pokemon-species", name, pokemon_id),
+        "sprites": {
+            "front_default": f"{sprite_root}/{pokemon_id}.png",
+            "front_shiny": f"{sprite_root}/shiny/{pokemon_id}.png",
+            "back_default": f"{sprite_root}/back/{pokemon_id}.png",
+            "back_shiny": f"{sprite_root}/back/shiny/{pokemon_id}.png",
+            "other": {},
+            "versions": {},
+        },
+        "stats": [
+            {
+                "base_stat": 20 + (pokemon_id * (index + 3)) % 140,
+                "effort": 1 if index == pokemon_id % 6 else 0,
+                "stat": _ref("stat", stat, index + 1),
+            }
+            for index, stat in enumerate(STAT_NAMES)
+        ],
+        "types": types,
+    }
+
+
+def make_type_payload(type_id):
+    """
+    Build a deterministic type payload shaped like a real API response
+
+    Args:
+        type_id: ID of the type, from 1 to len(TYPE_NAMES)
+
+    Returns:
+        Type JSON payload as dictionary
+    """
+    count = len(TYPE_NAMES)
+
+    def related(step):
+        index = (type_id * step) % count
+        return [_ref("type", TYPE_NAMES[index], index + 1)]
+
+    return {
+        "id": type_id,
+        "name": TYPE_NAMES[type_id - 1],
+        "damage_relations": {
+            "no_damage_to": [],
+            "half_damage_to": related(5),
+            "double_damage_to": related(7),
+            "no_damage_from": [],
+            "half_damage_from": related(11),
+            "double_damage_from": related(13),
+        },
+        "past_damage_relations": [],
+        "game_indices": [],
+        "generation": _ref("generation", "generation-i", 1),
+        "move_damage_class": _ref("move-damage-class", "physical", 2),
+        "names": [],
+        "pokemon": [],
+        "moves": [_ref("move", f"move-{type_id}", type_id)],
+    }
+
+
+def make_ability_payload(ability_id):
+    """
+    Build a deterministic ability payload shaped like a real API response
+
+    Args:
+        ability_id: ID of the ability
+
+    Returns:
+        Ability JSON payload as dictionary
+    """
+    return {
+        "id": ability_id,
+        "name": f"ability-{ability_id}",
+        "is_main_series": True,
+        "generation": _ref("generation", "generation-iii", 3),
+        "names": [],
+        "effect_entries": [
+            {
+                "effect": f"Effect of ability {ability_id}.",
+                "short_effect": f"Ability {ability_id}.",
+                "language": _ref("language", "en", 9),
+            }
+        ],
+        "effect_changes": [],
+        "flavor_text_entries": [],
+        "pokemon": [],
+    }
+
+
+def make_sprite_png(seed, size=96):
+    """
+    Build a small deterministic PNG resembling a sprite
+
+    Requires Pillow.
+
+    Args:
+        seed: Number varying the colors and shape of the image
+        size: Width and height of the image in pixels
+
+    Returns:
+        PNG file contents as bytes
+    """
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    color = ((seed * 53) % 256, (seed * 97) % 256, (seed * 193) % 256, 255)
+    inset = size // 8 + seed % (size // 4)
+    draw.ellipse((inset, inset, size - inset, size - inset), fill=color)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """Request handler serving the routes registered on a StubServer"""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # Headers and body are written separately; avoid Nagle stalls
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.server.stub._record_connection()
+
+    def do_GET(self):
+        stub = self.server.stub
+        parts = urlsplit(self.path)
+        path = parts.path
+        if path.startswith(stub.prefix):
+            path = path[len(stub.prefix) :]
+        path = path.strip("/")
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        stub._record_request(path, query, dict(self.headers))
+
+        stub._enter()
+        try:
+            if stub.delay:
+                time.sleep(stub.delay)
+            status, headers, body = stub.respond(path, query, self.headers)
+        finally:
+            stub._leave()
+        if body is None:
+            # Drop the connection without answering
+            self.close_connection = True
+            return
+        if status == 200 and stub.etags:
+            etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            headers = dict(headers, ETag=etag, **{"Last-Modified": stub.last_modified})
+            if self.headers.get("If-None-Match") == etag:
+                status, body = 304, b""
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server with a backlog large enough for bursts"""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class StubServer:
+    """
+    Local HTTP server that serves canned PokéAPI responses
+
+    Resources are registered by type and are reachable both by ID and by
+    name, and the bare resource type serves a paginated list honouring the
+    ``limit`` and ``offset`` query parameters. Static files, such as
+    sprites, can be served from any path under ``root_url``. The server
+    counts requests, TCP connections and the peak number of requests in
+    flight so tests can assert on upstream traffic. Successful responses
+    carry an ETag and conditional requests with a matching If-None-Match
+    get a 304.
+
+    Args:
+        host: Interface to listen on
+        port: Port to listen on (default: any free port)
+        delay: Seconds to wait before answering each request
+    """
+
+    prefix = "/api/v2/"
+    last_modified = "Sat, 01 Jan 2022 00:00:00 GMT"
+
+    def __init__(self, host="127.0.0.1", port=0, delay=0.0):
+        self._server = _StubHTTPServer((host, port), _StubRequestHandler)
+        self._server.stub = self
+        self._thread = None
+        self._lock = threading.Lock()
+        self.resources = {}
+        self.files = {}
+        self.delay = delay
+        self.etags = True
+        self.requests = []
+        self.connection_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def base_url(self):
+        """Base URL to pass to the client"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.prefix}"
+
+    @property
+    def root_url(self):
+        """URL of the server root, for static files"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def request_count(self):
+        """Number of requests received so far"""
+        with self._lock:
+            return len(self.requests)
+
+    def add_resource(self, resource_type, payload):
+        """
+        Register a resource payload, reachable by its ID and its name
+
+        Args:
+            resource_type: Type of resource (e.g., 'pokemon')
+            payload: JSON payload as dictionary
+        """
+        self.resources.setdefault(resource_type, {})[payload["id"]] = payload
+
+    def add_pokemon(self, payload):
+        """Register a Pokemon payload"""
+        self.add_resource("pokemon", payload)
+
+    def add_file(self, path, body, content_type="image/png"):
+        """
+        Register a static file
+
+        Args:
+            path: Path of the file relative to root_url
+            body: File contents as bytes
+            content_type: Content-Type the file is served with
+        """
+        self.files[path.strip("/")] = (content_type, body)
+
+    def reset_counters(self):
+        """Forget the requests and connections seen so far"""
+        with self._lock:
+            self.requests = []
+            self.connection_count = 0
+            self.max_in_flight = 0
+
+    def respond(self, path, query, headers):
+        """
+        Build the response for a request
+
+        Args:
+            path: Request path relative to the API root, without slashes
+            query: Query parameters as dictionary
+            headers: Request headers
+
+        Returns:
+            Tuple of (status, headers, body); a body of None drops the
+            connection without answering
+        """
+        static = self.files.get(path)
+        if static is not None:
+            return 200, {"Content-Type": static[0]}, static[1]
+
+        segments = path.split("/")
+        resources = self.resources.get(segments[0])
+        if resources is None or len(segments) > 2:
+            return self._json(404, {"detail": "Not found."})
+
+        if len(segments) == 1:
+            return self._json(200, self._list_page(segments[0], resources, query))
+
+        identifier = segments[1]
+        if identifier.isdigit():
+            payload = resources.get(int(identifier))
+        else:
+            payload = next(
+                (item for item in resources.values() if item["name"] == identifier),
+                None,
+            )
+        if payload is None:
+            return self._json(404, {"detail": "Not found."})
+        return self._json(200, payload)
+
+    def _list_page(self, resource_type, resources, query):
+        limit = int(query.get("limit", 20))
+        offset = int(query.get("offset", 0))
+        items = sorted(resources.values(), key=lambda item: item["id"])
+        page = items[offset : offset + limit]
+        base = f"{API_ROOT}{resource_type}/"
+        next_url = None
+        if offset + limit < len(items):
+            next_url = (
+                f"{API_ROOT}{resource_type}?offset={offset + limit}&limit={limit}"
+            )
+        previous_url = None
+        if offset > 0:
+            previous_url = (
+                f"{API_ROOT}{resource_type}?offset={max(offset - limit, 0)}"
+                f"&limit={limit}"
+            )
+        return {
+            "count": len(items),
+            "next": next_url,
+            "previous": previous_url,
+            "results": [
+                {"name": item["name"], "url": f"{base}{item['id']}/"} for item in page
+            ],
+        }
+
+    def _json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        return status, {"Content-Type": "application/json"}, body
+
+    def _record_request(self, path, query, headers):
+        with self._lock:
+            self.requests.append((path, query, headers))
+
+    def _enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _leave(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def _record_connection(self):
+        with self._lock:
+            self.connection_count += 1
+
+    def start(self):
+        """Start serving in a background thread"""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the socket"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
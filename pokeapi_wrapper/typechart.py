@@ -0,0 +1,247 @@
+"""
+Type effectiveness chart for the PokéAPI wrapper
+
+The chart turns the damage relations of the type resources into a matrix
+of multipliers, attacking types by defending types, so that matchups
+against whole lists of Pokemon are computed as NumPy operations.
+"""
+
+from itertools import chain, combinations
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .exceptions import InvalidParameterError
+
+# The types with damage relations, in ID order
+STANDARD_TYPES = (
+    "normal",
+    "fighting",
+    "flying",
+    "poison",
+    "ground",
+    "rock",
+    "bug",
+    "ghost",
+    "steel",
+    "fire",
+    "water",
+    "grass",
+    "electric",
+    "psychic",
+    "ice",
+    "dragon",
+    "dark",
+    "fairy",
+)
+
+_MULTIPLIERS = (
+    ("no_damage_to", 0.0),
+    ("half_damage_to", 0.5),
+    ("double_damage_to", 2.0),
+)
+
+# Number of type combinations scored at a time by best_coverage
+_COMBINATIONS_PER_CHUNK = 4096
+
+
+class TypeChart:
+    """
+    Matrix of damage multipliers between types
+
+    ``matrix[a, d]`` is the multiplier of a move of type ``type_names[a]``
+    against a Pokemon of the single type ``type_names[d]``; a dual-typed
+    Pokemon takes the product of both columns. Only the current damage
+    relations are used, not past_damage_relations.
+
+    Defenders are given as a type name, a sequence of one or two type
+    names, or anything with Pokemon-like ``types`` (Pokemon models or
+    snapshot views). ``PokeAPI.get_type_chart`` builds the chart once per
+    client. Requires NumPy, installed with the ``analytics`` extra.
+    """
+
+    def __init__(self, types):
+        """
+        Initialize the chart
+
+        Args:
+            types: Iterable of Type models; relations to types outside of
+                it are ignored
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError(
+                "TypeChart requires numpy; install it with "
+                "'pip install pkmn_api_wrapper_yotaenom[analytics]'"
+            )
+        types = list(types)
+        self.type_names = tuple(t.name for t in types)
+        self._index = {name: i for i, name in enumerate(self.type_names)}
+
+        size = len(types)
+        # One extra column of ones stands in for the missing second type
+        padded = np.ones((size, size + 1))
+        for attacker, t in enumerate(types):
+            relations = t.damage_relations
+            if relations is None:
+                continue
+            for field, multiplier in _MULTIPLIERS:
+                for defender in getattr(relations, field):
+                    column = self._index.get(defender.name)
+                    if column is not None:
+                        padded[attacker, column] = multiplier
+        padded.flags.writeable = False
+        self._padded = padded
+        self.matrix = padded[:, :size]
+
+    def __repr__(self):
+        return f"TypeChart({len(self.type_names)} types)"
+
+    def _type_index(self, name):
+        try:
+            return self._index[name]
+        except KeyError:
+            raise InvalidParameterError(f"Unknown type: {name}")
+
+    def _defender_indexes(self, defender):
+        """Get the two padded matrix columns of a defender"""
+        if isinstance(defender, str):
+            names = (defender,)
+        elif hasattr(defender, "types"):
+            names = [t.type.name for t in defender.types if t.type is not None]
+        else:
+            names = tuple(defender)
+        if not 1 <= len(names) <= 2:
+            raise InvalidParameterError(
+                f"A defender has one or two types, not {len(names)}"
+            )
+        first = self._type_index(names[0])
+        second = self._type_index(names[1]) if len(names) == 2 else len(self._index)
+        return first, second
+
+    def multiplier(self, attacking, defender):
+        """
+        Get the damage multiplier of one attacking type against a defender
+
+        Args:
+            attacking: Name of the attacking type
+            defender: Type name, one or two type names, or a Pokemon
+
+        Returns:
+            Multiplier as a float (0, 0.25, 0.5, 1, 2 or 4)
+
+        Raises:
+            InvalidParameterError: If a type is unknown
+        """
+        first, second = self._defender_indexes(defender)
+        row = self._padded[self._type_index(attacking)]
+        return float(row[first] * row[second])
+
+    def matchups(self, defender):
+        """
+        Get the multiplier of every attacking type against a defender
+
+        Args:
+            defender: Type name, one or two type names, or a Pokemon
+
+        Returns:
+            Dictionary mapping each attacking type name to its multiplier
+
+        Raises:
+            InvalidParameterError: If a type is unknown
+        """
+        column = self.against([defender])[:, 0]
+        return dict(zip(self.type_names, column.tolist()))
+
+    def against(self, defenders):
+        """
+        Get the multiplier of every attacking type against many defenders
+
+        Args:
+            defenders: Iterable of defenders, each a type name, one or two
+                type names, or a Pokemon
+
+        Returns:
+            Array of shape (number of types, number of defenders)
+
+        Raises:
+            InvalidParameterError: If a type is unknown
+        """
+        pairs = [self._defender_indexes(defender) for defender in defenders]
+        if not pairs:
+            return np.empty((len(self.type_names), 0))
+        first, second = np.array(pairs, dtype=np.intp).T
+        return self._padded[:, first] * self._padded[:, second]
+
+    def coverage(self, attacking, defenders):
+        """
+        Get the best multiplier a set of attacking types has on each defender
+
+        Args:
+            attacking: Iterable of attacking type names, e.g. the move
+                types of a team
+            defenders: Iterable of defenders
+
+        Returns:
+            Array with the best multiplier against each defender
+
+        Raises:
+            InvalidParameterError: If a type is unknown or attacking is
+                empty
+        """
+        rows = [self._type_index(name) for name in attacking]
+        if not rows:
+            raise InvalidParameterError("No attacking types given")
+        return self.against(defenders)[rows].max(axis=0)
+
+    def best_coverage(self, defenders, size=4, candidates=None):
+        """
+        Find the attacking types hitting the most defenders super-effectively
+
+        Every combination of ``size`` candidate types is scored, e.g. the
+        four move types of a Pokemon or one type per member of a team of
+        six, by how many defenders at least one of them hits
+        super-effectively (a multiplier above 1). Ties go to the
+        combination coming first in candidate order.
+
+        Args:
+            defenders: Iterable of defenders to cover
+            size: Number of attacking types to pick (default: 4)
+            candidates: Attacking type names to pick from (default: every
+                type of the chart)
+
+        Returns:
+            Tuple of (list of type names, number of defenders covered)
+
+        Raises:
+            InvalidParameterError: If a type is unknown or size does not
+                fit the candidates
+        """
+        names = list(self.type_names if candidates is None else candidates)
+        if not 1 <= size <= len(names):
+            raise InvalidParameterError(
+                f"Cannot pick {size} types out of {len(names)} candidates"
+            )
+        rows = [self._type_index(name) for name in names]
+        # One bit per defender, so a combination's coverage is an OR
+        hits = np.packbits(self.against(defenders)[rows] > 1, axis=1)
+        popcount = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1)
+        popcount = popcount.sum(axis=1)
+
+        groups = np.fromiter(
+            chain.from_iterable(combinations(range(len(names)), size)),
+            dtype=np.intp,
+        ).reshape(-1, size)
+        best, best_count = None, -1
+        for start in range(0, len(groups), _COMBINATIONS_PER_CHUNK):
+            chunk = groups[start : start + _COMBINATIONS_PER_CHUNK]
+            covered = np.bitwise_or.reduce(hits[chunk], axis=1)
+            counts = popcount[covered].sum(axis=1)
+            top = int(counts.argmax())
+            if counts[top] > best_count:
+                best, best_count = chunk[top], int(counts[top])
+        return [names[i] for i in best], best_count
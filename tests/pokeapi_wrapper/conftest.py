@@ -0,0 +1,15 @@
+"""
+Shared fixtures for the PokéAPI wrapper tests.
+"""
+
+import pytest
+from pokeapi_wrapper.testing import StubServer, make_pokemon_payload
+
+
+@pytest.fixture
+def stub_server():
+    """A local stub server serving Pikachu and Bulbasaur."""
+    with StubServer() as server:
+        server.add_pokemon(make_pokemon_payload(25, "pikachu"))
+        server.add_pokemon(make_pokemon_payload(1, "bulbasaur"))
+        yield server
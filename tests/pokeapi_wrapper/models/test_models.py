@@ -3,12 +3,19 @@ Tests for the Pokemon models.
 """
 
 import copy
+import pickle
+
+import pytest
+from pokeapi_wrapper.models.base import VersionGameIndex, intern_resource
 from pokeapi_wrapper.models.pokemon import (
     Pokemon,
     PokemonAbility,
+    PokemonMove,
+    PokemonMoveVersion,
     PokemonType,
     PokemonSprites,
 )
+from pokeapi_wrapper.testing import make_pokemon_payload
 
 POKEMON_TEST_DATA = {
     "id": 25,
@@ -198,3 +205,86 @@ class TestPokemonSprites:
         assert sprites.back_shiny_female is None
         assert sprites.other == {}
         assert sprites.versions == {}
+
+
+class TestPokemonLazyHydration:
+    """Tests for lazy hydration of the heavy Pokemon fields."""
+
+    def test_lazy_fields_hydrate_on_access(self):
+        """Test that lazy fields match eager hydration once read."""
+        data = make_pokemon_payload(151, "mew", moves=10, version_groups=3)
+        eager = Pokemon(**copy.deepcopy(data))
+        lazy = Pokemon(lazy=True, **copy.deepcopy(data))
+
+        assert lazy.name == "mew"
+        assert len(lazy.moves) == len(eager.moves) == 10
+        assert isinstance(lazy.moves[0], PokemonMove)
+        assert isinstance(lazy.moves[0].version_group_details[0], PokemonMoveVersion)
+        assert (
+            lazy.moves[3].version_group_details[2].version_group
+            == eager.moves[3].version_group_details[2].version_group
+        )
+        assert isinstance(lazy.game_indices[0], VersionGameIndex)
+        assert lazy.held_items == [] and lazy.past_types == []
+
+    def test_lazy_fields_are_memoized(self):
+        """Test that a lazy field is hydrated only once."""
+        pokemon = Pokemon(lazy=True, **make_pokemon_payload(151, moves=3))
+
+        assert pokemon.moves is pokemon.moves
+        assert pokemon.game_indices is pokemon.game_indices
+
+    def test_lazy_fields_can_be_assigned(self):
+        """Test that assigning a lazy field replaces the raw JSON."""
+        pokemon = Pokemon(lazy=True, **make_pokemon_payload(151, moves=3))
+        pokemon.moves = []
+
+        assert pokemon.moves == []
+
+
+class TestNamedAPIResource:
+    """Tests for the interned NamedAPIResource references."""
+
+    def test_identical_references_are_shared(self):
+        """Test that identical references across Pokemon are one object."""
+        first = Pokemon(**make_pokemon_payload(1, moves=5))
+        second = Pokemon(**make_pokemon_payload(2, moves=5))
+
+        first_method = first.moves[0].version_group_details[0].move_learn_method
+        second_method = second.moves[0].version_group_details[0].move_learn_method
+        assert first_method is second_method
+        assert first.stats[0].stat is second.stats[0].stat
+
+    def test_behaves_like_a_reference_dict(self):
+        """Test that an interned reference reads like the raw dictionary."""
+        data = {"name": "electric", "url": "https://pokeapi.co/api/v2/type/13/"}
+        resource = intern_resource(dict(data))
+
+        assert resource["name"] == "electric"
+        assert resource.url == data["url"]
+        assert resource == data
+        assert dict(resource) == data
+
+    def test_is_immutable(self):
+        """Test that shared references cannot be modified."""
+        resource = intern_resource({"name": "hp", "url": "https://example.com/1/"})
+
+        with pytest.raises(AttributeError):
+            resource.name = "attack"
+
+    def test_pickle_round_trip_is_interned(self):
+        """Test that unpickled references resolve to the shared object."""
+        pokemon = Pokemon(**make_pokemon_payload(25, "pikachu", moves=3))
+        restored = pickle.loads(pickle.dumps(pokemon))
+
+        assert restored.name == "pikachu"
+        assert restored.types[0].type is pokemon.types[0].type
+        assert len(restored.moves) == 3
+
+    def test_models_have_no_instance_dict(self):
+        """Test that the models are slotted."""
+        pokemon = Pokemon(**make_pokemon_payload(25, "pikachu", moves=3))
+
+        assert not hasattr(pokemon, "__dict__")
+        assert not hasattr(pokemon.moves[0], "__dict__")
+        assert not hasattr(pokemon.moves[0].version_group_details[0], "__dict__")
@@ -0,0 +1,166 @@
+"""
+Tests for the schema-compiled model constructors.
+"""
+
+import pickle
+
+import pytest
+from pokeapi_wrapper.models.base import NamedAPIResource, intern_resource
+from pokeapi_wrapper.models.pokemon import Pokemon, PokemonMove, PokemonMoveVersion
+from pokeapi_wrapper.models.schema import (
+    nested,
+    nested_list,
+    ref,
+    ref_list,
+    schema_model,
+    value,
+)
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+
+@schema_model
+class Leaf:
+    """Leaf model"""
+
+    SCHEMA = {"label": value("none"), "kind": ref()}
+
+
+@schema_model
+class Tree:
+    """Tree model"""
+
+    SCHEMA = {
+        "name": value(),
+        "meta": value(factory=dict),
+        "root": nested(Leaf),
+        "tags": ref_list(),
+        "leaves": nested_list(Leaf, lazy=True),
+    }
+
+    def leaf_labels(self):
+        return [leaf.label for leaf in self.leaves]
+
+
+REF = {"name": "oak", "url": "https://example.org/kind/1/"}
+TREE = {
+    "name": "tree",
+    "root": {"label": "root", "kind": REF},
+    "tags": [REF],
+    "leaves": [{"label": "a", "kind": REF}, {"kind": REF}],
+    "unknown": 1,
+}
+
+
+class TestSchemaModel:
+    """Tests for the schema_model decorator."""
+
+    def test_compiled_class(self):
+        """Test the slots, fields and methods of a compiled model."""
+        tree = Tree.from_json(TREE)
+
+        assert Tree.__name__ == "Tree"
+        assert Tree.__doc__ == "Tree model"
+        assert Tree.FIELDS == {"name", "meta", "root", "tags", "leaves"}
+        assert not hasattr(tree, "__dict__")
+        assert tree.leaf_labels() == ["a", "none"]
+
+    @pytest.mark.parametrize("build", [Tree.from_json, lambda data: Tree(**data)])
+    def test_builds_nested_fields(self, build):
+        """Test that from_json and __init__ build the same objects."""
+        tree = build(TREE)
+
+        assert tree.name == "tree"
+        assert tree.meta == {}
+        assert isinstance(tree.root, Leaf)
+        assert tree.root.kind is intern_resource(REF)
+        assert tree.tags == [REF]
+        assert isinstance(tree.tags[0], NamedAPIResource)
+        assert [leaf.label for leaf in tree.leaves] == ["a", "none"]
+
+    def test_missing_fields_use_defaults(self):
+        """Test that missing and empty fields get their defaults."""
+        for tree in (Tree.from_json({}), Tree()):
+            assert tree.name is None
+            assert tree.meta == {}
+            assert tree.root is None
+            assert tree.tags == []
+            assert tree.leaves == []
+
+        assert Tree().meta is not Tree().meta
+
+    def test_init_accepts_built_objects(self):
+        """Test that __init__ keeps objects that are already built."""
+        leaf = Leaf(label="built")
+
+        tree = Tree(root=leaf, leaves=[leaf, {"label": "raw"}])
+
+        assert tree.root is leaf
+        assert tree.leaves[0] is leaf
+        assert tree.leaves[1].label == "raw"
+
+    def test_lazy_field(self):
+        """Test that lazy lists keep their JSON until first read."""
+        tree = Tree.from_json(TREE, lazy=True)
+
+        assert type(tree._leaves).__name__ == "_Unhydrated"
+        assert tree.leaves[0].label == "a"
+        assert isinstance(tree._leaves, list)
+
+    def test_reference_with_reused_url(self):
+        """Test that a reference is not confused with another of its URL."""
+        renamed = dict(REF, name="elm")
+
+        tree = Tree.from_json({"root": {"kind": REF}, "leaves": [{"kind": renamed}]})
+
+        assert tree.root.kind.name == "oak"
+        assert tree.leaves[0].kind.name == "elm"
+
+    def test_pickles_as_tuple(self):
+        """Test that instances pickle as a tuple of their slots."""
+        tree = Tree.from_json(TREE, lazy=True)
+
+        state = tree.__getstate__()
+        restored = pickle.loads(pickle.dumps(tree))
+
+        assert type(state) is tuple and state[0] == "tree"
+        assert restored.root.kind is tree.root.kind
+        assert restored.leaf_labels() == ["a", "none"]
+
+
+class TestPokemonSchema:
+    """Tests for the Pokemon models generated from schemas."""
+
+    def test_from_json_matches_init(self):
+        """Test that the fast path builds the same Pokemon as __init__."""
+        data = make_pokemon_payload(6, moves=5)
+
+        fast = Pokemon.from_json(data)
+        slow = Pokemon(**data)
+
+        for field in Pokemon.FIELDS - {"moves", "sprites", "stats", "types"}:
+            assert type(getattr(fast, field)) is type(getattr(slow, field))
+        assert [m.move for m in fast.moves] == [m.move for m in slow.moves]
+        assert isinstance(fast.moves[0], PokemonMove)
+        assert isinstance(fast.moves[0].version_group_details[0], PokemonMoveVersion)
+        assert fast.stats[0].base_stat == slow.stats[0].base_stat
+        assert fast.types[0].type is slow.types[0].type
+        assert fast.sprites.front_default == slow.sprites.front_default
+
+    def test_empty_lists(self):
+        """Test that empty lists no longer crash the constructor."""
+        data = dict(make_pokemon_payload(1), abilities=[], types=[], stats=[])
+
+        for pokemon in (Pokemon(**data), Pokemon.from_json(data)):
+            assert pokemon.abilities == []
+            assert pokemon.types == []
+            assert pokemon.stats == []
+
+    def test_input_is_not_modified(self):
+        """Test that building a Pokemon leaves the payload untouched."""
+        data = make_pokemon_payload(4, moves=2)
+        before = repr(data)
+
+        Pokemon.from_json(data)
+        Pokemon(lazy=True, **data).moves
+
+        assert repr(data) == before
@@ -4,7 +4,17 @@ Tests for the PokeAPI client.
 
 import pytest
 from pokeapi_wrapper.api import PokeAPI
-from pokeapi_wrapper.exceptions import ResourceNotFoundError
+from pokeapi_wrapper.cache import ResourceCache
+from pokeapi_wrapper.exceptions import InvalidParameterError, ResourceNotFoundError
+from pokeapi_wrapper.models.ability import Ability
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.models.type import Type
+from pokeapi_wrapper.testing import (
+    TYPE_NAMES,
+    make_ability_payload,
+    make_pokemon_payload,
+    make_type_payload,
+)
 
 
 class TestPokeAPI:
@@ -52,3 +62,266 @@ class TestPokeAPI:
         # This should raise a ResourceNotFoundError
         with pytest.raises(ResourceNotFoundError):
             api.get_pokemon("not-a-pokemon")
+
+
+class TestPokeAPISession:
+    """Tests for the pooled HTTP session of the PokeAPI client."""
+
+    def test_connections_are_reused(self, stub_server):
+        """Test that sequential requests share one keep-alive connection."""
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            for _ in range(5):
+                assert api.get_pokemon("pikachu").id == 25
+
+        assert stub_server.request_count == 5
+        assert stub_server.connection_count == 1
+
+    def test_default_headers_are_sent(self, stub_server):
+        """Test that default headers are attached to every request."""
+        with PokeAPI(
+            base_url=stub_server.base_url, headers={"User-Agent": "dex-worker/1.0"}
+        ) as api:
+            api.get_pokemon(1)
+
+        path, query, headers = stub_server.requests[0]
+        assert path == "pokemon/1"
+        assert headers["User-Agent"] == "dex-worker/1.0"
+
+    def test_not_found_against_stub(self, stub_server):
+        """Test that a 404 from the server maps to ResourceNotFoundError."""
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            with pytest.raises(ResourceNotFoundError):
+                api.get_pokemon("missingno")
+
+    def test_close_releases_connections(self, stub_server):
+        """Test that close() empties the connection pool."""
+        api = PokeAPI(base_url=stub_server.base_url)
+        api.get_pokemon(25)
+        api.close()
+
+        # A closed session reconnects on the next request
+        api.get_pokemon(25)
+        api.close()
+        assert stub_server.connection_count == 2
+
+
+class TestPokeAPIBatch:
+    """Tests for the batch lookups of the PokeAPI client."""
+
+    def test_get_pokemon_many_keeps_order(self, stub_server):
+        """Test that results come back in input order."""
+        for pokemon_id in range(2, 12):
+            stub_server.add_pokemon(make_pokemon_payload(pokemon_id))
+        identifiers = [11, 3, "pikachu", 7, 2]
+
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            results = api.get_pokemon_many(identifiers, max_workers=4)
+
+        assert [pokemon.id for pokemon in results] == [11, 3, 25, 7, 2]
+
+    def test_get_pokemon_many_dedupes_aliases(self, stub_server):
+        """Test that a name and an ID of the same Pokemon are fetched once."""
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            api.get_pokemon_list(limit=10)
+            stub_server.reset_counters()
+            results = api.get_pokemon_many(["pikachu", 25, "25", "PIKACHU", 1])
+
+        assert [pokemon.id for pokemon in results] == [25, 25, 25, 25, 1]
+        assert results[0] is results[1]
+        assert stub_server.request_count == 2
+
+    def test_get_pokemon_many_merges_aliases_on_a_new_client(self, stub_server):
+        """Test that a name and an ID share one result before any alias is known."""
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            results = api.get_pokemon_many(["pikachu", 25, 1])
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            streamed = list(api.iter_pokemon_many(["bulbasaur", 1]))
+
+        assert [pokemon.id for pokemon in results] == [25, 25, 1]
+        assert results[0] is results[1]
+        assert [pokemon.id for _, pokemon in streamed] == [1]
+
+    def test_get_pokemon_many_reports_failures(self, stub_server):
+        """Test that failures are reported per item with return_exceptions."""
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            results = api.get_pokemon_many(
+                ["pikachu", "missingno", 1], return_exceptions=True
+            )
+            with pytest.raises(ResourceNotFoundError):
+                api.get_pokemon_many(["pikachu", "missingno"])
+
+        assert results[0].name == "pikachu"
+        assert isinstance(results[1], ResourceNotFoundError)
+        assert results[2].name == "bulbasaur"
+
+    def test_iter_pokemon_many_streams_results(self, stub_server):
+        """Test the streaming variant and the progress callback."""
+        calls = []
+
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            results = dict(
+                api.iter_pokemon_many(
+                    [1, 25, 1], progress=lambda done, total: calls.append((done, total))
+                )
+            )
+
+        assert {key: pokemon.name for key, pokemon in results.items()} == {
+            1: "bulbasaur",
+            25: "pikachu",
+        }
+        assert calls == [(1, 2), (2, 2)]
+
+
+class TestPokeAPIHydration:
+    """Tests for how the PokeAPI client builds models."""
+
+    def test_lazy_hydration(self, stub_server):
+        """Test that lazy_hydration defers building the moves."""
+        with PokeAPI(base_url=stub_server.base_url, lazy_hydration=True) as api:
+            pokemon = api.get_pokemon("pikachu")
+
+        assert type(pokemon._moves).__name__ == "_Unhydrated"
+        assert pokemon.moves[0].move["name"].startswith("move-")
+
+    def test_field_projection(self, stub_server):
+        """Test that only the requested fields are populated."""
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            pokemon = api.get_pokemon("pikachu", fields=["types", "stats"])
+
+        assert (pokemon.id, pokemon.name) == (25, "pikachu")
+        assert pokemon.types[0].type["name"] == "psychic"
+        assert len(pokemon.stats) == 6
+        assert pokemon.moves == []
+        assert pokemon.height is None and pokemon.sprites is None
+
+    def test_field_projection_rejects_unknown_fields(self, stub_server):
+        """Test that unknown field names are rejected before any request."""
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            with pytest.raises(InvalidParameterError):
+                api.get_pokemon("pikachu", fields=["types", "typos"])
+
+        assert stub_server.request_count == 0
+
+
+class TestPokeAPIPagination:
+    """Tests for the streaming paginator of the PokeAPI client."""
+
+    @pytest.fixture
+    def catalogue(self, stub_server):
+        for pokemon_id in range(2, 46):
+            if pokemon_id != 25:
+                stub_server.add_pokemon(make_pokemon_payload(pokemon_id))
+        return stub_server
+
+    def test_iter_pokemon_yields_everything_in_order(self, catalogue):
+        """Test that prefetching yields the whole catalogue in order."""
+        with PokeAPI(base_url=catalogue.base_url) as api:
+            items = list(api.iter_pokemon(page_size=10, prefetch=2))
+
+        assert [item["id"] for item in items] == list(range(1, 46))
+        assert catalogue.request_count == 5
+
+    def test_sharded_fetches_pages_concurrently(self, catalogue):
+        """Test that sharded mode fetches the remaining pages at once."""
+        catalogue.delay = 0.05
+        with PokeAPI(base_url=catalogue.base_url) as api:
+            items = list(api.iter_pokemon(page_size=5, sharded=True))
+
+        assert [item["id"] for item in items] == list(range(1, 46))
+        assert catalogue.request_count == 9
+        assert catalogue.max_in_flight > 1
+
+    def test_abandoned_iteration_stops(self, catalogue):
+        """Test that closing the generator stops fetching further pages."""
+        with PokeAPI(base_url=catalogue.base_url) as api:
+            items = api.iter_pokemon(page_size=5, prefetch=1)
+            first = [next(items) for _ in range(3)]
+            items.close()
+
+        assert [item["id"] for item in first] == [1, 2, 3]
+        assert catalogue.request_count <= 2
+
+
+class TestPokeAPIResolve:
+    """Tests for resolving the references of a batch of models."""
+
+    @pytest.fixture
+    def pokedex(self, stub_server):
+        for pokemon_id in range(2, 501):
+            if pokemon_id != 25:
+                stub_server.add_pokemon(make_pokemon_payload(pokemon_id, moves=2))
+        for type_id in range(1, len(TYPE_NAMES) + 1):
+            stub_server.add_resource("type", make_type_payload(type_id))
+        for ability_id in range(1, 301):
+            stub_server.add_resource("ability", make_ability_payload(ability_id))
+        return stub_server
+
+    def test_one_request_per_distinct_reference(self, pokedex):
+        """Test that references shared across the batch are fetched once."""
+        with PokeAPI(base_url=pokedex.base_url) as api:
+            pokemon = api.get_pokemon_many(range(1, 501))
+            pokedex.reset_counters()
+            resolved = api.resolve(pokemon, paths=["abilities.ability"])
+
+        abilities = {a.ability.url for p in pokemon for a in p.abilities}
+        assert set(resolved) == abilities
+        assert pokedex.request_count == len(abilities)
+        for p in pokemon:
+            for a in p.abilities:
+                assert isinstance(resolved[a.ability.url], Ability)
+                assert resolved[a.ability.url].name == a.ability.name
+
+    def test_depth_follows_references(self, pokedex):
+        """Test that depth bounds the references followed along a path."""
+        path = "types.type.damage_relations.double_damage_to"
+        with PokeAPI(base_url=pokedex.base_url) as api:
+            pikachu = api.get_pokemon("pikachu")
+            pokedex.reset_counters()
+            resolved = api.resolve(pikachu, paths=[path])
+            types = [resolved[t.type.url] for t in pikachu.types]
+            assert pokedex.request_count == len(types)
+
+            pokedex.reset_counters()
+            resolved = api.resolve(pikachu, paths=[path], depth=2)
+
+        targets = {r.url: r for t in types for r in t.damage_relations.double_damage_to}
+        assert all(isinstance(t, Type) for t in types)
+        assert pokedex.request_count == len(
+            {t.type.url for t in pikachu.types} | set(targets)
+        )
+        for target in targets.values():
+            assert isinstance(resolved[target.url], Type)
+            assert resolved[target.url].name == target.name
+
+    def test_results_do_not_leak_onto_shared_references(self, pokedex):
+        """Test that resolving leaves the interned references untouched."""
+        with PokeAPI(base_url=pokedex.base_url) as api:
+            pikachu = api.get_pokemon("pikachu")
+            api.resolve(pikachu, paths=["abilities.ability"])
+
+        fresh = Pokemon.from_json(make_pokemon_payload(25, "pikachu"))
+        ability = fresh.abilities[0].ability
+        assert ability is pikachu.abilities[0].ability
+        assert not hasattr(ability, "resolved")
+        with pytest.raises(AttributeError):
+            object.__setattr__(ability, "resolved", None)
+
+    def test_resolving_again_uses_the_cache(self, pokedex):
+        """Test that a second resolve is served from the memory cache."""
+        with PokeAPI(base_url=pokedex.base_url, cache=ResourceCache()) as api:
+            pokemon = api.get_pokemon_many(range(1, 51))
+            api.resolve(pokemon, paths=["types.type"])
+            pokedex.reset_counters()
+            api.resolve(pokemon, paths=["types.type"])
+
+        assert pokedex.request_count == 0
+
+    def test_unknown_field_is_rejected(self, pokedex):
+        """Test that a misspelled path fails before any request."""
+        with PokeAPI(base_url=pokedex.base_url) as api:
+            pikachu = api.get_pokemon("pikachu")
+            pokedex.reset_counters()
+            with pytest.raises(InvalidParameterError):
+                api.resolve(pikachu, paths=["abilities.abilty"])
+
+        assert pokedex.request_count == 0
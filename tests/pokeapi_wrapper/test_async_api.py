@@ -0,0 +1,80 @@
+"""
+Tests for the asyncio PokeAPI client.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from pokeapi_wrapper.async_api import AsyncPokeAPI
+from pokeapi_wrapper.exceptions import PokeAPIError, ResourceNotFoundError
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+
+class TestAsyncPokeAPI:
+    """Tests for the AsyncPokeAPI class."""
+
+    def test_get_pokemon(self, stub_server):
+        """Test that get_pokemon builds the same Pokemon model."""
+
+        async def main():
+            async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+                return await api.get_pokemon("pikachu")
+
+        pokemon = asyncio.run(main())
+
+        assert isinstance(pokemon, Pokemon)
+        assert pokemon.id == 25
+        assert pokemon.name == "pikachu"
+        assert pokemon.types[0].type["name"] == "psychic"
+
+    def test_get_pokemon_list(self, stub_server):
+        """Test that get_pokemon_list returns a paginated response."""
+
+        async def main():
+            async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+                return await api.get_pokemon_list(limit=1, offset=1)
+
+        pokemon_list = asyncio.run(main())
+
+        assert pokemon_list.count == 2
+        assert pokemon_list.results == [
+            {
+                "id": 25,
+                "name": "pikachu",
+                "url": "https://pokeapi.co/api/v2/pokemon/25/",
+            }
+        ]
+
+    def test_error_mapping(self, stub_server):
+        """Test that HTTP errors map to the same exceptions as PokeAPI."""
+
+        async def main():
+            async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+                with pytest.raises(ResourceNotFoundError):
+                    await api.get_pokemon("missingno")
+                with pytest.raises(PokeAPIError):
+                    await api._make_request("pokemon/25/extra")
+
+        asyncio.run(main())
+
+    def test_concurrency_is_bounded(self, stub_server):
+        """Test that the semaphore caps the number of requests in flight."""
+        for pokemon_id in range(2, 41):
+            stub_server.add_pokemon(make_pokemon_payload(pokemon_id))
+        stub_server.delay = 0.02
+
+        async def main():
+            async with AsyncPokeAPI(
+                base_url=stub_server.base_url, max_concurrency=5
+            ) as api:
+                return await asyncio.gather(*(api.get_pokemon(i) for i in range(2, 41)))
+
+        results = asyncio.run(main())
+
+        assert [pokemon.id for pokemon in results] == list(range(2, 41))
+        assert stub_server.max_in_flight <= 5
+        assert stub_server.connection_count <= 5
@@ -0,0 +1,76 @@
+"""
+Tests for the bulk Pokemon loader.
+"""
+
+import gc
+import json
+
+import pytest
+from pokeapi_wrapper.bulk import load_pokemon_bulk
+from pokeapi_wrapper.exceptions import PokeAPIError
+from pokeapi_wrapper.models.base import intern_resource
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+
+@pytest.fixture
+def payloads():
+    return [
+        json.dumps(make_pokemon_payload(pokemon_id, moves=5)).encode("utf-8")
+        for pokemon_id in range(1, 41)
+    ]
+
+
+class TestLoadPokemonBulk:
+    """Tests for the load_pokemon_bulk function."""
+
+    def test_in_process(self, payloads):
+        """Test loading everything in the calling process."""
+        pokemon = load_pokemon_bulk(payloads, processes=1)
+
+        assert [p.id for p in pokemon] == list(range(1, 41))
+        assert len(pokemon[0].moves) == 5
+
+    def test_process_pool_keeps_order_and_interning(self, payloads):
+        """Test that pooled results match and share references."""
+        pokemon = load_pokemon_bulk(payloads, processes=2, chunksize=3)
+        expected = load_pokemon_bulk(payloads, processes=1)
+
+        assert [p.id for p in pokemon] == list(range(1, 41))
+        for loaded, built in zip(pokemon, expected):
+            assert [m.move for m in loaded.moves] == [m.move for m in built.moves]
+            assert loaded.sprites.front_default == built.sprites.front_default
+        hp = intern_resource(make_pokemon_payload(1)["stats"][0]["stat"])
+        assert all(p.stats[0].stat is hp for p in pokemon)
+
+    def test_lazy_and_str_payloads(self, payloads):
+        """Test lazy loading from str payloads."""
+        texts = [payload.decode("utf-8") for payload in payloads[:4]]
+
+        pokemon = load_pokemon_bulk(texts, processes=2, lazy=True)
+
+        assert type(pokemon[0]._moves).__name__ == "_Unhydrated"
+        assert pokemon[3].moves[0].move.name.startswith("move-")
+
+    def test_invalid_payload(self, payloads):
+        """Test that invalid JSON is reported from the workers."""
+        with pytest.raises(PokeAPIError):
+            load_pokemon_bulk(payloads[:3] + [b"{"], processes=2)
+
+    def test_leaves_the_collector_alone(self, payloads, monkeypatch):
+        """Test that only pause_gc pauses the calling process's collector."""
+        states = []
+        loads = json.loads
+        monkeypatch.setattr(
+            "pokeapi_wrapper.bulk.get_decoder",
+            lambda backend: lambda p: states.append(gc.isenabled()) or loads(p),
+        )
+
+        load_pokemon_bulk(payloads[:2], processes=1)
+        load_pokemon_bulk(payloads[:2], processes=1, pause_gc=True)
+
+        assert states == [True, True, False, False]
+        assert gc.isenabled()
+
+    def test_empty(self):
+        """Test that no payloads give no Pokemon."""
+        assert load_pokemon_bulk([]) == []
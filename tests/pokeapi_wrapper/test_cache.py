@@ -0,0 +1,102 @@
+"""
+Tests for the in-memory resource cache.
+"""
+
+import time
+
+import pytest
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.cache import MISSING, ResourceCache
+from pokeapi_wrapper.exceptions import InvalidParameterError
+from pokeapi_wrapper.models.pokemon import Pokemon
+
+
+class TestResourceCache:
+    """Tests for the ResourceCache class."""
+
+    def test_lru_eviction_by_entries(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResourceCache(max_entries=2)
+        cache.set(("pokemon", 1), "bulbasaur")
+        cache.set(("pokemon", 2), "ivysaur")
+        cache.get(("pokemon", 1))
+        cache.set(("pokemon", 3), "venusaur")
+
+        assert cache.get(("pokemon", 2)) is MISSING
+        assert cache.get(("pokemon", 1)) == "bulbasaur"
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        """Test that the byte budget is enforced."""
+        cache = ResourceCache(max_entries=None, max_bytes=100)
+        cache.set(("pokemon", 1), "a", size=60)
+        cache.set(("pokemon", 2), "b", size=60)
+        cache.set(("pokemon", 3), "c", size=500)
+
+        assert cache.get(("pokemon", 1)) is MISSING
+        assert cache.get(("pokemon", 3)) is MISSING
+        assert cache.stats()["bytes"] == 60
+
+    def test_per_type_ttl(self):
+        """Test that entries expire after the TTL of their resource type."""
+        cache = ResourceCache(ttl={"pokemon": 0.01, "default": None})
+        cache.set(("pokemon", 1), "bulbasaur")
+        cache.set(("type", 1), "normal")
+        time.sleep(0.02)
+
+        assert cache.get(("pokemon", 1)) is MISSING
+        assert cache.get(("type", 1)) == "normal"
+        assert cache.stats()["expirations"] == 1
+
+    def test_invalidate_and_clear(self):
+        """Test that entries can be dropped one at a time or by type."""
+        cache = ResourceCache()
+        cache.set(("pokemon", 1), "bulbasaur")
+        cache.set(("pokemon", 2), "ivysaur")
+        cache.set(("type", 1), "normal")
+
+        assert cache.invalidate(("pokemon", 1)) is True
+        assert cache.invalidate(("pokemon", 1)) is False
+        cache.clear("pokemon")
+        assert len(cache) == 1
+
+    def test_invalid_store(self):
+        """Test that an unknown store mode is rejected."""
+        with pytest.raises(InvalidParameterError):
+            ResourceCache(store="pickle")
+
+
+class TestPokeAPICache:
+    """Tests for the cache integration of the PokeAPI client."""
+
+    def test_name_and_id_share_an_entry(self, stub_server):
+        """Test that get_pokemon by name and by ID hit the same entry."""
+        cache = ResourceCache()
+        with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+            api.get_pokemon("pikachu")
+            api.get_pokemon(25)
+            api.get_pokemon("pikachu")
+
+        assert stub_server.request_count == 1
+        assert cache.stats()["hits"] == 2
+        assert len(cache) == 1
+
+    def test_model_store_returns_hydrated_objects(self, stub_server):
+        """Test that the model store skips hydration on hits."""
+        cache = ResourceCache(store="model")
+        with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+            first = api.get_pokemon(25)
+            second = api.get_pokemon("pikachu")
+
+        assert isinstance(first, Pokemon)
+        assert first is second
+        assert stub_server.request_count == 1
+
+    def test_invalidate(self, stub_server):
+        """Test that invalidated resources are fetched again."""
+        with PokeAPI(base_url=stub_server.base_url, cache=ResourceCache()) as api:
+            api.get_pokemon(25)
+            api.invalidate("pokemon", "pikachu")
+            api.get_pokemon(25)
+
+        assert stub_server.request_count == 2
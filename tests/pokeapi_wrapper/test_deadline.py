@@ -0,0 +1,201 @@
+"""
+Tests for per-call deadlines.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from pokeapi_wrapper.api import PokeAPI, cap_timeout
+from pokeapi_wrapper.deadline import (
+    current_deadline,
+    deadline_after,
+    deadline_scope,
+    remaining,
+)
+from pokeapi_wrapper.exceptions import DeadlineExceededError, NetworkError, PokeAPIError
+from pokeapi_wrapper.mirror import Mirror
+from pokeapi_wrapper.retry import RetryPolicy
+
+
+class TestDeadlineScope:
+    """Tests for the deadline helpers."""
+
+    def test_no_deadline(self):
+        """Test that there is no budget outside a scope."""
+        assert current_deadline() is None
+        assert remaining() is None
+
+    def test_nested_scopes_keep_earliest(self):
+        """Test that an inner scope cannot extend the outer deadline."""
+        with deadline_scope(deadline_after(1.0)):
+            outer = current_deadline()
+            with deadline_scope(deadline_after(10.0)):
+                assert current_deadline() == outer
+            with deadline_scope(deadline_after(0.5)):
+                assert current_deadline() < outer
+            assert 0 < remaining() <= 1.0
+        assert current_deadline() is None
+
+    def test_expired_deadline(self):
+        """Test that an expired deadline raises."""
+        with deadline_scope(time.monotonic() - 1):
+            with pytest.raises(DeadlineExceededError):
+                remaining()
+
+    def test_cap_timeout(self):
+        """Test capping plain, tuple and missing request timeouts."""
+        assert cap_timeout(None, 2) == 2
+        assert cap_timeout(5, 2) == 2
+        assert cap_timeout(1, 2) == 1
+        assert cap_timeout((3, 10), 5) == (3, 5)
+
+
+class TestPokeAPIDeadlines:
+    """Tests for the timeout argument of the PokeAPI methods."""
+
+    def test_default_request_timeout(self, stub_server):
+        """Test that requests are never sent without a timeout."""
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            assert api.timeout == 30.0
+
+    def test_slow_call_exceeds_deadline(self, stub_server):
+        """Test that a stuck response fails at the deadline."""
+        stub_server.delay = 0.5
+
+        start = time.monotonic()
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            with pytest.raises(DeadlineExceededError):
+                api.get_pokemon(25, timeout=0.1)
+
+        assert time.monotonic() - start < 0.4
+
+    def test_request_timeout_is_a_network_error(self, stub_server):
+        """Test that the client timeout still maps to NetworkError."""
+        stub_server.delay = 0.5
+
+        with PokeAPI(base_url=stub_server.base_url, timeout=0.1) as api:
+            with pytest.raises(NetworkError) as error:
+                api.get_pokemon(25, timeout=5)
+
+        assert not isinstance(error.value, DeadlineExceededError)
+
+    def test_fast_call_within_deadline(self, stub_server):
+        """Test that a call finishing in time is unaffected."""
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            assert api.get_pokemon("pikachu", timeout=5).id == 25
+            assert len(api.get_pokemon_list(timeout=5).results) == 2
+
+    def test_deadline_bounds_retries(self, stub_server):
+        """Test that retries stop once the call runs out of time."""
+        respond = stub_server.respond
+        stub_server.respond = lambda *args: (503, {}, b"{}")
+        policy = RetryPolicy(max_attempts=100, backoff_base=0.02, jitter=False)
+
+        start = time.monotonic()
+        with PokeAPI(base_url=stub_server.base_url, retry_policy=policy) as api:
+            with pytest.raises(PokeAPIError):
+                api.get_pokemon(25, timeout=0.2)
+        stub_server.respond = respond
+
+        assert time.monotonic() - start < 0.5
+        assert stub_server.request_count < 10
+
+    def test_waiting_for_shared_request_counts(self, stub_server):
+        """Test that a coalesced waiter honours its own deadline."""
+        stub_server.delay = 0.4
+
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            leader = threading.Thread(target=api.get_pokemon, args=(25,))
+            leader.start()
+            while not stub_server.in_flight:
+                time.sleep(0.005)
+            with pytest.raises(DeadlineExceededError):
+                api.get_pokemon(25, timeout=0.05)
+            leader.join()
+
+        assert stub_server.request_count == 1
+
+    def test_joined_caller_outlives_the_leader_deadline(self, stub_server):
+        """Test that a shared request failing on its starter's deadline is rerun."""
+        stub_server.delay = 0.3
+        errors = []
+
+        def leader():
+            try:
+                api.get_pokemon(25, timeout=0.1)
+            except DeadlineExceededError as e:
+                errors.append(e)
+
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            thread = threading.Thread(target=leader)
+            thread.start()
+            while not stub_server.in_flight:
+                time.sleep(0.005)
+            pokemon = api.get_pokemon(25)
+            thread.join()
+
+        assert pokemon.name == "pikachu"
+        assert len(errors) == 1
+        assert stub_server.request_count == 2
+
+    def test_batch_deadline(self, stub_server):
+        """Test that a batch deadline fails the lookups still pending."""
+        stub_server.delay = 0.2
+
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            results = api.get_pokemon_many(
+                [25, 1], max_workers=1, return_exceptions=True, timeout=0.3
+            )
+
+        assert results[0].id == 25
+        assert isinstance(results[1], DeadlineExceededError)
+
+    def test_sync_deadline(self, stub_server, tmp_path):
+        """Test that resources not synced before the deadline count as failed."""
+        respond = stub_server.respond
+
+        def slow_resources(path, query, headers):
+            if "/" in path:
+                time.sleep(0.5)
+            return respond(path, query, headers)
+
+        stub_server.respond = slow_resources
+        mirror = Mirror(tmp_path / "mirror.db")
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            start = time.monotonic()
+            stats = api.sync(mirror, timeout=0.2)
+            elapsed = time.monotonic() - start
+        mirror.close()
+
+        assert stats["failed"] == stats["count"] == 2
+        assert elapsed < 0.45
+
+    def test_sync_listing_deadline(self, stub_server, tmp_path):
+        """Test that a listing slower than the deadline fails the sync."""
+        stub_server.delay = 0.5
+        mirror = Mirror(tmp_path / "mirror.db")
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            with pytest.raises(DeadlineExceededError):
+                api.sync(mirror, timeout=0.1)
+        mirror.close()
+
+
+class TestAsyncPokeAPIDeadlines:
+    """Tests for the timeout argument of the AsyncPokeAPI methods."""
+
+    def test_slow_call_exceeds_deadline(self, stub_server):
+        """Test that a stuck response fails at the deadline."""
+        pytest.importorskip("aiohttp")
+        from pokeapi_wrapper.async_api import AsyncPokeAPI
+
+        stub_server.delay = 0.5
+
+        async def main():
+            async with AsyncPokeAPI(base_url=stub_server.base_url) as api:
+                with pytest.raises(DeadlineExceededError):
+                    await api.get_pokemon(25, timeout=0.1)
+                return await api.get_pokemon_list(timeout=5)
+
+        assert len(asyncio.run(main()).results) == 2
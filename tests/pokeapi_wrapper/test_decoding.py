@@ -0,0 +1,54 @@
+"""
+Tests for the JSON decoding backends.
+"""
+
+import pytest
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.decoding import available_backends, get_decoder
+from pokeapi_wrapper.exceptions import InvalidParameterError, PokeAPIError
+
+
+@pytest.mark.parametrize("backend", available_backends())
+class TestDecoders:
+    """Tests shared by every installed decoding backend."""
+
+    def test_decodes_bytes(self, backend):
+        """Test that the decoder reads UTF-8 bytes directly."""
+        decode = get_decoder(backend)
+
+        assert decode('{"name": "flabébé", "id": 669}'.encode("utf-8")) == {
+            "name": "flabébé",
+            "id": 669,
+        }
+
+    def test_invalid_json_raises_value_error(self, backend):
+        """Test that every backend reports invalid JSON as ValueError."""
+        decode = get_decoder(backend)
+
+        with pytest.raises(ValueError):
+            decode(b"<html>Bad gateway</html>")
+
+    def test_client_uses_backend(self, backend, stub_server):
+        """Test that the client decodes responses with the backend."""
+        with PokeAPI(base_url=stub_server.base_url, json_backend=backend) as api:
+            assert api.get_pokemon("pikachu").id == 25
+
+
+class TestGetDecoder:
+    """Tests for picking a decoding backend."""
+
+    def test_default_prefers_fastest_installed(self):
+        """Test that the default decoder is the first installed backend."""
+        assert available_backends()[-1] == "json"
+        assert get_decoder() is not None
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(InvalidParameterError):
+            get_decoder("yaml")
+
+    def test_invalid_body_maps_to_api_error(self):
+        """Test that the client wraps decoding errors in PokeAPIError."""
+        with PokeAPI() as api:
+            with pytest.raises(PokeAPIError):
+                api._decode(b"not json")
@@ -0,0 +1,152 @@
+"""
+Tests for hedged requests.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.hedging import HedgePolicy, LatencyTracker
+
+
+def slow_first_request(server, delay):
+    """Make the next request to a stub server answer after a delay."""
+    respond = server.respond
+    lock = threading.Lock()
+    state = {"slowed": False}
+
+    def respond_slowly(path, query, headers):
+        with lock:
+            slow = not state["slowed"]
+            state["slowed"] = True
+        if slow:
+            time.sleep(delay)
+        return respond(path, query, headers)
+
+    server.respond = respond_slowly
+
+
+def warm_up(policy, latency=0.001, samples=20):
+    for _ in range(samples):
+        policy.record(latency)
+
+
+class TestLatencyTracker:
+    """Tests for the LatencyTracker class."""
+
+    def test_percentile(self):
+        """Test percentiles over the recorded latencies."""
+        tracker = LatencyTracker()
+        for latency in range(1, 101):
+            tracker.record(latency / 1000)
+
+        assert tracker.percentile(50) == 0.051
+        assert tracker.percentile(95) == 0.096
+        assert tracker.percentile(100) == 0.1
+
+    def test_ring_buffer(self):
+        """Test that only the most recent latencies are kept."""
+        tracker = LatencyTracker(size=10)
+        for latency in range(100):
+            tracker.record(latency)
+
+        assert len(tracker) == 10
+        assert tracker.percentile(0) == 90
+        assert LatencyTracker().percentile(95) is None
+
+
+class TestHedgePolicy:
+    """Tests for the HedgePolicy class."""
+
+    def test_no_hedging_until_warm(self):
+        """Test that hedging waits for enough latency samples."""
+        policy = HedgePolicy(min_samples=5, min_delay=0.001)
+        warm_up(policy, latency=0.01, samples=4)
+        assert policy.delay() is None
+
+        policy.record(0.01)
+
+        assert policy.delay() == 0.01
+
+
+class TestPokeAPIHedging:
+    """Tests for hedging in the PokeAPI client."""
+
+    def test_slow_request_is_hedged(self, stub_server):
+        """Test that a slow request is raced by a hedge."""
+        policy = HedgePolicy(min_delay=0.02)
+        warm_up(policy)
+
+        with PokeAPI(base_url=stub_server.base_url, hedge_policy=policy) as api:
+            slow_first_request(stub_server, 0.5)
+            start = time.monotonic()
+            pokemon = api.get_pokemon(25)
+            elapsed = time.monotonic() - start
+
+        assert pokemon.id == 25
+        assert elapsed < 0.3
+        assert stub_server.request_count == 2
+        assert policy.stats()["hedged_requests"] == 1
+        assert policy.stats()["hedges_won"] == 1
+
+    def test_fast_request_is_not_hedged(self, stub_server):
+        """Test that requests faster than the hedge delay are sent once."""
+        policy = HedgePolicy(min_delay=0.5)
+        warm_up(policy)
+
+        with PokeAPI(base_url=stub_server.base_url, hedge_policy=policy) as api:
+            api.get_pokemon(25)
+            api.get_pokemon(1)
+
+        assert stub_server.request_count == 2
+        assert policy.stats()["hedged_requests"] == 0
+        assert len(policy.latencies) == 22
+
+    def test_threads_share_one_hedge_pool(self, stub_server):
+        """Test that concurrent hedging creates one pool, shut down by close."""
+        api = PokeAPI(base_url=stub_server.base_url, hedge_policy=HedgePolicy())
+        barrier = threading.Barrier(8)
+        executors = []
+
+        def get_executor():
+            barrier.wait()
+            executors.append(api._get_hedge_executor())
+
+        threads = [threading.Thread(target=get_executor) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        api.close()
+
+        assert len({id(executor) for executor in executors}) == 1
+        assert executors[0]._shutdown and api._hedge_executor is None
+
+
+class TestAsyncPokeAPIHedging:
+    """Tests for hedging in the AsyncPokeAPI client."""
+
+    def test_slow_request_is_hedged(self, stub_server):
+        """Test that a slow request is raced by a hedge and cancelled."""
+        pytest.importorskip("aiohttp")
+        from pokeapi_wrapper.async_api import AsyncPokeAPI
+
+        policy = HedgePolicy(min_delay=0.02)
+        warm_up(policy)
+
+        async def main():
+            async with AsyncPokeAPI(
+                base_url=stub_server.base_url, hedge_policy=policy
+            ) as api:
+                slow_first_request(stub_server, 0.5)
+                start = time.monotonic()
+                pokemon = await api.get_pokemon(25)
+                return pokemon, time.monotonic() - start
+
+        pokemon, elapsed = asyncio.run(main())
+
+        assert pokemon.id == 25
+        assert elapsed < 0.3
+        assert policy.stats()["hedges_won"] == 1
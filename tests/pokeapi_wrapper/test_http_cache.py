@@ -0,0 +1,71 @@
+"""
+Tests for the persistent HTTP response cache.
+"""
+
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.http_cache import HTTPCache
+
+
+class TestHTTPCache:
+    """Tests for the HTTPCache class."""
+
+    def test_key_normalization(self):
+        """Test that equivalent URLs and params share a key."""
+        first = HTTPCache.key(
+            "https://PokeAPI.co/api/v2/pokemon/", {"offset": 0, "limit": 20}
+        )
+        second = HTTPCache.key(
+            "https://pokeapi.co/api/v2/pokemon", {"limit": 20, "offset": 0}
+        )
+
+        assert first == second
+        assert first == "https://pokeapi.co/api/v2/pokemon?limit=20&offset=0"
+
+    def test_size_based_eviction(self, tmp_path):
+        """Test that least recently used entries are evicted first."""
+        cache = HTTPCache(tmp_path / "cache.db", max_bytes=25)
+        cache.put("a", b"x" * 10)
+        cache.put("b", b"x" * 10)
+        cache.get("a")
+        cache.put("c", b"x" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] == 20
+
+
+class TestPokeAPIHTTPCache:
+    """Tests for the HTTP cache integration of the PokeAPI client."""
+
+    def test_survives_restart(self, stub_server, tmp_path):
+        """Test that a new client reads fresh responses from disk."""
+        path = tmp_path / "cache.db"
+        with PokeAPI(base_url=stub_server.base_url, http_cache=HTTPCache(path)) as api:
+            api.get_pokemon("pikachu")
+            api.get_pokemon_list(limit=5)
+
+        with PokeAPI(base_url=stub_server.base_url, http_cache=HTTPCache(path)) as api:
+            pokemon = api.get_pokemon("pikachu")
+            pokemon_list = api.get_pokemon_list(limit=5)
+            stats = api.cache_stats()
+
+        assert pokemon.id == 25
+        assert pokemon_list.count == 2
+        assert stub_server.request_count == 2
+        assert stats["disk"]["hits"] == 2
+        assert stats["memory"] is None
+
+    def test_stale_entries_are_revalidated(self, stub_server, tmp_path):
+        """Test that stale entries send conditional requests and reuse 304s."""
+        http_cache = HTTPCache(tmp_path / "cache.db", ttl=0)
+        with PokeAPI(base_url=stub_server.base_url, http_cache=http_cache) as api:
+            api.get_pokemon(25)
+            pokemon = api.get_pokemon(25)
+
+        assert pokemon.name == "pikachu"
+        assert stub_server.request_count == 2
+        headers = stub_server.requests[1][2]
+        assert headers["If-None-Match"].startswith('"')
+        assert headers["If-Modified-Since"] == stub_server.last_modified
+        assert http_cache.stats()["revalidations"] == 1
@@ -0,0 +1,75 @@
+"""
+Tests for the import cost of the PokéAPI wrapper.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.sprites import SpriteCache
+
+# Seconds `import pokeapi_wrapper.api` may take on top of importing requests
+IMPORT_BUDGET = 0.1
+
+# Modules that only specific features need and must load on demand
+DEFERRED_MODULES = ["ascii_magic", "PIL", "asyncio", "aiohttp", "sqlite3", "numpy"]
+
+MEASURE = """
+import json, sys, time
+start = time.perf_counter()
+import requests
+baseline = time.perf_counter() - start
+start = time.perf_counter()
+import pokeapi_wrapper.api
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "baseline": baseline,
+    "loaded": [name for name in %r if name in sys.modules],
+}))
+""" % (DEFERRED_MODULES,)
+
+
+def measure_import():
+    """Import the client in a fresh interpreter and report what it cost."""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=root)
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE],
+        capture_output=True,
+        check=True,
+        cwd=root,
+        env=env,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+class TestImportTime:
+    """Tests for the startup cost of importing the client."""
+
+    def test_import_within_budget(self):
+        """Test that importing the client stays within its time budget."""
+        # Best of three to keep a busy machine from failing the test
+        elapsed = min(measure_import()["elapsed"] for _ in range(3))
+
+        assert elapsed < IMPORT_BUDGET
+
+    def test_optional_modules_are_not_imported(self):
+        """Test that rendering and async support load only on demand."""
+        assert measure_import()["loaded"] == []
+
+
+class TestRenderExtra:
+    """Tests for running without the render extra."""
+
+    def test_rendering_without_ascii_magic(self, monkeypatch):
+        """Test that rendering explains how to install ascii_magic."""
+        monkeypatch.setitem(sys.modules, "ascii_magic", None)
+        pokemon = Pokemon(id=1, sprites={"front_default": "http://x/1.png"})
+
+        with pytest.raises(ImportError, match=r"\[render\]"):
+            pokemon.render_ascii_sprite(cache=SpriteCache())
@@ -0,0 +1,161 @@
+"""
+Tests for the secondary Pokemon indexes.
+"""
+
+import json
+
+import pytest
+from pokeapi_wrapper.exceptions import ParsingError
+from pokeapi_wrapper.indexes import PokemonIndex, intersection, union
+from pokeapi_wrapper.mirror import Mirror
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.snapshot import Snapshot, write_snapshot
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+
+@pytest.fixture
+def dex():
+    return [
+        Pokemon.from_json(make_pokemon_payload(pokemon_id, moves=10))
+        for pokemon_id in range(1, 121)
+    ]
+
+
+@pytest.fixture
+def index(dex):
+    return PokemonIndex(dex)
+
+
+def scan(dex, type=None, ability=None, move=None, version_group=None, method=None):
+    """Answer a query by scanning every Pokemon."""
+    found = []
+    for p in dex:
+        if type and type not in {t.type.name for t in p.types}:
+            continue
+        if ability and ability not in {a.ability.name for a in p.abilities}:
+            continue
+        details = [
+            (m.move.name, d.version_group.name, d.move_learn_method.name)
+            for m in p.moves
+            for d in m.version_group_details
+        ]
+        if not any(
+            (move is None or name == move)
+            and (version_group is None or group == version_group)
+            and (method is None or learned == method)
+            for name, group, learned in details
+        ):
+            continue
+        found.append(p.id)
+    return found
+
+
+def some_learnset(dex):
+    move = dex[0].moves[2]
+    detail = move.version_group_details[1]
+    return move.move.name, detail.version_group.name, detail.move_learn_method.name
+
+
+class TestPokemonIndex:
+    """Tests for PokemonIndex."""
+
+    def test_queries_match_a_scan(self, dex, index):
+        """Test that every kind of query agrees with a linear scan."""
+        move, group, method = some_learnset(dex)
+        ability = dex[0].abilities[0].ability.name
+
+        assert len(index) == 120 and 7 in index and 121 not in index
+        assert list(index.query(type="fire")) == scan(dex, type="fire")
+        assert list(index.query(ability=ability)) == scan(dex, ability=ability)
+        assert list(index.learners(move)) == scan(dex, move=move)
+        assert list(index.learners(move, group)) == scan(
+            dex, move=move, version_group=group
+        )
+        assert list(index.query(move=move, version_group=group, method=method)) == (
+            scan(dex, move=move, version_group=group, method=method)
+        )
+        assert list(index.query(version_group=group, type="water")) == scan(
+            dex, version_group=group, type="water"
+        )
+        assert list(index.query()) == list(range(1, 121))
+        assert list(index.query(ability="levitate")) == []
+
+    def test_any_of_several_names(self, dex, index):
+        """Test that a list of names matches any of them."""
+        expected = sorted(set(scan(dex, type="fire")) | set(scan(dex, type="ice")))
+
+        assert list(index.query(type=["fire", "ice"])) == expected
+        assert "fire" in index.names("type")
+
+    def test_set_operations(self):
+        """Test intersection and union of sorted arrays."""
+        odd = [1, 3, 5, 7]
+
+        assert list(intersection([1, 2, 3, 5], odd, [3, 5, 9])) == [3, 5]
+        assert list(union([4, 8], odd)) == [1, 3, 4, 5, 7, 8]
+        assert list(intersection()) == list(PokemonIndex().get("type", "x")) == []
+
+    def test_update_one_pokemon(self, dex, index):
+        """Test that an incremental update equals a rebuild."""
+        payload = make_pokemon_payload(5, moves=10)
+        payload["types"] = [payload["types"][0]]
+        payload["types"][0]["type"] = {
+            "name": "dragon",
+            "url": "https://pokeapi.co/api/v2/type/16/",
+        }
+        payload["moves"] = payload["moves"][:3]
+        changed = Pokemon.from_json(payload)
+        added = Pokemon.from_json(make_pokemon_payload(500, moves=10))
+
+        index.update(changed)
+        index.update(added)
+        index.remove(9)
+        rebuilt = PokemonIndex(
+            [p for p in dex if p.id not in (5, 9)] + [changed, added]
+        )
+
+        assert index._postings == rebuilt._postings
+        assert 5 in index.query(type="dragon") and 9 not in index
+
+    def test_save_and_load(self, dex, index, tmp_path):
+        """Test that a saved index loads back and still updates."""
+        path = tmp_path / "dex.idx"
+        index.save(path)
+
+        loaded = PokemonIndex.load(path)
+        loaded.remove(3)
+        index.remove(3)
+
+        assert loaded._postings == index._postings
+        move, group, method = some_learnset(dex)
+        assert list(loaded.learners(move, group, method)) == list(
+            index.learners(move, group, method)
+        )
+
+    def test_rejects_other_files(self, index, tmp_path):
+        """Test that files that are not indexes, or truncated, are rejected."""
+        path = tmp_path / "dex.idx"
+        path.write_bytes(b"not an index")
+        with pytest.raises(ParsingError):
+            PokemonIndex.load(path)
+
+        index.save(path)
+        path.write_bytes(path.read_bytes()[:-10])
+        with pytest.raises(ParsingError):
+            PokemonIndex.load(path)
+
+    def test_from_mirror_and_snapshot(self, index, tmp_path):
+        """Test building the same index from a mirror and a snapshot."""
+        mirror = Mirror(tmp_path / "mirror.db")
+        payloads = [make_pokemon_payload(i, moves=10) for i in range(1, 121)]
+        for payload in payloads:
+            body = json.dumps(payload).encode("utf-8")
+            mirror.put("pokemon", payload["id"], payload["name"], body)
+        write_snapshot([Pokemon.from_json(p) for p in payloads], tmp_path / "dex.snap")
+
+        with Snapshot(tmp_path / "dex.snap") as snapshot:
+            from_snapshot = PokemonIndex(snapshot)
+
+        assert PokemonIndex.from_mirror(mirror)._postings == index._postings
+        assert from_snapshot._postings == index._postings
+        mirror.close()
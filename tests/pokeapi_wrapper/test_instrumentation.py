@@ -0,0 +1,218 @@
+"""
+Tests for the client instrumentation hooks.
+"""
+
+import pytest
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.cache import ResourceCache
+from pokeapi_wrapper.exceptions import ResourceNotFoundError
+from pokeapi_wrapper.instrumentation import (
+    CompositeHooks,
+    Histogram,
+    Hooks,
+    MetricsCollector,
+    OpenTelemetryHooks,
+    endpoint_label,
+)
+from pokeapi_wrapper.retry import RetryPolicy
+
+
+class RecordingHooks(Hooks):
+    """Hooks keeping the name and arguments of every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattribute__(self, name):
+        if name.startswith("on_"):
+            return lambda *args: self.calls.append((name,) + args)
+        return super().__getattribute__(name)
+
+
+class FakeInstrument:
+    """Instrument of FakeMeter keeping the recorded values."""
+
+    def __init__(self):
+        self.values = []
+
+    def record(self, value, attributes=None):
+        self.values.append((value, attributes))
+
+    def add(self, value, attributes=None):
+        self.values.append((value, attributes))
+
+
+class FakeMeter:
+    """Object with the instrument factories of an OpenTelemetry Meter."""
+
+    def __init__(self):
+        self.instruments = {}
+
+    def create_histogram(self, name, unit="", description=""):
+        return self.instruments.setdefault(name, FakeInstrument())
+
+    def create_counter(self, name, unit="", description=""):
+        return self.instruments.setdefault(name, FakeInstrument())
+
+
+class TestHistogram:
+    """Tests for the Histogram class."""
+
+    def test_percentiles_are_interpolated(self):
+        """Test percentile estimates on evenly spread values."""
+        histogram = Histogram(bounds=[0.01 * n for n in range(1, 101)])
+        for n in range(1000):
+            histogram.observe(n / 1000)
+
+        assert histogram.percentile(50) == pytest.approx(0.5, abs=0.01)
+        assert histogram.percentile(95) == pytest.approx(0.95, abs=0.01)
+        assert histogram.percentile(100) == pytest.approx(0.999)
+        assert histogram.cumulative()[-1] == (float("inf"), 1000)
+
+    def test_empty_histogram(self):
+        """Test that an empty histogram has no percentiles."""
+        assert Histogram().percentile(50) is None
+        assert Histogram().summary()["mean"] is None
+
+    def test_endpoint_label(self):
+        """Test that single resources share one label per type."""
+        assert endpoint_label("pokemon/25") == "pokemon/{id}"
+        assert endpoint_label("pokemon/pikachu") == "pokemon/{id}"
+        assert endpoint_label("pokemon") == "pokemon"
+
+
+class TestClientHooks:
+    """Tests for the hooks called by the PokeAPI client."""
+
+    def test_lifecycle_order(self, stub_server):
+        """Test the hooks called by a lookup and a JSON cache hit."""
+        hooks = RecordingHooks()
+        with PokeAPI(
+            base_url=stub_server.base_url, cache=ResourceCache(), hooks=hooks
+        ) as api:
+            api.get_pokemon("pikachu")
+            api.get_pokemon(25)
+
+        names = [call[0] for call in hooks.calls]
+        assert names == [
+            "on_cache_miss",
+            "on_request_start",
+            "on_request_end",
+            "on_decode",
+            "on_hydrate",
+            "on_cache_hit",
+            "on_hydrate",
+        ]
+        _, endpoint, status, seconds, wait, size = hooks.calls[2]
+        assert (endpoint, status) == ("pokemon/pikachu", 200)
+        assert 0 < wait <= seconds
+        assert size > 0
+        assert hooks.calls[3][1:] == ("pokemon/pikachu", hooks.calls[3][2], size)
+        assert hooks.calls[4][1] == "Pokemon"
+
+    def test_retries_and_failures_are_reported(self, stub_server):
+        """Test that retried and failed requests reach the collector."""
+        respond = stub_server.respond
+        calls = []
+
+        def flaky(path, query, headers):
+            calls.append(path)
+            if len(calls) == 1:
+                return 503, {}, b"{}"
+            return respond(path, query, headers)
+
+        stub_server.respond = flaky
+        metrics = MetricsCollector()
+        policy = RetryPolicy(backoff_base=0.001)
+        with PokeAPI(
+            base_url=stub_server.base_url, retry_policy=policy, hooks=metrics
+        ) as api:
+            api.get_pokemon("pikachu")
+            with pytest.raises(ResourceNotFoundError):
+                api.get_pokemon("missingno")
+
+        endpoint = metrics.snapshot()["endpoints"]["pokemon/{id}"]
+        assert endpoint["requests"] == 3
+        assert endpoint["statuses"] == {503: 1, 200: 1, 404: 1}
+        assert endpoint["retries"] == 1
+        assert endpoint["decode"]["count"] == 1
+
+    def test_list_of_hooks(self, stub_server):
+        """Test that a list of hooks is called in order."""
+        first, second = RecordingHooks(), RecordingHooks()
+        with PokeAPI(base_url=stub_server.base_url, hooks=[first, second]) as api:
+            assert isinstance(api.hooks, CompositeHooks)
+            api.get_pokemon_list(limit=2)
+
+        assert first.calls and first.calls == second.calls
+
+
+class TestMetricsCollector:
+    """Tests for the MetricsCollector class."""
+
+    @pytest.fixture
+    def metrics(self, stub_server):
+        metrics = MetricsCollector()
+        with PokeAPI(
+            base_url=stub_server.base_url, cache=ResourceCache(), hooks=metrics
+        ) as api:
+            for _ in range(3):
+                api.get_pokemon_many(["pikachu", "bulbasaur"])
+            api.get_pokemon_list(limit=2)
+        return metrics
+
+    def test_snapshot(self, metrics):
+        """Test the per-endpoint, per-model and per-layer summaries."""
+        snapshot = metrics.snapshot()
+
+        assert set(snapshot["endpoints"]) == {"pokemon/{id}", "pokemon"}
+        pokemon = snapshot["endpoints"]["pokemon/{id}"]
+        assert pokemon["requests"] == 2
+        assert pokemon["bytes"] > 0
+        assert pokemon["latency"]["p50"] <= pokemon["latency"]["max"]
+        assert snapshot["hydrate"]["Pokemon"]["count"] == 6
+        assert snapshot["cache"]["memory"] == {"hits": 4, "misses": 2}
+        assert metrics.percentile("pokemon/25", 95) > 0
+        assert metrics.percentile("berry/1", 95) is None
+
+    def test_render_prometheus(self, metrics):
+        """Test the Prometheus text exposition."""
+        text = metrics.render_prometheus()
+
+        assert "# TYPE pokeapi_request_duration_seconds histogram" in text
+        assert (
+            'pokeapi_request_duration_seconds_count{endpoint="pokemon/{id}"} 2' in text
+        )
+        assert (
+            'pokeapi_request_duration_seconds_bucket{endpoint="pokemon",le="+Inf"} 1'
+            in text
+        )
+        assert 'pokeapi_responses_total{endpoint="pokemon",status="200"} 1' in text
+        assert 'pokeapi_cache_lookups_total{layer="memory",result="hit"} 4' in text
+
+    def test_reset(self, metrics):
+        """Test that reset drops everything collected."""
+        metrics.reset()
+
+        assert metrics.snapshot() == {"endpoints": {}, "hydrate": {}, "cache": {}}
+
+
+class TestOpenTelemetryHooks:
+    """Tests for the OpenTelemetryHooks adapter."""
+
+    def test_records_into_instruments(self, stub_server):
+        """Test that lookups are recorded with their attributes."""
+        meter = FakeMeter()
+        with PokeAPI(
+            base_url=stub_server.base_url, hooks=OpenTelemetryHooks(meter)
+        ) as api:
+            api.get_pokemon("pikachu")
+
+        instruments = meter.instruments
+        ((seconds, attributes),) = instruments["pokeapi.request.duration"].values
+        assert seconds > 0
+        assert attributes == {"endpoint": "pokemon/{id}", "status": 200}
+        assert len(instruments["pokeapi.decode.duration"].values) == 1
+        assert instruments["pokeapi.hydrate.duration"].values[0][1] == {
+            "model": "Pokemon"
+        }
@@ -0,0 +1,175 @@
+"""
+Tests for the offline mirror and its incremental sync.
+"""
+
+import pytest
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.cli import main
+from pokeapi_wrapper.exceptions import InvalidParameterError, ResourceNotFoundError
+from pokeapi_wrapper.http_cache import HTTPCache
+from pokeapi_wrapper.mirror import Mirror
+from pokeapi_wrapper.testing import StubServer, make_pokemon_payload
+
+
+@pytest.fixture
+def upstream():
+    """A stub server serving 30 Pokemon."""
+    with StubServer() as server:
+        for pokemon_id in range(1, 31):
+            server.add_pokemon(make_pokemon_payload(pokemon_id, moves=3))
+        yield server
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = Mirror(tmp_path / "mirror.db")
+    yield mirror
+    mirror.close()
+
+
+def sync(server, mirror, **kwargs):
+    server.reset_counters()
+    with PokeAPI(base_url=server.base_url) as api:
+        return api.sync(mirror, page_size=10, **kwargs)
+
+
+class TestSync:
+    """Tests for PokeAPI.sync."""
+
+    def test_first_sync_fetches_everything(self, upstream, mirror):
+        """Test that an empty mirror gets every resource."""
+        stats = sync(upstream, mirror)
+
+        assert stats["count"] == 30
+        assert stats["fetched"] == 30
+        assert mirror.stats()["resources"] == {"pokemon": 30}
+        assert mirror.count("pokemon") == 30
+        # One count page, three list pages, thirty resources
+        assert upstream.request_count == 34
+
+    def test_unchanged_sync_only_reads_the_count(self, upstream, mirror):
+        """Test that a fresh, complete mirror costs a single request."""
+        sync(upstream, mirror)
+
+        stats = sync(upstream, mirror)
+
+        assert stats["skipped"] == 30 and stats["fetched"] == 0
+        assert upstream.request_count == 1
+
+    def test_new_resources_are_fetched(self, upstream, mirror):
+        """Test that a changed count walks the listing and fetches the new."""
+        sync(upstream, mirror)
+        for pokemon_id in (31, 32):
+            upstream.add_pokemon(make_pokemon_payload(pokemon_id, moves=3))
+
+        stats = sync(upstream, mirror)
+
+        assert stats["fetched"] == 2 and stats["skipped"] == 30
+        fetched = [path for path, _, _ in upstream.requests if "/" in path]
+        assert sorted(fetched) == ["pokemon/31", "pokemon/32"]
+
+    def test_stale_resources_are_revalidated(self, upstream, mirror):
+        """Test that stale entries are revalidated, and changes stored."""
+        sync(upstream, mirror)
+        upstream.add_pokemon(make_pokemon_payload(7, "renamed", moves=3))
+        del upstream.resources["pokemon"][30]
+
+        stats = sync(upstream, mirror, max_age=0)
+
+        assert stats["updated"] == 1
+        assert stats["revalidated"] == 28
+        assert stats["removed"] == 1
+        assert b'"renamed"' in mirror.get("pokemon", 7)
+        assert mirror.get("pokemon", 30) is None
+        assert all(
+            "If-None-Match" in headers
+            for path, _, headers in upstream.requests
+            if "/" in path
+        )
+
+    def test_failures_keep_the_listing_walk(self, upstream, mirror):
+        """Test that a sync with failures is completed by the next one."""
+        respond = upstream.respond
+
+        def failing(path, query, headers):
+            if path == "pokemon/5":
+                return 500, {}, b"{}"
+            return respond(path, query, headers)
+
+        upstream.respond = failing
+        assert sync(upstream, mirror)["failed"] == 1
+        assert mirror.count("pokemon") is None
+
+        upstream.respond = respond
+        stats = sync(upstream, mirror)
+
+        assert stats["fetched"] == 1 and stats["failed"] == 0
+        assert mirror.count("pokemon") == 30
+
+    def test_disk_cache_does_not_hide_new_resources(self, upstream, mirror, tmp_path):
+        """Test that sync revalidates list pages held by the disk cache."""
+        cache = HTTPCache(tmp_path / "cache.db")
+        with PokeAPI(base_url=upstream.base_url, http_cache=cache) as api:
+            api.sync(mirror, page_size=10)
+            upstream.add_pokemon(make_pokemon_payload(31, moves=3))
+
+            stats = api.sync(mirror, page_size=10)
+
+        assert stats["count"] == 31
+        assert stats["fetched"] == 1 and stats["skipped"] == 30
+        assert mirror.get("pokemon", 31) is not None
+
+
+class TestOffline:
+    """Tests for a client answering from the mirror."""
+
+    @pytest.fixture
+    def synced(self, upstream, mirror):
+        sync(upstream, mirror)
+        upstream.reset_counters()
+        return mirror
+
+    def test_lookups_do_not_touch_the_network(self, upstream, synced):
+        """Test that an offline client answers from the mirror."""
+        with PokeAPI(base_url=upstream.base_url, mirror=synced, offline=True) as api:
+            by_name = api.get_pokemon("pokemon-12")
+            by_id = api.get_pokemon(12)
+            page = api.get_pokemon_list(limit=5, offset=25)
+            every = list(api.iter_pokemon(page_size=7))
+            with pytest.raises(ResourceNotFoundError):
+                api.get_pokemon(31)
+
+        assert by_name.id == by_id.id == 12
+        assert len(by_id.moves) == 3
+        assert page.count == 30 and page.previous is not None
+        assert [item["id"] for item in page.results] == [26, 27, 28, 29, 30]
+        assert [item["id"] for item in every] == list(range(1, 31))
+        assert upstream.request_count == 0
+
+    def test_online_client_falls_back_to_the_network(self, upstream, synced):
+        """Test that an online client only requests what is not mirrored."""
+        upstream.add_pokemon(make_pokemon_payload(31, moves=3))
+        with PokeAPI(base_url=upstream.base_url, mirror=synced) as api:
+            api.get_pokemon(3)
+            api.get_pokemon(31)
+
+        assert [path for path, _, _ in upstream.requests] == ["pokemon/31"]
+
+    def test_offline_needs_a_mirror(self):
+        """Test that offline mode without a mirror is rejected."""
+        with pytest.raises(InvalidParameterError):
+            PokeAPI(offline=True)
+
+
+class TestSyncCommand:
+    """Tests for the sync command line."""
+
+    def test_sync_command(self, upstream, tmp_path, capsys):
+        """Test that the command mirrors the resources and reports them."""
+        path = str(tmp_path / "cli.db")
+
+        status = main(["sync", path, "--base-url", upstream.base_url])
+
+        assert status == 0
+        assert "pokemon: 30 upstream, 30 new" in capsys.readouterr().out
+        assert Mirror(path).stats()["resources"] == {"pokemon": 30}
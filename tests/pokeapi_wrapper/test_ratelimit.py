@@ -0,0 +1,151 @@
+"""
+Tests for client-side rate limiting.
+"""
+
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.exceptions import DeadlineExceededError, RateLimitError
+from pokeapi_wrapper.ratelimit import RateLimiter, parse_retry_after
+
+
+class TestParseRetryAfter:
+    """Tests for parsing Retry-After headers."""
+
+    def test_seconds(self):
+        """Test a delay given in seconds."""
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self):
+        """Test a delay given as an HTTP date."""
+        delay = parse_retry_after(formatdate(time.time() + 30, usegmt=True))
+
+        assert 25 < delay <= 30
+
+    def test_missing_or_malformed(self):
+        """Test that unusable values are ignored."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRateLimiter:
+    """Tests for the RateLimiter class."""
+
+    def test_limits_sustained_rate_across_threads(self):
+        """Test that threads sharing a limiter respect its rate."""
+        limiter = RateLimiter(rate=100, burst=1)
+        start = time.monotonic()
+
+        threads = [
+            threading.Thread(target=lambda: [limiter.acquire() for _ in range(5)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 20 requests at 100/s with a burst of 1 need at least 0.19s
+        assert time.monotonic() - start >= 0.18
+        stats = limiter.stats()
+        assert stats["requests"] == 20
+        assert stats["throttled_requests"] >= 19
+        assert stats["throttled_seconds"] > 0
+
+    def test_burst_is_not_throttled(self):
+        """Test that a full bucket serves a burst without waiting."""
+        limiter = RateLimiter(rate=1, burst=5)
+
+        assert all(limiter.acquire() == 0 for _ in range(5))
+        assert limiter.stats()["throttled_requests"] == 0
+
+    def test_adapts_to_rate_limiting(self):
+        """Test that 429s lower the rate and successes restore it."""
+        limiter = RateLimiter(rate=10, increase_step=2)
+        limiter.on_rate_limited()
+        limiter.on_rate_limited()
+
+        assert limiter.rate == 2.5
+        for _ in range(10):
+            limiter.on_success()
+        assert limiter.rate == 10
+
+    def test_retry_after_pauses_requests(self):
+        """Test that Retry-After blocks the next acquisition."""
+        limiter = RateLimiter(rate=1000, adaptive=False)
+        limiter.on_rate_limited(retry_after=0.1)
+
+        assert limiter.acquire() >= 0.09
+        assert limiter.rate == 1000
+
+    def test_wait_beyond_timeout_fails_at_once(self):
+        """Test that a wait longer than the timeout gives its token back."""
+        limiter = RateLimiter(rate=0.5, burst=1)
+        limiter.acquire()
+        start = time.monotonic()
+
+        with pytest.raises(DeadlineExceededError):
+            limiter.acquire(timeout=0.2)
+
+        assert time.monotonic() - start < 0.1
+        assert limiter.stats()["requests"] == 1
+        # The refunded token leaves the next wait where it was
+        assert limiter._reserve(None) == pytest.approx(2.0, abs=0.1)
+
+
+class TestPokeAPIRateLimitDeadline:
+    """Tests for rate limiter waits under a call's deadline."""
+
+    def test_rate_limit_wait_draws_from_the_deadline(self, stub_server):
+        """Test that a call does not sleep past its deadline."""
+        limiter = RateLimiter(rate=0.5, burst=1)
+        with PokeAPI(base_url=stub_server.base_url, rate_limiter=limiter) as api:
+            api.get_pokemon(25)
+            start = time.monotonic()
+            with pytest.raises(DeadlineExceededError):
+                api.get_pokemon(1, timeout=0.2)
+
+        assert time.monotonic() - start < 0.2
+        assert stub_server.request_count == 1
+
+
+class TestPokeAPIRateLimiting:
+    """Tests for 429 handling in the PokeAPI client."""
+
+    @pytest.fixture
+    def limited_server(self, stub_server):
+        respond = stub_server.respond
+        calls = []
+
+        def limited(path, query, headers):
+            calls.append(path)
+            if len(calls) == 1:
+                return 429, {"Retry-After": "0.05"}, b"{}"
+            return respond(path, query, headers)
+
+        stub_server.respond = limited
+        return stub_server
+
+    def test_429_maps_to_rate_limit_error(self, limited_server):
+        """Test that a 429 raises RateLimitError with its Retry-After."""
+        limiter = RateLimiter(rate=50)
+        with PokeAPI(base_url=limited_server.base_url, rate_limiter=limiter) as api:
+            with pytest.raises(RateLimitError) as error:
+                api.get_pokemon("pikachu")
+            pokemon = api.get_pokemon("pikachu")
+
+        assert error.value.retry_after == 0.05
+        assert pokemon.id == 25
+        stats = limiter.stats()
+        assert stats["rate_limited_responses"] == 1
+        assert stats["throttled_seconds"] >= 0.04
+        assert stats["rate"] < 50
+
+    def test_429_without_limiter(self, limited_server):
+        """Test that a 429 maps to RateLimitError even without a limiter."""
+        with PokeAPI(base_url=limited_server.base_url) as api:
+            with pytest.raises(RateLimitError):
+                api.get_pokemon(25)
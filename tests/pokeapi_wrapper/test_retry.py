@@ -0,0 +1,216 @@
+"""
+Tests for retries and circuit breaking.
+"""
+
+import asyncio
+import time
+
+import pytest
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.exceptions import (
+    CircuitOpenError,
+    NetworkError,
+    PokeAPIError,
+    RateLimitError,
+    ResourceNotFoundError,
+)
+from pokeapi_wrapper.retry import CircuitBreaker, RetryPolicy
+
+
+def make_flaky(server, failures, status=None):
+    """
+    Make the first requests to a stub server fail
+
+    Args:
+        server: StubServer to patch
+        failures: Number of requests that fail
+        status: HTTP status to answer with, or None to drop the connection
+    """
+    respond = server.respond
+    calls = []
+
+    def flaky(path, query, headers):
+        calls.append(path)
+        if len(calls) <= failures:
+            return status, {}, None if status is None else b"{}"
+        return respond(path, query, headers)
+
+    server.respond = flaky
+
+
+class TestRetryPolicy:
+    """Tests for the RetryPolicy class."""
+
+    def test_backoff_grows_and_is_capped(self):
+        """Test the exponential backoff ceiling."""
+        policy = RetryPolicy(backoff_base=0.1, backoff_max=0.3, jitter=False)
+
+        assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [0.1, 0.2, 0.3, 0.3]
+
+    def test_jitter_stays_below_ceiling(self):
+        """Test that jittered backoffs stay within the ceiling."""
+        policy = RetryPolicy(backoff_base=0.1)
+
+        delays = [policy.backoff(3) for _ in range(100)]
+
+        assert all(0 <= delay <= 0.4 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_attempts_and_deadline(self):
+        """Test that retrying stops at max_attempts or the deadline."""
+        policy = RetryPolicy(max_attempts=3, deadline=1.0, jitter=False)
+
+        assert policy.next_delay(1, 0.0) == 0.1
+        assert policy.next_delay(3, 0.0) is None
+        assert policy.next_delay(1, 0.95) is None
+        assert policy.next_delay(1, 0.0, retry_after=2.0) is None
+
+    def test_only_idempotent_methods_are_retried(self):
+        """Test which requests are considered retryable."""
+        policy = RetryPolicy()
+
+        assert policy.is_retryable("GET", NetworkError("reset"))
+        assert not policy.is_retryable("POST", NetworkError("reset"))
+        assert not policy.is_retryable("GET", CircuitOpenError("open"))
+        assert not policy.is_retryable("GET", ResourceNotFoundError("gone"))
+        assert policy.is_retryable("GET", RateLimitError("slow down"))
+
+
+class TestCircuitBreaker:
+    """Tests for the CircuitBreaker class."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that only consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure("a")
+        breaker.record_success("a")
+        breaker.record_failure("a")
+        assert breaker.state("a") == "closed"
+
+        breaker.record_failure("a")
+
+        assert breaker.state("a") == "open"
+        assert breaker.state("b") == "closed"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("a")
+        breaker.before_request("b")
+
+    def test_half_open_probe(self):
+        """Test that a single probe is let through after the timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure("a")
+        time.sleep(0.06)
+
+        assert breaker.state("a") == "half-open"
+        breaker.before_request("a")
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("a")
+        breaker.record_success("a")
+        assert breaker.state("a") == "closed"
+
+
+class TestPokeAPIRetries:
+    """Tests for retries in the PokeAPI client against a flaky server."""
+
+    def test_dropped_connection_is_retried(self, stub_server):
+        """Test that a dropped connection is retried transparently."""
+        make_flaky(stub_server, failures=2)
+        policy = RetryPolicy(max_attempts=3, backoff_base=0.01)
+
+        with PokeAPI(base_url=stub_server.base_url, retry_policy=policy) as api:
+            pokemon = api.get_pokemon("pikachu")
+
+        assert pokemon.id == 25
+        assert stub_server.request_count == 3
+
+    def test_server_errors_are_retried(self, stub_server):
+        """Test that 503 responses are retried."""
+        make_flaky(stub_server, failures=1, status=503)
+        policy = RetryPolicy(backoff_base=0.01)
+
+        with PokeAPI(base_url=stub_server.base_url, retry_policy=policy) as api:
+            assert api.get_pokemon(25).name == "pikachu"
+
+    def test_gives_up_after_max_attempts(self, stub_server):
+        """Test that the last error is raised once attempts run out."""
+        make_flaky(stub_server, failures=5)
+        policy = RetryPolicy(max_attempts=2, backoff_base=0.01)
+
+        with PokeAPI(base_url=stub_server.base_url, retry_policy=policy) as api:
+            with pytest.raises(NetworkError):
+                api.get_pokemon(25)
+
+        assert stub_server.request_count == 2
+
+    def test_no_retry_without_policy(self, stub_server):
+        """Test that connection failures map to NetworkError."""
+        make_flaky(stub_server, failures=1)
+
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            with pytest.raises(NetworkError):
+                api.get_pokemon(25)
+            assert api.get_pokemon(25).id == 25
+
+    def test_client_errors_are_not_retried(self, stub_server):
+        """Test that a 404 fails at once."""
+        policy = RetryPolicy(backoff_base=0.01)
+
+        with PokeAPI(base_url=stub_server.base_url, retry_policy=policy) as api:
+            with pytest.raises(ResourceNotFoundError):
+                api.get_pokemon("missingno")
+
+        assert stub_server.request_count == 1
+
+    def test_deadline_bounds_slow_failures(self, stub_server):
+        """Test that the deadline stops retries of slow failures."""
+        make_flaky(stub_server, failures=10, status=503)
+        stub_server.delay = 0.05
+        policy = RetryPolicy(max_attempts=10, backoff_base=0.01, deadline=0.12)
+
+        start = time.monotonic()
+        with PokeAPI(base_url=stub_server.base_url, retry_policy=policy) as api:
+            with pytest.raises(PokeAPIError):
+                api.get_pokemon(25)
+
+        assert time.monotonic() - start < 0.5
+        assert stub_server.request_count < 10
+
+    def test_circuit_breaker_fails_fast(self, stub_server):
+        """Test that an open circuit stops requests reaching the server."""
+        make_flaky(stub_server, failures=3, status=502)
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.1)
+
+        with PokeAPI(base_url=stub_server.base_url, circuit_breaker=breaker) as api:
+            for _ in range(3):
+                with pytest.raises(PokeAPIError):
+                    api.get_pokemon(25)
+            with pytest.raises(CircuitOpenError):
+                api.get_pokemon(25)
+            assert stub_server.request_count == 3
+
+            time.sleep(0.11)
+            assert api.get_pokemon(25).id == 25
+
+        host = stub_server.base_url.split("/")[2]
+        assert breaker.state(host) == "closed"
+
+
+class TestAsyncPokeAPIRetries:
+    """Tests for retries in the AsyncPokeAPI client."""
+
+    def test_dropped_connection_is_retried(self, stub_server):
+        """Test that a dropped connection is retried transparently."""
+        pytest.importorskip("aiohttp")
+        from pokeapi_wrapper.async_api import AsyncPokeAPI
+
+        make_flaky(stub_server, failures=1)
+        policy = RetryPolicy(backoff_base=0.01)
+
+        async def main():
+            async with AsyncPokeAPI(
+                base_url=stub_server.base_url, retry_policy=policy
+            ) as api:
+                return await api.get_pokemon("pikachu")
+
+        assert asyncio.run(main()).id == 25
+        assert stub_server.request_count == 2
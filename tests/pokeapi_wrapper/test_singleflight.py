@@ -0,0 +1,122 @@
+"""
+Tests for request coalescing.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.cache import ResourceCache
+from pokeapi_wrapper.exceptions import ResourceNotFoundError
+from pokeapi_wrapper.singleflight import SingleFlight
+
+
+def run_concurrently(function, count):
+    """Call function from count threads released at the same time."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(index):
+        barrier.wait()
+        try:
+            results[index] = function()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight:
+    """Tests for the SingleFlight class."""
+
+    def test_shares_result(self):
+        """Test that concurrent callers share one call and its result."""
+        flights = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.1)
+            return object()
+
+        results = run_concurrently(lambda: flights.do("key", slow), 10)
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_shares_exceptions(self):
+        """Test that waiters receive the exception of the shared call."""
+        flights = SingleFlight()
+
+        def fail():
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        results = run_concurrently(lambda: flights.do("key", fail), 10)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len({id(result) for result in results}) == 1
+
+    def test_runs_again_after_completion(self):
+        """Test that a finished call is not reused by later callers."""
+        flights = SingleFlight()
+        calls = []
+
+        flights.do("key", calls.append, 1)
+        flights.do("key", calls.append, 2)
+
+        assert calls == [1, 2]
+
+
+class TestPokeAPICoalescing:
+    """Tests for request coalescing in the PokeAPI clients."""
+
+    def test_concurrent_identical_requests(self, stub_server):
+        """Test that 100 concurrent identical lookups send one request."""
+        stub_server.delay = 0.2
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            results = run_concurrently(lambda: api.get_pokemon("pikachu"), 100)
+
+        assert all(pokemon.id == 25 for pokemon in results)
+        assert stub_server.request_count == 1
+
+    def test_concurrent_failures_are_shared(self, stub_server):
+        """Test that every waiter receives the exception of the request."""
+        stub_server.delay = 0.2
+        with PokeAPI(base_url=stub_server.base_url) as api:
+            results = run_concurrently(lambda: api.get_pokemon("missingno"), 20)
+
+        assert all(isinstance(result, ResourceNotFoundError) for result in results)
+        assert stub_server.request_count == 1
+
+    def test_projection_beside_full_lookup_with_model_store(self, stub_server):
+        """Test that a projection never joins the flight of a model lookup."""
+        stub_server.delay = 0.3
+        cache = ResourceCache(store="model")
+        with PokeAPI(base_url=stub_server.base_url, cache=cache) as api:
+            lookups = iter(
+                [
+                    lambda: api.get_pokemon(25),
+                    lambda: api.get_pokemon(25, fields=["types"]),
+                ]
+            )
+            lock = threading.Lock()
+
+            def lookup():
+                with lock:
+                    function = next(lookups)
+                return function()
+
+            results = run_concurrently(lookup, 2)
+
+        assert not any(isinstance(result, Exception) for result in results), results
+        assert all(pokemon.id == 25 for pokemon in results)
+        projected = next(pokemon for pokemon in results if not pokemon.abilities)
+        assert projected.types
@@ -0,0 +1,107 @@
+"""
+Tests for the binary dex snapshots.
+"""
+
+import pytest
+from pokeapi_wrapper.exceptions import ParsingError, ResourceNotFoundError
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.snapshot import Snapshot, write_snapshot
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+
+@pytest.fixture
+def dex():
+    payloads = [
+        make_pokemon_payload(pokemon_id, moves=4) for pokemon_id in range(1, 61)
+    ]
+    payloads[4]["name"] = "é-mon"
+    payloads[7]["base_experience"] = None
+    payloads[7]["height"] = None
+    return [Pokemon.from_json(payload) for payload in reversed(payloads)]
+
+
+@pytest.fixture
+def snapshot(dex, tmp_path):
+    path = tmp_path / "dex.snap"
+    assert write_snapshot(dex, path) == 60
+    with Snapshot(path) as snapshot:
+        yield snapshot
+
+
+def summary(pokemon):
+    return (
+        pokemon.id,
+        pokemon.name,
+        pokemon.height,
+        pokemon.weight,
+        pokemon.base_experience,
+        pokemon.order,
+        pokemon.is_default,
+        pokemon.location_area_encounters,
+        pokemon.species,
+        [(s.stat, s.base_stat, s.effort) for s in pokemon.stats],
+        [(t.slot, t.type) for t in pokemon.types],
+        [(a.slot, a.is_hidden, a.ability) for a in pokemon.abilities],
+        list(pokemon.forms),
+        [
+            (
+                m.move,
+                [
+                    (d.move_learn_method, d.version_group, d.level_learned_at)
+                    for d in m.version_group_details
+                ],
+            )
+            for m in pokemon.moves
+        ],
+        pokemon.get_sprite_url(),
+        pokemon.get_sprite_url(shiny=True, back=True),
+    )
+
+
+class TestSnapshot:
+    """Tests for write_snapshot and the Snapshot reader."""
+
+    def test_views_match_the_models(self, dex, snapshot):
+        """Test that every view reads back what was written."""
+        views = list(snapshot)
+
+        assert len(snapshot) == 60
+        assert [view.id for view in views] == list(range(1, 61))
+        by_id = {pokemon.id: pokemon for pokemon in dex}
+        for view in views:
+            assert summary(view) == summary(by_id[view.id])
+
+    def test_lookup_by_id_and_name(self, snapshot):
+        """Test lookups by ID, digit string and name."""
+        assert snapshot.get(25).name == "pokemon-25"
+        assert snapshot.get("25").id == 25
+        assert snapshot.get(" Pokemon-42 ").id == 42
+        assert snapshot.get("é-mon").id == 5
+        assert "pokemon-60" in snapshot
+        assert 61 not in snapshot and "missingno" not in snapshot
+        with pytest.raises(ResourceNotFoundError):
+            snapshot.get(0)
+
+    def test_none_and_shared_references(self, snapshot):
+        """Test that missing scalars and shared references survive."""
+        eight = snapshot.get(8)
+
+        assert eight.height is None and eight.base_experience is None
+        assert eight.stats[0].stat is snapshot.get(9).stats[0].stat
+
+    def test_to_pokemon(self, dex, snapshot):
+        """Test building a standalone Pokemon from a view."""
+        pokemon = snapshot.get(12).to_pokemon()
+
+        assert isinstance(pokemon, Pokemon)
+        assert summary(pokemon) == summary(next(p for p in dex if p.id == 12))
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test that files that are not snapshots are rejected."""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a snapshot at all, but long enough" * 4)
+        with pytest.raises(ParsingError):
+            Snapshot(path)
+        path.write_bytes(b"")
+        with pytest.raises(ParsingError):
+            Snapshot(path)
@@ -0,0 +1,141 @@
+"""
+Tests for the sprite cache.
+"""
+
+import pytest
+
+pytest.importorskip("ascii_magic")
+pytest.importorskip("PIL")
+
+from pokeapi_wrapper.exceptions import ResourceNotFoundError
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.sprites import (
+    SpriteCache,
+    get_sprite_cache,
+    prefetch_sprites,
+    set_sprite_cache,
+)
+from pokeapi_wrapper.testing import (
+    StubServer,
+    make_pokemon_payload,
+    make_sprite_png,
+)
+
+
+@pytest.fixture
+def sprite_server():
+    """A stub server serving front sprites for Pokemon 1 to 10."""
+    with StubServer() as server:
+        for pokemon_id in range(1, 11):
+            server.add_file(f"sprites/{pokemon_id}.png", make_sprite_png(pokemon_id))
+        yield server
+
+
+@pytest.fixture
+def team(sprite_server):
+    """Pokemon 1 to 10 with sprite URLs pointing at the sprite server."""
+    root = sprite_server.root_url + "sprites"
+    return [
+        Pokemon(**make_pokemon_payload(pokemon_id, sprite_root=root))
+        for pokemon_id in range(1, 11)
+    ]
+
+
+class TestSpriteCache:
+    """Tests for the SpriteCache class."""
+
+    def test_render_is_memoized(self, sprite_server):
+        """Test that rendering twice downloads and decodes once."""
+        cache = SpriteCache()
+        url = sprite_server.root_url + "sprites/1.png"
+
+        first = cache.render(url, width=30)
+        second = cache.render(url, width=30)
+
+        assert first is second
+        assert sprite_server.request_count == 1
+        stats = cache.stats()
+        assert stats["downloads"] == 1
+        assert stats["render_hits"] == 1
+        assert stats["render_misses"] == 1
+
+    def test_render_key_includes_width_and_color(self, sprite_server):
+        """Test that width and color produce distinct renderings."""
+        cache = SpriteCache()
+        url = sprite_server.root_url + "sprites/1.png"
+
+        colored = cache.render(url, width=30, colored=True)
+        monochrome = cache.render(url, width=30, colored=False)
+        wider = cache.render(url, width=50, colored=False)
+
+        assert "\x1b[" in colored
+        assert "\x1b[" not in monochrome
+        assert len(wider.splitlines()[0]) > len(monochrome.splitlines()[0])
+        assert sprite_server.request_count == 1
+
+    def test_images_persist_on_disk(self, sprite_server, tmp_path):
+        """Test that a new cache reuses images downloaded by an earlier one."""
+        url = sprite_server.root_url + "sprites/2.png"
+        SpriteCache(tmp_path).render(url)
+
+        cache = SpriteCache(tmp_path)
+        cache.render(url)
+
+        assert sprite_server.request_count == 1
+        assert cache.stats()["disk_hits"] == 1
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_render_lru_is_bounded(self, sprite_server):
+        """Test that the oldest renderings are evicted."""
+        cache = SpriteCache(max_renders=2)
+        for width in (10, 20, 30):
+            cache.render(sprite_server.root_url + "sprites/1.png", width=width)
+
+        assert cache.stats()["renders"] == 2
+
+    def test_missing_sprite(self, sprite_server):
+        """Test that a missing sprite raises ResourceNotFoundError."""
+        with pytest.raises(ResourceNotFoundError):
+            SpriteCache().get_image(sprite_server.root_url + "sprites/404.png")
+
+    def test_prefetch(self, sprite_server, team):
+        """Test that prefetching downloads every distinct sprite once."""
+        cache = SpriteCache()
+
+        fetched = prefetch_sprites(team + team[:3], cache=cache)
+        for pokemon in team:
+            pokemon.render_ascii_sprite(cache=cache)
+
+        assert fetched == 10
+        assert sprite_server.request_count == 10
+        assert cache.stats()["downloads"] == 10
+
+
+class TestPokemonSprites:
+    """Tests for the sprite methods of the Pokemon model."""
+
+    @pytest.fixture(autouse=True)
+    def shared_cache(self):
+        cache = SpriteCache()
+        set_sprite_cache(cache)
+        yield cache
+        set_sprite_cache(None)
+
+    def test_get_ascii_sprite_prints_once(self, team, shared_cache, capsys):
+        """Test that get_ascii_sprite prints and returns the art."""
+        art = team[0].get_ascii_sprite(width=20, colored=False)
+
+        assert get_sprite_cache() is shared_cache
+        assert capsys.readouterr().out == art + "\n"
+
+    def test_show_pokemon_prints_sprite_once(self, team, capsys):
+        """Test that show_pokemon does not print the sprite twice."""
+        art = team[0].render_ascii_sprite(width=60)
+        team[0].show_pokemon()
+
+        assert capsys.readouterr().out.count(art) == 1
+
+    def test_unavailable_sprite(self, team):
+        """Test that a missing sprite renders as None."""
+        assert team[0].render_ascii_sprite(shiny=True) is None
+        assert Pokemon(id=1, name="bulbasaur").render_ascii_sprite() is None
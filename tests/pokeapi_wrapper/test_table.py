@@ -0,0 +1,129 @@
+"""
+Tests for the columnar Pokemon table.
+"""
+
+import json
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pokeapi_wrapper.exceptions import InvalidParameterError
+from pokeapi_wrapper.mirror import Mirror
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.table import PokemonTable
+from pokeapi_wrapper.testing import make_pokemon_payload
+
+
+@pytest.fixture
+def dex():
+    payloads = [
+        make_pokemon_payload(pokemon_id, moves=2) for pokemon_id in range(1, 151)
+    ]
+    payloads[9]["height"] = None
+    return [Pokemon.from_json(payload) for payload in payloads]
+
+
+@pytest.fixture
+def table(dex):
+    return PokemonTable(dex)
+
+
+def stat(pokemon, name):
+    return next(s.base_stat for s in pokemon.stats if s.stat.name == name)
+
+
+def bst(pokemon):
+    return sum(s.base_stat for s in pokemon.stats)
+
+
+def type_names(pokemon):
+    return {t.type.name for t in pokemon.types}
+
+
+class TestPokemonTable:
+    """Tests for PokemonTable."""
+
+    def test_columns_match_the_models(self, dex, table):
+        """Test that every column holds the models' values."""
+        assert len(table) == 150
+        assert table["id"].tolist() == [p.id for p in dex]
+        assert table["special_attack"].tolist() == [
+            stat(p, "special-attack") for p in dex
+        ]
+        assert table["bst"].tolist() == [bst(p) for p in dex]
+        assert np.isnan(table["height"][9]) and table["height"][10] == dex[10].height
+        assert set(table.types_of(3)) == type_names(dex[3])
+
+    def test_where(self, dex, table):
+        """Test filters on types and columns."""
+        fast_fire = table.where(type="fire", speed__gt=100)
+        expected = [
+            p.id for p in dex if "fire" in type_names(p) and stat(p, "speed") > 100
+        ]
+        dual = table.where(type=["fire", "water"])
+        either = table.where(type__in=["fire", "water"], id__le=50)
+
+        assert fast_fire["id"].tolist() == expected
+        assert all(set(row["types"]) == {"fire", "water"} for row in dual.rows())
+        assert either["id"].tolist() == [
+            p.id for p in dex[:50] if type_names(p) & {"fire", "water"}
+        ]
+        assert table.where(name="pokemon-7")["id"].tolist() == [7]
+        assert len(table.where(type="stellar")) == 0
+
+    def test_sort_and_top_k(self, dex, table):
+        """Test that top_k agrees with a full sort."""
+        expected = sorted(dex, key=lambda p: -bst(p))[:10]
+
+        top = table.top_k("bst", 10)
+
+        assert top["id"].tolist() == [p.id for p in expected]
+        assert table.sort("bst", descending=True)[:10]["id"].tolist() == (
+            top["id"].tolist()
+        )
+        assert np.isnan(table.sort("height")["height"][-1])
+        assert table.sort("name", descending=True)["name"][0] == "pokemon-99"
+        assert len(table.top_k("bst", 500)) == 150
+
+    def test_percentile(self, dex, table):
+        """Test percentiles, skipping missing values."""
+        speeds = [stat(p, "speed") for p in dex]
+
+        assert table.percentile("speed", 50) == np.percentile(speeds, 50)
+        assert table.percentile("height", [0, 100]).tolist() == [
+            min(p.height for p in dex if p.height is not None),
+            max(p.height for p in dex if p.height is not None),
+        ]
+        assert np.isnan(table.where(id=0).percentile("speed", 50))
+
+    def test_invalid_queries(self, table):
+        """Test that unknown columns and operators are rejected."""
+        with pytest.raises(InvalidParameterError):
+            table.where(shininess__gt=1)
+        with pytest.raises(InvalidParameterError):
+            table.where(speed__between=(1, 2))
+        with pytest.raises(InvalidParameterError):
+            table.top_k("name", 3)
+
+    def test_from_mirror(self, table, tmp_path):
+        """Test building a table from a mirror."""
+        mirror = Mirror(tmp_path / "mirror.db")
+        for pokemon_id in range(20, 0, -1):
+            payload = make_pokemon_payload(pokemon_id, moves=2)
+            body = json.dumps(payload).encode("utf-8")
+            mirror.put("pokemon", pokemon_id, payload["name"], body)
+
+        mirrored = PokemonTable.from_mirror(mirror)
+
+        assert mirrored["id"].tolist() == list(range(1, 21))
+        assert mirrored["bst"].tolist() == table["bst"][:20].tolist()
+        mirror.close()
+
+    def test_without_numpy(self, monkeypatch):
+        """Test that a missing NumPy explains how to install it."""
+        monkeypatch.setattr(sys.modules["pokeapi_wrapper.table"], "np", None)
+
+        with pytest.raises(ImportError, match=r"\[analytics\]"):
+            PokemonTable([])
@@ -0,0 +1,149 @@
+"""
+Tests for the type effectiveness chart.
+"""
+
+from itertools import combinations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pokeapi_wrapper.api import PokeAPI
+from pokeapi_wrapper.exceptions import InvalidParameterError
+from pokeapi_wrapper.models.pokemon import Pokemon
+from pokeapi_wrapper.models.type import Type
+from pokeapi_wrapper.testing import (
+    TYPE_NAMES,
+    StubServer,
+    make_pokemon_payload,
+    make_type_payload,
+)
+from pokeapi_wrapper.typechart import STANDARD_TYPES, TypeChart
+
+RELATIONS = {"no_damage_to": 0.0, "half_damage_to": 0.5, "double_damage_to": 2.0}
+
+
+@pytest.fixture
+def payloads():
+    payloads = [make_type_payload(type_id) for type_id in range(1, 19)]
+    # Real types never list a type under two relations
+    for payload in payloads:
+        relations = payload["damage_relations"]
+        doubled = relations["double_damage_to"]
+        relations["half_damage_to"] = [
+            ref for ref in relations["half_damage_to"] if ref not in doubled
+        ]
+    # Ghost does nothing to normal, as in the games
+    payloads[7]["damage_relations"]["no_damage_to"] = [
+        {"name": "normal", "url": "https://pokeapi.co/api/v2/type/1/"}
+    ]
+    return payloads
+
+
+@pytest.fixture
+def chart(payloads):
+    return TypeChart(Type.from_json(payload) for payload in payloads)
+
+
+@pytest.fixture
+def dex():
+    return [
+        Pokemon.from_json(make_pokemon_payload(pokemon_id, moves=0))
+        for pokemon_id in range(1, 101)
+    ]
+
+
+def expected_multiplier(payloads, attacking, defending):
+    """Compute a multiplier from the payloads with plain loops."""
+    result = 1.0
+    relations = payloads[TYPE_NAMES.index(attacking)]["damage_relations"]
+    for name in defending:
+        for field, multiplier in RELATIONS.items():
+            if any(ref["name"] == name for ref in relations[field]):
+                result *= multiplier
+    return result
+
+
+def defending_types(pokemon):
+    return [t.type.name for t in pokemon.types]
+
+
+class TestTypeChart:
+    """Tests for TypeChart."""
+
+    def test_matrix_follows_the_relations(self, payloads, chart):
+        """Test that every cell holds the attacking type's relation."""
+        assert chart.type_names == STANDARD_TYPES == tuple(TYPE_NAMES)
+        assert chart.matrix.shape == (18, 18)
+        for a, attacking in enumerate(TYPE_NAMES):
+            for d, defending in enumerate(TYPE_NAMES):
+                assert chart.matrix[a, d] == expected_multiplier(
+                    payloads, attacking, [defending]
+                )
+        assert chart.multiplier("ghost", "normal") == 0.0
+
+    def test_dual_types(self, payloads, chart, dex):
+        """Test that dual types multiply both relations."""
+        for pokemon in dex:
+            defending = defending_types(pokemon)
+            for attacking in TYPE_NAMES:
+                expected = expected_multiplier(payloads, attacking, defending)
+                assert chart.multiplier(attacking, pokemon) == expected
+                assert chart.multiplier(attacking, defending) == expected
+
+    def test_against_many(self, payloads, chart, dex):
+        """Test the batch query against a list of Pokemon."""
+        result = chart.against(dex)
+
+        assert result.shape == (18, 100)
+        for column, pokemon in enumerate(dex):
+            assert chart.matchups(pokemon) == dict(
+                zip(TYPE_NAMES, result[:, column].tolist())
+            )
+        assert chart.against([]).shape == (18, 0)
+        assert chart.coverage(["fire", "water"], dex).tolist() == (
+            result[[9, 10]].max(axis=0).tolist()
+        )
+
+    def test_best_coverage(self, chart, dex):
+        """Test that the best coverage matches a brute-force search."""
+        candidates = ["fire", "water", "grass", "ice", "ground", "rock", "dark"]
+        result = chart.against(dex)
+
+        def covered(names):
+            rows = [TYPE_NAMES.index(name) for name in names]
+            return int((result[rows] > 1).any(axis=0).sum())
+
+        expected = max(combinations(candidates, 3), key=covered)
+
+        names, count = chart.best_coverage(dex, size=3, candidates=candidates)
+
+        assert names == list(expected) and count == covered(expected)
+        assert chart.best_coverage(dex, size=6)[1] >= count
+
+    def test_invalid_queries(self, chart):
+        """Test that unknown types and bad sizes are rejected."""
+        with pytest.raises(InvalidParameterError):
+            chart.multiplier("sound", "normal")
+        with pytest.raises(InvalidParameterError):
+            chart.multiplier("fire", ["grass", "bug", "steel"])
+        with pytest.raises(InvalidParameterError):
+            chart.best_coverage(["normal"], size=3, candidates=["fire", "water"])
+
+
+class TestGetTypeChart:
+    """Tests for PokeAPI.get_type_chart."""
+
+    def test_fetches_the_types_once(self, payloads):
+        """Test that the chart is built from one fetch of each type."""
+        with StubServer() as server:
+            for payload in payloads:
+                server.add_resource("type", payload)
+            with PokeAPI(base_url=server.base_url) as api:
+                chart = api.get_type_chart()
+                again = api.get_type_chart()
+
+            assert server.request_count == 18
+
+        assert again is chart
+        assert chart.multiplier("ghost", "normal") == 0.0